@@ -0,0 +1,3 @@
+"""Gamemaster aid for Pathfinder 2nd Edition."""
+
+__version__ = '0.1.0'
@@ -4,22 +4,61 @@
 import locale
 # Third Party
 # Local
-from gamemaster_guidance.gg_arguments import parse_arguments
+from gamemaster_guidance.gg_ancestry import validate_name_routes
+from gamemaster_guidance.gg_arguments import (ARG_DICT_KEY_ATLAS, ARG_DICT_KEY_BUILD_PACK,
+                                              ARG_DICT_KEY_CITY, ARG_DICT_KEY_NO_CACHE,
+                                              ARG_DICT_KEY_PACK, ARG_DICT_KEY_RULES,
+                                              ARG_DICT_KEY_SEED, ARG_DICT_KEY_SIMULATE,
+                                              parse_arguments)
+from gamemaster_guidance.gg_atlas import load_atlas
+from gamemaster_guidance.gg_city_cache import load_city
+from gamemaster_guidance.gg_city_rules import load_city_rules
+from gamemaster_guidance.gg_city_sim import GGCitySimulation
+from gamemaster_guidance.gg_file_io import (compile_database_pack, load_database_pack,
+                                            load_databases)
 from gamemaster_guidance.gg_menu import menu
+from gamemaster_guidance.gg_rando import seed_rando
 from gamemaster_guidance.gg_yaml import parse_yaml
 
 
 def main():
     """Entry level function for this package."""
     # LOCAL VARIABLES
-    city_dict = None
+    city_obj = None
+    atlas = None
 
     locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
     parsed_args = parse_arguments()
-    if 'cityfile' in parsed_args:
-        city_dict = parse_yaml(parsed_args['cityfile'])
-    menu(city_dict)
+    if ARG_DICT_KEY_SEED in parsed_args:
+        seed_rando(parsed_args[ARG_DICT_KEY_SEED])
+    if ARG_DICT_KEY_BUILD_PACK in parsed_args:
+        num_packed = compile_database_pack(parsed_args[ARG_DICT_KEY_BUILD_PACK])
+        raise SystemExit(f'Packed {num_packed} databases into '
+                         f'{parsed_args[ARG_DICT_KEY_BUILD_PACK]}')
+    if ARG_DICT_KEY_RULES in parsed_args:
+        load_city_rules(parsed_args[ARG_DICT_KEY_RULES])  # Before any city is built
+    if ARG_DICT_KEY_SIMULATE in parsed_args:
+        if ARG_DICT_KEY_CITY not in parsed_args:
+            raise RuntimeError('Simulating cities requires a cityfile to use as the template')
+        GGCitySimulation(parse_yaml(parsed_args[ARG_DICT_KEY_CITY]),
+                         parsed_args[ARG_DICT_KEY_SIMULATE]).print_report()
+        return
+    if ARG_DICT_KEY_PACK in parsed_args:
+        load_database_pack(parsed_args[ARG_DICT_KEY_PACK])  # One mmap for every database
+    else:
+        load_databases()  # Parse every database once, up front
+    validate_name_routes()  # Catch missing name databases before a session, not during one
+    if ARG_DICT_KEY_CITY in parsed_args:
+        # Completed cities are cached so every session sees the same city
+        city_obj = load_city(parsed_args[ARG_DICT_KEY_CITY],
+                             use_cache=ARG_DICT_KEY_NO_CACHE not in parsed_args)
+    if ARG_DICT_KEY_ATLAS in parsed_args:
+        atlas = load_atlas(parsed_args[ARG_DICT_KEY_ATLAS],
+                           use_cache=ARG_DICT_KEY_NO_CACHE not in parsed_args)
+        if city_obj:
+            atlas.add(city_obj)
+    menu(city_obj=city_obj, atlas=atlas)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,402 @@
 """Defines the GGAncestry class."""
 
 # Standard
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import chain
+from typing import Dict, Final, List, Optional, Tuple
+import hashlib
 import os
-import random
 # Third Party
 # Local
-from gamemaster_guidance.gg_file_io import pick_entry
-from gamemaster_guidance.gg_globals import ANCESTRY_LIST, HUMAN_ETHNICITY_LIST
-from gamemaster_guidance.gg_rando import rand_percent
+from gamemaster_guidance.gg_file_io import get_database_dir, pick_entries, pick_entry
+from gamemaster_guidance.gg_globals import (ANCESTRY_LIST, GG_CITY_RACE_ELF, GG_CITY_RACE_HUMAN,
+                                            GG_CITY_RACE_MWANGI, GG_CITY_RACE_NIDALESE,
+                                            GG_CITY_RACE_TIAN, HUMAN_ETHNICITY_LIST)
+from gamemaster_guidance.gg_rando import (GGWeightedSampler, get_rando_engine, rand_choice,
+                                           rand_percent)
+from gamemaster_guidance.gg_records import GGAncestryRecord, freeze_notes
+
+
+# Name parts, as they appear in the database filenames
+NAME_PART_GIVEN: Final[str] = 'Given_Name'
+NAME_PART_SURNAME: Final[str] = 'Surname'
+GENDER_LIST: Final[List] = ["Male", "Female"]
+MWANGI_SUBGROUPS: Final[List] = ["Bekyar", "Bonuwat", "Mauxi", "Zenj"]
+# Human subgroups by ethnicity (ethnicities without subgroups aren't listed)
+HUMAN_SUBGROUPS: Final[Dict] = {GG_CITY_RACE_MWANGI: MWANGI_SUBGROUPS, GG_CITY_RACE_TIAN: ["Shu"]}
+# Subgroups that share another subgroup's name databases
+_SUBGROUP_NAME_SOURCES: Final[Dict] = {"Mauxi": "Bonuwat"}
+# Ancestries with a single, genderless given name database
+_GENDERLESS_GIVEN_NAMES: Final[tuple] = ('Gnome', 'Goblin')
+# Non-Human ancestries with a surname database
+_SURNAME_ANCESTRIES: Final[tuple] = ('Dwarf', 'Halfling')
+# Human ethnicities whose surnames come from their subgroup's database
+_SUBGROUP_SURNAME_ETHNICITIES: Final[tuple] = (GG_CITY_RACE_MWANGI, GG_CITY_RACE_TIAN)
+# Human ethnicities without surnames (or without name databases of their own)
+_NO_SURNAME_ETHNICITIES: Final[tuple] = ('Kellid', GG_CITY_RACE_NIDALESE)
+# Non-Human ancestries without surnames
+_NO_SURNAME_ANCESTRIES: Final[tuple] = ('Gnome', 'Goblin', 'Half-Orc', 'Kitsune', 'Tengu', 'Wayang')
+# Human surname formats by ethnicity: (format, number of surnames).  Default: ('{}', 1)
+_HUMAN_SURNAME_FORMATS: Final[Dict] = {'Garundi': ('from {}', 1),
+                                       'Keleshite': ('al-{} {} {} al-{}', 4),
+                                       'Kellid': ('', 0)}
+# Default number of times a colliding name is redrawn before it's issued as a duplicate
+NAME_MAX_RETRIES: Final[int] = 8
+# Collision rate at which an ancestry's name space is reported as nearly exhausted
+NAME_SPACE_WARNING_RATE: Final[float] = 0.5
+# Collision rate, within one round of at least _NAME_SATURATION_SAMPLE names, at which an
+# ancestry's collisions are issued as duplicates without waiting out their retries
+NAME_SPACE_SATURATED_RATE: Final[float] = 0.95
+_NAME_SATURATION_SAMPLE: Final[int] = 20
+# Minimum number of recently issued name digests held in a set before they're merged into a
+# GGNameRegistry's sorted array (the set may also grow to 1/8 of the array)
+_NAME_REGISTRY_MERGE_SIZE: Final[int] = 4096
+# Columns returned by GGAncestry.generate_many(), in GGAncestryRecord order
+ANCESTRY_COLUMNS: Final[tuple] = GGAncestryRecord._fields
+# Mixed heritage naming: {ancestry: {name part: ((weight, name source ancestry, note,
+# subgroup note), ...)}}.  A None name source means no name.  Notes are formatted with the
+# ethnicity and subgroup picked for a Human name source.
+MIXED_HERITAGE_NAMES: Final[Dict] = {
+    'Half-Elf': {
+        NAME_PART_GIVEN: (
+            (33, GG_CITY_RACE_HUMAN, 'Given name is {ethnicity} in origin',
+             'Non-Elven ancestor is from the {subgroup} subgroup'),
+            (33, 'Half-Elf', 'Half-Elf given name', None),
+            (34, GG_CITY_RACE_ELF, 'Given name is Elven in origin', None)),
+        NAME_PART_SURNAME: (
+            (33, GG_CITY_RACE_HUMAN, 'Surname is Human ({ethnicity}) in origin',
+             'Surname comes from the {subgroup} subgroup'),
+            (33, None, 'Character has forgotten, hidden, denied, or does not know their surname',
+             None),
+            (34, GG_CITY_RACE_ELF, 'Surname is of Elven orgin', None)),
+    },
+}
+# MIXED_HERITAGE_NAMES compiled into {(ancestry, name part): sampler of branches}
+_MIXED_HERITAGE_SAMPLERS: Final[Dict] = {
+    (ancestry, name_part): GGWeightedSampler(branches, [branch[0] for branch in branches])
+    for (ancestry, name_parts) in MIXED_HERITAGE_NAMES.items()
+    for (name_part, branches) in name_parts.items()}
+# Human ethnicities never randomly generated (see: User Story 8)
+_UNNAMED_HUMAN_ETHNICITIES: Final[frozenset] = frozenset([GG_CITY_RACE_NIDALESE])
+# Human ethnicities available to randomly generated names
+_NAMED_HUMAN_ETHNICITIES: Final[tuple] = tuple(ethnicity for ethnicity in HUMAN_ETHNICITY_LIST
+                                              if ethnicity not in _UNNAMED_HUMAN_ETHNICITIES)
+
+# (ancestry, ethnicity, subgroup, gender, name part) -> absolute database filename
+RouteKey = Tuple[str, Optional[str], Optional[str], Optional[str], str]
+
+
+def build_name_routes(db_dir=None):
+    """Returns the name routing table: every name source a GGAncestry can use mapped to its
+    database filename in db_dir (defaults to the database directory).
+    """
+    # LOCAL VARIABLES
+    local_dir = db_dir if db_dir else get_database_dir()
+    routes = {}
+
+    # NON-HUMAN ANCESTRIES
+    for ancestry in ANCESTRY_LIST:
+        if ancestry == GG_CITY_RACE_HUMAN:
+            continue
+        if ancestry in _GENDERLESS_GIVEN_NAMES:
+            routes[(ancestry, None, None, None, NAME_PART_GIVEN)] = \
+                f'Names-{ancestry}-{NAME_PART_GIVEN}.txt'
+        else:
+            for gender in GENDER_LIST:
+                routes[(ancestry, None, None, gender, NAME_PART_GIVEN)] = \
+                    f'Names-{ancestry}-{NAME_PART_GIVEN}-{gender}.txt'
+        if ancestry in _SURNAME_ANCESTRIES:
+            routes[(ancestry, None, None, None, NAME_PART_SURNAME)] = \
+                f'Names-{ancestry}-{NAME_PART_SURNAME}.txt'
+
+    # HUMAN ETHNICITIES
+    for ethnicity in HUMAN_ETHNICITY_LIST:
+        if ethnicity == GG_CITY_RACE_NIDALESE:
+            continue  # See: User Story 8
+        for subgroup in HUMAN_SUBGROUPS.get(ethnicity, [None]):
+            if subgroup:
+                source = f'{GG_CITY_RACE_HUMAN}-{ethnicity}-' \
+                         f'{_SUBGROUP_NAME_SOURCES.get(subgroup, subgroup)}'
+            else:
+                source = f'{GG_CITY_RACE_HUMAN}-{ethnicity}'
+            for gender in GENDER_LIST:
+                routes[(GG_CITY_RACE_HUMAN, ethnicity, subgroup, gender, NAME_PART_GIVEN)] = \
+                    f'Names-{source}-{NAME_PART_GIVEN}-{gender}.txt'
+            if ethnicity in _SUBGROUP_SURNAME_ETHNICITIES:
+                routes[(GG_CITY_RACE_HUMAN, ethnicity, subgroup, None, NAME_PART_SURNAME)] = \
+                    f'Names-{source}-{NAME_PART_SURNAME}.txt'
+        if ethnicity not in _NO_SURNAME_ETHNICITIES + _SUBGROUP_SURNAME_ETHNICITIES:
+            routes[(GG_CITY_RACE_HUMAN, ethnicity, None, None, NAME_PART_SURNAME)] = \
+                f'Names-{GG_CITY_RACE_HUMAN}-{ethnicity}-{NAME_PART_SURNAME}.txt'
+
+    # DONE
+    return {route_key: os.path.join(local_dir, db_name) for (route_key, db_name) in routes.items()}
+
+
+# The name routing table, built by get_name_routes() on first use so the database directory
+# is resolved then rather than at import
+NAME_ROUTES: Final[Dict[RouteKey, str]] = {}
+_NAME_ROUTE_DIR: Final[Dict[str, Optional[str]]] = {'db_dir': None}  # None: the default
+
+
+def get_name_routes():
+    """Returns NAME_ROUTES, building it for the chosen database directory on first use"""
+    if not NAME_ROUTES:
+        NAME_ROUTES.update(build_name_routes(_NAME_ROUTE_DIR['db_dir']))
+    return NAME_ROUTES
+
+
+def set_name_routes(db_dir=None):
+    """Route names to a different database directory (None for the default) from now on"""
+    _NAME_ROUTE_DIR['db_dir'] = db_dir
+    NAME_ROUTES.clear()  # Rebuilt on next use
+
+
+def validate_name_routes():
+    """Raise FileNotFoundError if any routed name database is missing"""
+    missing_list = sorted({db_filename for db_filename in get_name_routes().values()
+                           if not os.path.isfile(db_filename)})
+    if missing_list:
+        raise FileNotFoundError(f'Missing name databases: {", ".join(missing_list)}')
+
+
+def pick_name(ancestry, ethnicity, subgroup, gender, name_part, engine=None, excluded=None):
+    """Returns one name, not in excluded, from the database routed to by the arguments"""
+    # Only Humans have ethnicities and subgroups
+    if ancestry != GG_CITY_RACE_HUMAN:
+        ethnicity = None
+        subgroup = None
+    try:
+        db_filename = get_name_routes()[(ancestry, ethnicity, subgroup, gender, name_part)]
+    except KeyError as err:
+        raise RuntimeError(f'No {name_part} database for {ancestry} {ethnicity} {subgroup} '
+                           f'{gender}') from err
+    return pick_entry(db_filename, engine, excluded)
+
+
+def resolve_name_plan(name_plan, engine=None, excluded=None):
+    """Returns the name described by a (format, [route key, ...]) name plan.
+
+    No name in the excluded collection is used as part of the name.
+    """
+    (name_format, route_keys) = name_plan
+    return name_format.format(*[pick_name(*route_key, engine=engine, excluded=excluded)
+                                for route_key in route_keys])
+
+
+def _plan_given_name(ancestry, ethnicity, subgroup, gender):
+    """Returns the (format, route keys) name plan for a non-Half-Elf given name"""
+    if ancestry in _GENDERLESS_GIVEN_NAMES:
+        route_key = (ancestry, None, None, None, NAME_PART_GIVEN)
+    elif ancestry == GG_CITY_RACE_HUMAN:
+        route_key = (ancestry, ethnicity, subgroup, gender, NAME_PART_GIVEN)
+    else:
+        route_key = (ancestry, None, None, gender, NAME_PART_GIVEN)
+    return ('{}', [route_key])
+
+
+def _plan_human_surname(ethnicity, subgroup, shoanti_clan=None):
+    """Returns the (format, route keys) name plan for a Human surname"""
+    if ethnicity in _SUBGROUP_SURNAME_ETHNICITIES:
+        route_key = (GG_CITY_RACE_HUMAN, ethnicity, subgroup, None, NAME_PART_SURNAME)
+        if ethnicity == GG_CITY_RACE_MWANGI:
+            return ('from the {}', [route_key])
+        return ('{}', [route_key])
+    route_key = (GG_CITY_RACE_HUMAN, ethnicity, None, None, NAME_PART_SURNAME)
+    if ethnicity == 'Shoanti':
+        return ('{} of the ' + shoanti_clan, [route_key])
+    (name_format, num_surnames) = _HUMAN_SURNAME_FORMATS.get(ethnicity, ('{}', 1))
+    return (name_format, [route_key] * num_surnames)
+
+
+def _plan_surname(ancestry, ethnicity, subgroup, gender, engine):
+    """Returns the (format, route keys) name plan for a non-Half-Elf surname"""
+    if ancestry == 'Elf':
+        relationship = 'son' if gender == GENDER_LIST[0] else 'daughter'
+        return (relationship + ' of {}', [(ancestry, None, None, GENDER_LIST[0],
+                                           NAME_PART_GIVEN)])
+    if ancestry in _NO_SURNAME_ANCESTRIES:
+        return ('', [])
+    if ancestry == GG_CITY_RACE_HUMAN:
+        return _plan_human_surname(ethnicity, subgroup,
+                                   engine.choice(GGAncestry.shoantiClans)
+                                   if ethnicity == 'Shoanti' else None)
+    if ancestry == 'Dwarf':
+        return ('of {}', [(ancestry, None, None, None, NAME_PART_SURNAME)])
+    return ('{}', [(ancestry, None, None, None, NAME_PART_SURNAME)])
+
+
+def _rando_human_subgroup(ethnicity, engine):
+    """Returns a random subgroup for a Human ethnicity, if applicable"""
+    subgroups = HUMAN_SUBGROUPS.get(ethnicity)
+    return engine.choice(subgroups) if subgroups else None
+
+
+def plan_mixed_heritage_name(ancestry, name_part, gender, engine):
+    """Returns the name plan and list of notes for one part of a mixed heritage name.
+
+    Evaluates the ancestry's MIXED_HERITAGE_NAMES branches without touching any GGAncestry, so
+    it's safe to call in batches and from multiple threads.
+    """
+    # LOCAL VARIABLES
+    (_, name_source, note, subgroup_note) = \
+        _MIXED_HERITAGE_SAMPLERS[(ancestry, name_part)].sample(engine=engine)
+    ethnicity = None
+    subgroup = None
+
+    # NAME SOURCE
+    if name_source == GG_CITY_RACE_HUMAN:
+        ethnicity = engine.choice(_NAMED_HUMAN_ETHNICITIES)
+        subgroup = _rando_human_subgroup(ethnicity, engine)
+    if not name_source:
+        name_plan = ('', [])
+    elif name_part == NAME_PART_GIVEN:
+        name_plan = _plan_given_name(name_source, ethnicity, subgroup, gender)
+    else:
+        name_plan = _plan_surname(name_source, ethnicity, subgroup, gender, engine)
+
+    # NOTES
+    notes = [note.format(ethnicity=ethnicity, subgroup=subgroup)]
+    if subgroup and subgroup_note:
+        notes.append(subgroup_note.format(ethnicity=ethnicity, subgroup=subgroup))
+
+    # DONE
+    return (name_plan, notes)
+
+
+def _collapse_notes(notes):
+    """Returns a list of notes the way GGAncestry stores them: None, one str, or a list"""
+    if not notes:
+        return None
+    if len(notes) == 1:
+        return notes[0]
+    return notes
+
+
+def _format_full_name(given_name, surname, subgroup):
+    """Returns a full name in the order the subgroup uses"""
+    # Tian-Shu list their surname in front of their birth name.
+    if subgroup == "Shu":
+        return f'{surname} {given_name}'
+    return f'{given_name} {surname}'
+
+
+class GGNameRegistry:
+    """Tracks the full names issued by batch generation so GGAncestry can keep them unique.
+
+    Names are stored as 64-bit digests in a sorted array('Q'), 8 bytes a name, searched by
+    bisection.  Recent digests wait in a small set until there are enough to merge.  A name
+    that collides with an issued name is redrawn up to max_retries times and then issued
+    anyway as a duplicate.  Since the chance a fresh name collides is about the fraction of its
+    name space already issued, each ancestry's collision rate doubles as an estimate of how
+    full its name space is.  Ancestries whose names all but stop being unique give up early.
+    """
+
+    def __init__(self, max_retries=NAME_MAX_RETRIES):
+        """Class constructor"""
+        if max_retries < 0:
+            raise RuntimeError(f"Invalid number of retries: {max_retries}")
+        self.max_retries = max_retries
+        self._issued = array('Q')  # Sorted digests of the issued full names, once merged
+        self._recent = set()  # Digests issued since the last merge
+        self._stats = defaultdict(lambda: [0, 0, 0])  # {ancestry: [issued, collisions, dupes]}
+
+    def __len__(self):
+        """Number of distinct full names issued"""
+        return len(self._issued) + len(self._recent)
+
+    def __contains__(self, full_name):
+        """Has full_name been issued?"""
+        return self._is_issued(self._digest(full_name))
+
+    def claim(self, full_names, ancestries, records):
+        """Issue every unique name in records and return the list of records to redraw"""
+        # LOCAL VARIABLES
+        collided = []
+        stats = self._stats
+        round_stats = defaultdict(lambda: [0, 0])  # {ancestry: [names, collisions]}
+
+        # CLAIM
+        for record in records:
+            digest = self._digest(full_names[record])
+            round_stats[ancestries[record]][0] += 1
+            if self._is_issued(digest):
+                stats[ancestries[record]][1] += 1
+                round_stats[ancestries[record]][1] += 1
+                collided.append(record)
+            else:
+                self._recent.add(digest)
+                stats[ancestries[record]][0] += 1
+        if len(self._recent) >= max(_NAME_REGISTRY_MERGE_SIZE, len(self._issued) >> 3):
+            self._merge_recent()
+
+        # SATURATED ANCESTRIES
+        saturated = {ancestry for (ancestry, (names, collisions)) in round_stats.items()
+                     if names >= _NAME_SATURATION_SAMPLE
+                     and collisions / names >= NAME_SPACE_SATURATED_RATE}
+        if saturated:
+            self.issue_duplicates(ancestries, [record for record in collided
+                                               if ancestries[record] in saturated])
+            collided = [record for record in collided if ancestries[record] not in saturated]
+
+        # DONE
+        return collided
+
+    def issue_duplicates(self, ancestries, records):
+        """Issue the records that ran out of retries as duplicates"""
+        for record in records:
+            self._stats[ancestries[record]][0] += 1
+            self._stats[ancestries[record]][2] += 1
+
+    def report(self):
+        """Returns {ancestry: {'issued', 'collisions', 'duplicates', 'collision_rate'}}"""
+        return {ancestry: {'issued': issued, 'collisions': collisions, 'duplicates': dupes,
+                           'collision_rate': collisions / (collisions + issued - dupes)}
+                for (ancestry, (issued, collisions, dupes)) in self._stats.items()}
+
+    def exhausted_ancestries(self, warning_rate=NAME_SPACE_WARNING_RATE):
+        """Returns a sorted list of ancestries whose name space is close to exhausted"""
+        return sorted(ancestry for (ancestry, stats) in self.report().items()
+                      if stats['duplicates'] or stats['collision_rate'] >= warning_rate)
+
+    def _is_issued(self, digest):
+        """Has the full name with this digest been issued?"""
+        if digest in self._recent:
+            return True
+        index = bisect_left(self._issued, digest)
+        return index < len(self._issued) and self._issued[index] == digest
+
+    def _merge_recent(self):
+        """Merge the recent digests into the sorted array"""
+        self._issued = array('Q', sorted(chain(self._issued, self._recent)))
+        self._recent = set()
+
+    @staticmethod
+    def _digest(full_name):
+        """Hash a full name into a 64-bit integer"""
+        return int.from_bytes(hashlib.blake2b(full_name.encode('utf-8'), digest_size=8).digest(),
+                              'big')
 
 
 # pylint: disable=too-many-instance-attributes
 class GGAncestry:
     """Generates Pathfinder 2e character ancestry data."""
     humanEthnicities = HUMAN_ETHNICITY_LIST
-    mwangiSubgroups = ["Bekyar", "Bonuwat", "Mauxi", "Zenj"]
+    mwangiSubgroups = MWANGI_SUBGROUPS
     shoantiClans = ["Lyrune-Quah (Moon Clan)", "Shadde-Quah (Axe Clan)",
                     "Shriikirri-Quah (Hawk Clan)",
                     "Shundar-Quah (Spire Clan)", "Sklar-Quah (Sun Clan)",
                     "Skoan-Quah (Skull Clan)", "Tamiir-Quah (Wind Clan)"]
     supportedAncestry = ANCESTRY_LIST
-    genderList = ["Male", "Female"]
+    genderList = GENDER_LIST
+    __slots__ = ('rando', 'ethnicity', 'subgroup', 'notes', 'city_obj', 'given_name', 'surname',
+                 'full_name', 'ancestry', 'gender')
 
-    def __init__(self, race=None, sex=None, city_object=None):
+    def __init__(self, race=None, sex=None, city_object=None, rando_engine=None):
         """Class constructor"""
+        self.rando = rando_engine if rando_engine else get_rando_engine()
         self.ethnicity = None
         self.subgroup = None
         self.notes = None
@@ -86,17 +459,160 @@ class GGAncestry:
         """Get the character notes."""
         return self.notes
 
+    def to_record(self):
+        """Get the character's ancestry as a GGAncestryRecord."""
+        return GGAncestryRecord(self.full_name, self.given_name, self.surname, self.ancestry,
+                                self.ethnicity, self.subgroup, self.gender,
+                                freeze_notes(self.notes))
+
+    @classmethod
+    def generate_records(cls, num_names, race=None, sex=None, city_object=None,
+                         rando_engine=None, name_registry=None):
+        """Generate num_names names at once and return them as a list of GGAncestryRecords"""
+        columns = cls.generate_many(num_names, race, sex, city_object, rando_engine,
+                                    name_registry)
+        columns['notes'] = [freeze_notes(notes) for notes in columns['notes']]
+        return [GGAncestryRecord._make(record)
+                for record in zip(*[columns[column] for column in ANCESTRY_COLUMNS])]
+
+    @classmethod
+    def generate_many(cls, num_names, race=None, sex=None, city_object=None, rando_engine=None,
+                      name_registry=None):
+        """Generate num_names names at once and return them as columns.
+
+        Names are grouped by the database they come from and each database is sampled once
+        for its whole group.  Returns a dictionary of ANCESTRY_COLUMNS to lists in which index
+        N of every list describes the same character.  city_object must already be loaded.
+        Pass a GGNameRegistry to keep full names unique across this (and any other) batch.
+        """
+        # LOCAL VARIABLES
+        engine = rando_engine if rando_engine else get_rando_engine()
+        columns = {column: [None] * num_names for column in ANCESTRY_COLUMNS}
+        pending = range(num_names)  # Records that still need a name
+
+        # INPUT VALIDATION
+        if race and race not in cls.supportedAncestry:
+            raise RuntimeError(f"Unsupported race: {race}")
+        if sex and sex not in cls.genderList:
+            raise RuntimeError("Unsupported sex")
+
+        # ATTRIBUTES
+        cls._rando_many_attributes(columns, num_names, race, sex, city_object, engine)
+
+        # NAMES
+        cls._rando_many_names(columns, pending, engine)
+        if name_registry is not None:
+            # Redraw collisions in batches; bounded, so an exhausted name space can't stall us
+            for _ in range(name_registry.max_retries):
+                pending = name_registry.claim(columns['full_name'], columns['ancestry'], pending)
+                if not pending:
+                    break
+                cls._rando_many_names(columns, pending, engine)
+            else:
+                pending = name_registry.claim(columns['full_name'], columns['ancestry'], pending)
+            name_registry.issue_duplicates(columns['ancestry'], pending)
+
+        # DONE
+        return columns
+
+    @staticmethod
+    def _rando_many_names(columns, records, engine):
+        """Fill the name and notes columns of records (a sequence of indices) for generate_many()"""
+        # LOCAL VARIABLES
+        name_plans = []  # (record number, column, name plan)
+        demand = defaultdict(int)  # {route key: number of names needed}
+        record_notes = {record: [] for record in records}
+
+        # PLAN NAMES
+        for record in records:
+            (ancestry, ethnicity, subgroup, gender) = \
+                (columns['ancestry'][record], columns['ethnicity'][record],
+                 columns['subgroup'][record], columns['gender'][record])
+            if ancestry in MIXED_HERITAGE_NAMES:
+                record_plans = []
+                for (column, name_part) in (('given_name', NAME_PART_GIVEN),
+                                            ('surname', NAME_PART_SURNAME)):
+                    (name_plan, notes) = plan_mixed_heritage_name(ancestry, name_part, gender,
+                                                                  engine)
+                    record_plans.append((column, name_plan))
+                    record_notes[record].extend(notes)
+            else:
+                record_plans = (
+                    ('given_name', _plan_given_name(ancestry, ethnicity, subgroup, gender)),
+                    ('surname', _plan_surname(ancestry, ethnicity, subgroup, gender, engine)))
+            for (column, name_plan) in record_plans:
+                name_plans.append((record, column, name_plan))
+                for route_key in name_plan[1]:
+                    demand[route_key] += 1
+
+        # DRAW NAMES
+        # One batched pick per database
+        name_routes = get_name_routes()
+        drawn_names = {route_key: iter(pick_entries(name_routes[route_key], num_needed,
+                                                    engine=engine))
+                       for (route_key, num_needed) in demand.items()}
+        for (record, column, (name_format, route_keys)) in name_plans:
+            name_parts = [next(drawn_names[route_key]) for route_key in route_keys]
+            ancestry = columns['ancestry'][record]
+            if column == 'surname' and (ancestry == 'Elf' or ancestry in MIXED_HERITAGE_NAMES):
+                # Like the single-object path: an Elf's father and a mixed heritage surname
+                # never repeat the given name
+                given_name = columns['given_name'][record]
+                name_parts = [pick_entry(name_routes[route_key], engine, (given_name,))
+                              if name_part == given_name else name_part
+                              for (route_key, name_part) in zip(route_keys, name_parts)]
+            columns[column][record] = name_format.format(*name_parts)
+
+        # FULL NAMES AND NOTES
+        for record in records:
+            columns['notes'][record] = _collapse_notes(record_notes[record])
+            columns['full_name'][record] = _format_full_name(columns['given_name'][record],
+                                                             columns['surname'][record],
+                                                             columns['subgroup'][record])
+
+    @classmethod
+    def _rando_many_attributes(cls, columns, num_names, race, sex, city_object, engine):
+        """Fill the ancestry, ethnicity, subgroup, and gender columns for generate_many()"""
+        # Ancestry
+        if race:
+            columns['ancestry'] = [race] * num_names
+        elif city_object:
+            columns['ancestry'] = city_object.rando_city_races(num_names, engine)
+        else:
+            columns['ancestry'] = engine.choices(cls.supportedAncestry, k=num_names)
+        # Ethnicity and subgroup
+        human_records = [record for (record, ancestry) in enumerate(columns['ancestry'])
+                         if ancestry == "Human"]
+        if city_object:
+            ethnicities = city_object.rando_human_ethnicities(len(human_records), engine)
+        else:
+            ethnicities = engine.choices(_NAMED_HUMAN_ETHNICITIES, k=len(human_records))
+        for (record, ethnicity) in zip(human_records, ethnicities):
+            if ethnicity == "Nidalese":
+                ethnicity = "Taldan"  # Fix this in User Story #8
+            columns['ethnicity'][record] = ethnicity
+            if ethnicity == "Mwangi":
+                columns['subgroup'][record] = engine.choice(cls.mwangiSubgroups)
+            elif ethnicity == "Tian":
+                columns['subgroup'][record] = "Shu"
+        # Gender
+        if sex:
+            columns['gender'] = [sex] * num_names
+        else:
+            columns['gender'] = [cls.genderList[0] if rand_percent(engine) < 51
+                                 else cls.genderList[1] for _ in range(num_names)]
+
     def _rando_ancestry(self):
         """Initialize the ancestry attribute"""
-        self.ancestry = random.choice(self.supportedAncestry)
+        self.ancestry = self.rando.choice(self.supportedAncestry)
 
     def _rando_city_ancestry(self):
         """Initialize the ancestry attribute using city object"""
-        self.ancestry = self.city_obj.rando_city_race()
+        self.ancestry = self.city_obj.rando_city_race(self.rando)
 
     def _rando_gender(self):
         """Initialize the gender attribute"""
-        if rand_percent() < 51:
+        if rand_percent(self.rando) < 51:
             self.gender = self.genderList[0]
         else:
             self.gender = self.genderList[1]
@@ -104,105 +620,45 @@ class GGAncestry:
     def _rando_name(self):
         self._rando_given_name()
         self._rando_surname()
-        # Tian-Shu list their surname in front of their birth name.
-        if self.subgroup == "Shu":
-            self.full_name = f'{self.surname} {self.given_name}'
-        else:
-            self.full_name = f'{self.given_name} {self.surname}'
+        self.full_name = _format_full_name(self.given_name, self.surname, self.subgroup)
 
     def _rando_given_name(self):
         if self.ancestry in ('Gnome', 'Goblin'):
             self.given_name = self._get_default_given_name()
-        elif self.ancestry == "Half-Elf":
-            self._rando_half_elf_given_name()
+        elif self.ancestry in MIXED_HERITAGE_NAMES:
+            self.given_name = self._get_mixed_heritage_name(NAME_PART_GIVEN)
         elif self.gender == self.genderList[0]:
             self._rando_male_given_name()
         else:
             self._rando_female_given_name()
 
     def _get_default_given_name(self):
-        if self.ancestry == "Human":
-            db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-Given_Name.txt"
-        else:
-            db_name = "Names-" + self.ancestry + "-Given_Name.txt"
-        return pick_entry(os.path.join(os.getcwd(), "databases", db_name))
-
-    def _rando_half_elf_given_name(self):
-        # LOCAL VARIABLES
-        rando_chance = rand_percent()
-
-        # Human, Elf, or Half-Elf given name
-        if rando_chance <= 33:
-            # Human
-            self.ancestry = "Human"
-            # Determine ethnicity
-            human_ethnicity = self._get_human_ethnicity()
-            if human_ethnicity == "Nidalese":
-                human_ethnicity = "Taldan"
-            self.ethnicity = human_ethnicity
-            # Determine subgroup
-            temp_subgroup = self._get_human_subgroup()
-            self.subgroup = temp_subgroup
-            # Generate given name
-            self._rando_given_name()
-            # Add notes
-            self._add_note(f'Given name is {human_ethnicity} in origin')
-            if temp_subgroup:
-                self._add_note(f'Non-Elven ancestor is from the {temp_subgroup} subgroup')
-        elif rando_chance <= 66:
-            # Half-Elf
-            if self.gender is self.genderList[0]:
-                self._rando_male_given_name()
-            else:
-                self._rando_female_given_name()
-            self._add_note("Half-Elf given name")
-        else:
-            # Elf
-            # NOTE: This may be bad but I guarantee it's easy
-            self.ancestry = "Elf"
-            self._rando_given_name()
-            self._add_note("Given name is Elven in origin")
-
-        # RESET ATTRIBUTES
-        self.ancestry = "Half-Elf"
-        self.ethnicity = None
-        self.subgroup = None
+        return pick_name(self.ancestry, self.ethnicity, self.subgroup, None, NAME_PART_GIVEN,
+                         self.rando)
+
+    def _get_mixed_heritage_name(self, name_part):
+        """Return one part of a mixed heritage name, noting where it came from"""
+        (name_plan, notes) = plan_mixed_heritage_name(self.ancestry, name_part, self.gender,
+                                                      self.rando)
+        for note in notes:
+            self._add_note(note)
+        if name_part == NAME_PART_SURNAME:
+            return resolve_name_plan(name_plan, self.rando, (self.given_name,))
+        return resolve_name_plan(name_plan, self.rando)
 
     def _rando_male_given_name(self):
         self.given_name = self._get_male_given_name()
 
     def _get_male_given_name(self):
-        if self.ancestry == "Human":
-            if self.subgroup:
-                if self.subgroup == "Mauxi":
-                    db_name = "Names-" + self.ancestry + "-" + self.ethnicity \
-                             + "-Bonuwat-Given_Name-Male.txt"
-                else:
-                    db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-" \
-                             + self.subgroup + "-Given_Name-Male.txt"
-            else:
-                db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-Given_Name-Male.txt"
-        else:
-            db_name = "Names-" + self.ancestry + "-Given_Name-Male.txt"
-        return pick_entry(os.path.join(os.getcwd(), "databases", db_name))
+        return pick_name(self.ancestry, self.ethnicity, self.subgroup, self.genderList[0],
+                         NAME_PART_GIVEN, self.rando)
 
     def _rando_female_given_name(self):
         self.given_name = self._get_female_given_name()
 
     def _get_female_given_name(self):
-        if self.ancestry == "Human":
-            if self.subgroup:
-                if self.subgroup == "Mauxi":
-                    db_name = "Names-" + self.ancestry + "-" + self.ethnicity \
-                             + "-Bonuwat-Given_Name-Female.txt"
-                else:
-                    db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-" \
-                             + self.subgroup + "-Given_Name-Female.txt"
-            else:
-                db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-Given_Name-Female.txt"
-        else:
-            db_name = "Names-" + self.ancestry + "-Given_Name-Female.txt"
-        return pick_entry(os.path.join(os.getcwd(), "databases", db_name))
+        return pick_name(self.ancestry, self.ethnicity, self.subgroup, self.genderList[1],
+                         NAME_PART_GIVEN, self.rando)
 
     def _rando_surname(self):
         if self.ancestry == 'Elf':
@@ -213,63 +669,15 @@ class GGAncestry:
             self.surname = ''
         elif self.ancestry == 'Human':
             self.surname = self._get_human_surname()
-        elif self.ancestry == 'Half-Elf':
-            self.surname = self._get_half_elf_surname()
+        elif self.ancestry in MIXED_HERITAGE_NAMES:
+            self.surname = self._get_mixed_heritage_name(NAME_PART_SURNAME)
         else:
             self.surname = self._get_default_surname()
 
-    def _get_half_elf_surname(self):
-        # LOCAL VARIABLES
-        rando_chance = rand_percent()
-        half_elf_surname = ""
-
-        # GET SURNAME
-        if rando_chance <= 33:
-            # Human
-            self.ancestry = "Human"
-            if not self.ethnicity:
-                self.ethnicity = self._get_human_ethnicity()
-            self.subgroup = self._get_human_subgroup()
-            half_elf_surname = self._get_human_surname()
-            self._add_note(f'Surname is Human ({self.ethnicity}) in origin')
-            if self.subgroup:
-                self._add_note(f'Surname comes from the {self.subgroup} subgroup')
-        elif rando_chance <= 66:
-            # Blank
-            half_elf_surname = ""
-            self._add_note("Character has forgotten, hidden, denied, or "
-                           "does not know their surname")
-        else:
-            # Elf
-            self.ancestry = "Elf"
-            half_elf_surname = self._get_elf_surname()
-            self._add_note("Surname is of Elven orgin")
-
-        # RESET ATTRIBUTES
-        self.ancestry = "Half-Elf"
-        self.ethnicity = None
-        self.subgroup = None
-
-        return half_elf_surname
-
     def _get_human_surname(self):
-        if self.ethnicity == "Garundi":
-            ret_surname = f'from {self._rando_human_surname()}'
-        elif self.ethnicity == "Keleshite":
-            ret_surname = f'al-{self._rando_human_surname()} {self._rando_human_surname()} ' \
-                          f'{self._rando_human_surname()} al-{self._rando_human_surname()}'
-        elif self.ethnicity == "Kellid":
-            ret_surname = ''
-        elif self.ethnicity == "Mwangi":
-            ret_surname = f'from the {self._get_subgroup_surname()}'
-        elif self.ethnicity == "Shoanti":
-            ret_surname = f'{self._rando_human_surname()} of the {self._get_shoanti_clan()}'
-        elif self.ethnicity == "Tian":
-            ret_surname = self._get_subgroup_surname()
-        else:
-            ret_surname = self._rando_human_surname()
-
-        return ret_surname
+        shoanti_clan = self._get_shoanti_clan() if self.ethnicity == "Shoanti" else None
+        return resolve_name_plan(_plan_human_surname(self.ethnicity, self.subgroup, shoanti_clan),
+                                 self.rando)
 
     def _rando_elf_surname(self):
         self.surname = self._get_elf_surname()
@@ -281,10 +689,9 @@ class GGAncestry:
             relationship = "son"
         else:
             relationship = "daughter"
-        # Father's name
-        father = self.given_name
-        while father is self.given_name:
-            father = self._get_male_given_name()
+        # Father's name, never the character's own name
+        father = pick_name(self.ancestry, None, None, self.genderList[0], NAME_PART_GIVEN,
+                           self.rando, (self.given_name,))
 
         return elven_surname % (relationship, father)
 
@@ -294,16 +701,11 @@ class GGAncestry:
         self.surname = dwarf_surname % (dwarf_clan)
 
     def _get_default_surname(self):
-        db_name = "Names-" + self.ancestry + "-Surname.txt"
-        return pick_entry(os.path.join(os.getcwd(), "databases", db_name))
+        return pick_name(self.ancestry, None, None, None, NAME_PART_SURNAME, self.rando)
 
     def _get_subgroup_surname(self):
-        if self.subgroup == "Mauxi":
-            db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-Bonuwat-Surname.txt"
-        else:
-            db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-" \
-                     + self.subgroup + "-Surname.txt"
-        return pick_entry(os.path.join(os.getcwd(), "databases", db_name))
+        return pick_name(self.ancestry, self.ethnicity, self.subgroup, None, NAME_PART_SURNAME,
+                         self.rando)
 
     def _rando_human_ethnicity(self):
         """Initialize the ethnicity attribute"""
@@ -311,32 +713,27 @@ class GGAncestry:
 
     def _rando_human_city_ethnicity(self):
         """Initialize the ethnicity attribute from the city object"""
-        self.ethnicity = self.city_obj.rando_human_ethnicity()
+        self.ethnicity = self.city_obj.rando_human_ethnicity(self.rando)
 
     def _rando_mwangi_subgroup(self):
         """Initialize the subgroup attribute"""
         self.subgroup = self._get_mwangi_subgroup()
 
     def _get_mwangi_subgroup(self):
-        return random.choice(self.mwangiSubgroups)
+        return self.rando.choice(self.mwangiSubgroups)
 
     def _get_human_ethnicity(self):
         """Randomly select a Human ethnicity"""
-        human_ethnicity = "Nidalese"  # See: User Story 8
-
-        while human_ethnicity == "Nidalese":
-            human_ethnicity = random.choice(self.humanEthnicities)
-
-        return human_ethnicity
+        return rand_choice(self.humanEthnicities, self.rando, _UNNAMED_HUMAN_ETHNICITIES)
 
     def _get_shoanti_clan(self):
         """Return a Shoanti clan"""
-        return random.choice(self.shoantiClans)
+        return self.rando.choice(self.shoantiClans)
 
     def _rando_human_surname(self):
         """Return a Human surname based on ethnicity"""
-        db_name = "Names-" + self.ancestry + "-" + self.ethnicity + "-Surname.txt"
-        return pick_entry(os.path.join(os.getcwd(), "databases", db_name))
+        return pick_name(self.ancestry, self.ethnicity, None, None, NAME_PART_SURNAME,
+                         self.rando)
 
     def _rando_human_subgroup(self):
         """Initialize the subgroup attribute for a Human ethnicity, if applicable"""
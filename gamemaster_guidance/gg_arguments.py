@@ -2,7 +2,7 @@
 
 # Standard
 from pathlib import Path
-from typing import Dict, Final
+from typing import Dict, Final, Union
 import argparse
 # Third Party
 # Local
@@ -11,9 +11,16 @@ import argparse
 # ARGUMENT DICTIONARY KEYS
 ARG_DICT_KEY_CITY: Final[str] = 'cityfile'  # -c, --cityfile
 ARG_DICT_KEY_GANG: Final[str] = 'gangfile'  # -g, --gangfile
+ARG_DICT_KEY_PACK: Final[str] = 'packfile'  # -p, --packfile
+ARG_DICT_KEY_BUILD_PACK: Final[str] = 'buildpack'  # -b, --buildpack
+ARG_DICT_KEY_SEED: Final[str] = 'seed'  # -s, --seed
+ARG_DICT_KEY_NO_CACHE: Final[str] = 'nocache'  # -n, --nocache
+ARG_DICT_KEY_ATLAS: Final[str] = 'atlas'  # -a, --atlas
+ARG_DICT_KEY_SIMULATE: Final[str] = 'simulate'  # -m, --simulate
+ARG_DICT_KEY_RULES: Final[str] = 'rulesfile'  # -r, --rulesfile
 
 
-def parse_arguments() -> Dict[str, Path]:
+def parse_arguments() -> Dict[str, Union[Path, int, str, bool]]:
     """Parses the arguments and returns the values in a dictionary."""
     parser = argparse.ArgumentParser(prog='GAMEMASTER GUIDE (GAGU)',
                                      description='Gamemaster aid for Pathfinder 2nd Edition')
@@ -21,6 +28,21 @@ def parse_arguments() -> Dict[str, Path]:
                         help='Filename of a city configuration file')
     parser.add_argument('-g', '--gangfile', action='store', required=False,
                         help='Filename of a gang configuration file')
+    parser.add_argument('-p', '--packfile', action='store', required=False,
+                        help='Filename of a compiled database pack to load instead of databases/')
+    parser.add_argument('-r', '--rulesfile', action='store', required=False,
+                        help='Filename of a house rules file of extra settlement rules')
+    parser.add_argument('-b', '--buildpack', action='store', required=False,
+                        help='Compile databases/ into this database pack filename and exit')
+    parser.add_argument('-s', '--seed', action='store', required=False,
+                        help='Seed the random number generator to make a session reproducible')
+    parser.add_argument('-a', '--atlas', action='store', required=False,
+                        help='Directory or glob of city configuration files to load together')
+    parser.add_argument('-n', '--nocache', action='store_true',
+                        help='Build the city from its config instead of using the city cache')
+    parser.add_argument('-m', '--simulate', action='store', type=int, required=False,
+                        help='Simulate this many cities from the cityfile, print their '
+                             'statistics, and exit')
     parsed_args = parser.parse_args()
     ret_dict = {}
 
@@ -30,10 +52,35 @@ def parse_arguments() -> Dict[str, Path]:
     # Gang file
     if parsed_args.gangfile:
         ret_dict[ARG_DICT_KEY_CITY] = Path(parsed_args.gangfile)
+    # Database pack
+    if parsed_args.packfile:
+        ret_dict[ARG_DICT_KEY_PACK] = Path(parsed_args.packfile)
+    # House rules
+    if parsed_args.rulesfile:
+        ret_dict[ARG_DICT_KEY_RULES] = Path(parsed_args.rulesfile)
 
     for value in ret_dict.values():
         _validate_path(value)
 
+    # Random seed (integers and strings are both valid seeds)
+    if parsed_args.seed:
+        try:
+            ret_dict[ARG_DICT_KEY_SEED] = int(parsed_args.seed)
+        except ValueError:
+            ret_dict[ARG_DICT_KEY_SEED] = parsed_args.seed
+    # Atlas (a directory or a glob, so it isn't validated as a file)
+    if parsed_args.atlas:
+        ret_dict[ARG_DICT_KEY_ATLAS] = parsed_args.atlas
+    # City cache
+    if parsed_args.nocache:
+        ret_dict[ARG_DICT_KEY_NO_CACHE] = True
+    # Number of cities to simulate
+    if parsed_args.simulate is not None:
+        ret_dict[ARG_DICT_KEY_SIMULATE] = parsed_args.simulate
+    # Database pack to build (doesn't have to exist yet)
+    if parsed_args.buildpack:
+        ret_dict[ARG_DICT_KEY_BUILD_PACK] = Path(parsed_args.buildpack)
+
     return ret_dict
 
 
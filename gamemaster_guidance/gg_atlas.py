@@ -0,0 +1,123 @@
+"""Defines the GGAtlas class: a registry of every city in a campaign."""
+
+# Standard
+from concurrent.futures import ProcessPoolExecutor
+from typing import Final
+import glob
+import os
+# Third Party
+# Local
+from gamemaster_guidance.gg_city import GG_City
+from gamemaster_guidance.gg_city_cache import load_city
+from gamemaster_guidance.gg_city_rules import get_city_rules, install_city_rules
+from gamemaster_guidance.gg_rando import GGWeightedSampler, get_rando_engine
+
+
+CITY_CONFIG_EXTENSIONS: Final[tuple] = ('.yml', '.yaml')  # City configs in an atlas directory
+
+
+class GGAtlas:
+    """Registry of loaded cities keyed by (name, region)."""
+
+    def __init__(self, cities=()):
+        """Class constructor"""
+        self.cities = {}  # {(name, region): GG_City}
+        self._citySampler = None  # Population weighted sampler of cities, built on demand
+        for city_obj in cities:
+            self.add(city_obj)
+
+    def __len__(self):
+        """Number of cities in the atlas"""
+        return len(self.cities)
+
+    def __iter__(self):
+        """Iterate over the cities sorted by region then name"""
+        return iter([self.cities[key] for key in sorted(self.cities, key=lambda key: key[::-1])])
+
+    def add(self, city_obj):
+        """Add (or replace) one loaded city"""
+        city_obj.load()
+        key = (city_obj.name, city_obj.region)
+        if self.cities.get(key, city_obj) is not city_obj:
+            print(f'Replacing the atlas entry for {key[0]} ({key[1]})')
+        self.cities[key] = city_obj
+        self._citySampler = None
+
+    def get(self, name, region=None):
+        """Return the city named name, in region if given; names shared across regions need one"""
+        if region is not None:
+            try:
+                return self.cities[(name, region)]
+            except KeyError as err:
+                raise RuntimeError(f'No city named {name} in {region}') from err
+        matches = [city_obj for ((city_name, _), city_obj) in self.cities.items()
+                   if city_name == name]
+        if not matches:
+            raise RuntimeError(f'No city named {name}')
+        if len(matches) > 1:
+            raise RuntimeError(f'More than one city is named {name}; specify a region')
+        return matches[0]
+
+    def get_regions(self):
+        """Return a sorted list of every region in the atlas"""
+        return sorted({region for (_, region) in self.cities})
+
+    def get_region(self, region):
+        """Return a list of the cities in region, sorted by name"""
+        return [city_obj for city_obj in self if city_obj.region == region]
+
+    def rando_city(self, engine=None):
+        """Randomize a city weighted by population (e.g., for campaign-wide NPCs)"""
+        if not self.cities:
+            raise RuntimeError("The atlas is empty")
+        if not self._citySampler:
+            city_list = list(self)
+            self._citySampler = GGWeightedSampler(city_list,
+                                                  [city_obj.population for city_obj in city_list])
+        return self._citySampler.sample(engine=engine)
+
+
+def find_city_configs(pattern):
+    """Returns a sorted list of city config filenames in a directory or matching a glob"""
+    if os.path.isdir(pattern):
+        return sorted(dir_entry.path for dir_entry in os.scandir(pattern)
+                      if dir_entry.is_file() and dir_entry.name.endswith(CITY_CONFIG_EXTENSIONS))
+    return sorted(filename for filename in glob.glob(pattern) if os.path.isfile(filename))
+
+
+def load_atlas(pattern, cache_dir=None, use_cache=True, max_workers=None, rando_engine=None):
+    """Load every city config in a directory or matching a glob into a GGAtlas.
+
+    Cities are parsed, validated, and completed concurrently in a process pool (see: load_city()
+    for the city cache arguments).  Each city is randomized by its own child of rando_engine
+    (defaults to the current engine) so a seeded session loads the same atlas every time.
+    """
+    # LOCAL VARIABLES
+    filename_list = find_city_configs(pattern)
+    local_engine = rando_engine if rando_engine else get_rando_engine()
+
+    # INPUT VALIDATION
+    if not filename_list:
+        raise FileNotFoundError(f'Unable to find any city configs in {pattern}')
+
+    # LOAD CITIES
+    engine_list = local_engine.spawn(len(filename_list))
+    num_files = len(filename_list)
+    if num_files == 1:
+        snapshot_list = [_load_city_snapshot(filename_list[0], cache_dir, use_cache,
+                                             engine_list[0])]
+    else:
+        # Workers use this process's settlement rules, house rules included
+        with ProcessPoolExecutor(max_workers, initializer=install_city_rules,
+                                 initargs=(get_city_rules().ruleTable,)) as executor:
+            snapshot_list = list(executor.map(_load_city_snapshot, filename_list,
+                                              [cache_dir] * num_files, [use_cache] * num_files,
+                                              engine_list))
+
+    # DONE
+    return GGAtlas([GG_City.from_snapshot(snapshot) for snapshot in snapshot_list])
+
+
+def _load_city_snapshot(filename, cache_dir, use_cache, rando_engine):
+    """Process pool worker: load one completed city and return its snapshot"""
+    return load_city(filename, cache_dir, use_cache, rando_engine).snapshot()
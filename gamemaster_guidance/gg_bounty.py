@@ -1,16 +1,17 @@
 # Standard Imports
 import math
 import os
-import random
 
 # Third Party Imports
 
 
 # Local Imports
 from gamemaster_guidance.gg_character import GGCharacter
-from gamemaster_guidance.gg_file_io import pick_entries
+from gamemaster_guidance.gg_file_io import pick_entries, pick_entry_samples
 from gamemaster_guidance.gg_globals import CLASS_LIST, print_header
-from gamemaster_guidance.gg_rando import rand_integer, rand_percent
+from gamemaster_guidance.gg_rando import (GGWeightedSampler, get_rando_engine, rand_integer,
+                                           rand_percent)
+from gamemaster_guidance.gg_records import GGBountyRecord
 
 
 def calculate_exponential_percent(num):
@@ -100,11 +101,18 @@ class GGBounty(GGCharacter):
             'inquiry, official investigation, shady city guard, shady Black Jackets, etc.'
         },
     }
+    # Alias table of bountySources, built once for the class
+    bountySourceSampler = GGWeightedSampler(bountySources.keys(),
+                                            [bsValue['Probability']
+                                             for bsValue in bountySources.values()])
+    __slots__ = ('_reward', '_wanted_status', '_class', '_level', '_crime_list', '_crime_type',
+                 '_min_level', '_complications', '_bounty_source')
 
-    def __init__(self, race=None, sex=None, numTraits=3, city_object=None, minLevel=1):
+    def __init__(self, race=None, sex=None, numTraits=3, city_object=None, minLevel=1,
+                 rando_engine=None):
         """Class constructor"""
         # GGCharacter
-        super().__init__(race, sex, numTraits, city_object)
+        super().__init__(race, sex, numTraits, city_object, rando_engine)
 
         # GG_Bounty
         self._reward = None  # Bounty reward in gp as a str
@@ -120,13 +128,80 @@ class GGBounty(GGCharacter):
         assert self._min_level <= 20, "Minimum level too high"
         self._create_bounty()
 
+    def to_record(self):
+        """Get the bounty as a GGBountyRecord"""
+        return GGBountyRecord(*super().to_record(), self._reward, self._wanted_status,
+                              self._class, self._level, tuple(self._crime_list),
+                              self._crime_type, tuple(self._complications), self._bounty_source)
+
+    @classmethod
+    def generate_records(cls, num_bounties, race=None, sex=None, numTraits=3, city_object=None,
+                         minLevel=1, rando_engine=None, name_registry=None):
+        """Generate num_bounties bounties at once as a list of GGBountyRecords.
+
+        No GGBounty is constructed: characters come from GGCharacter.generate_records() and
+        each crime and complication database is sampled once for every bounty that needs it.
+        """
+        # LOCAL VARIABLES
+        engine = rando_engine if rando_engine else get_rando_engine()
+        crime_groups = {}  # {crime type: [bounty number, ...]}
+        crime_lists = [None] * num_bounties
+        record_list = []
+
+        # INPUT VALIDATION
+        assert minLevel > 0, "Minimum level too low"
+        assert minLevel <= 20, "Minimum level too high"
+
+        # CHARACTERS
+        char_records = GGCharacter.generate_records(num_bounties, race, sex, numTraits,
+                                                    city_object, engine, name_registry)
+
+        # CLASSES, LEVELS, AND CRIME TYPES
+        if city_object:
+            class_levels = [city_object.rando_npc_class_level(minLevel, engine)
+                            for _ in range(num_bounties)]
+        else:
+            class_levels = [(char_class, rand_integer(minLevel, 20, engine))
+                            for char_class in engine.choices(CLASS_LIST, k=num_bounties)]
+        crime_types = [cls._calc_crime_type(level, engine) for (_, level) in class_levels]
+
+        # DATABASE PICKS
+        for (bounty_num, crime_type) in enumerate(crime_types):
+            crime_groups.setdefault(crime_type, []).append(bounty_num)
+        for (crime_type, bounty_nums) in crime_groups.items():
+            for (bounty_num, crimes) in zip(bounty_nums, pick_entry_samples(
+                    cls.crimeDatabases[crime_type], 3, len(bounty_nums), replace=False,
+                    engine=engine)):
+                crime_lists[bounty_num] = tuple(crimes)
+        complication_lists = pick_entry_samples(cls.complicationDatabase, 3, num_bounties,
+                                                replace=False, engine=engine)
+        sources = cls.bountySourceSampler.sample(num_bounties, engine)
+
+        # RECORDS
+        for (bounty_num, char_record) in enumerate(char_records):
+            (char_class, level) = class_levels[bounty_num]
+            wanted_status = cls._calc_wanted_status(level, engine)
+            (reward, reward_notes) = cls._calc_reward(level, crime_types[bounty_num],
+                                                      wanted_status, engine)
+            notes = char_record.notes + tuple(reward_notes) \
+                + ("Consider... " + cls.bountySources[sources[bounty_num]]["Notes"],)
+            record_list.append(GGBountyRecord(*char_record._replace(notes=notes), reward,
+                                              wanted_status, char_class, level,
+                                              crime_lists[bounty_num], crime_types[bounty_num],
+                                              tuple(complication_lists[bounty_num]),
+                                              sources[bounty_num]))
+
+        # DONE
+        return record_list
+
     def _create_bounty(self):
         # Class and Level
         if self.city_obj:
-            (self._class, self._level) = self.city_obj.rando_npc_class_level(self._min_level)
+            (self._class, self._level) = self.city_obj.rando_npc_class_level(self._min_level,
+                                                                             self.rando)
         else:
-            self._class = random.choice(CLASS_LIST)
-            self._level = rand_integer(self._min_level, 20)
+            self._class = self.rando.choice(CLASS_LIST)
+            self._level = rand_integer(self._min_level, 20, self.rando)
         # Crime
         self._rando_crime()
         # Wanted Status
@@ -139,101 +214,99 @@ class GGBounty(GGCharacter):
         self._rando_source()
 
     def _rando_crime(self):
+        # Resolve Crime
+        self._crime_type = self._calc_crime_type(self._level, self.rando)
+
+        # Randomize Crimes
+        self._crime_list = pick_entries(self.crimeDatabases[self._crime_type], 3, replace=False,
+                                        engine=self.rando)
+
+    @classmethod
+    def _calc_crime_type(cls, level, engine):
+        """Return a random crime type index for a bounty of level"""
         # LOCAL VARIABLES
-        levelPercents = self.crimePercents[self._level]
-        randoPercent = rand_percent()
+        levelPercents = cls.crimePercents[level]
+        randoPercent = rand_percent(engine)
         runningPercent = 0
-        currIndex = -1
 
         # Resolve Crime
         for index in range(0,len(levelPercents)):
             runningPercent += levelPercents[index]
             if randoPercent <= runningPercent:
-                currIndex = index
-                self._crime_type = index
-                break
-        assert (currIndex > -1), 'Failed to randomize a crime'
-
-        # Randomize Crimes
-        self._crime_list = pick_entries(self.crimeDatabases[currIndex], 3)
+                return index
+        raise AssertionError('Failed to randomize a crime')
 
     def _rando_wanted_status(self):
+        self._wanted_status = self._calc_wanted_status(self._level, self.rando)
+
+    @classmethod
+    def _calc_wanted_status(cls, level, engine):
+        """Return a random wanted status for a bounty of level"""
         # This equation returns (1, 10) through (20, 90)
         # Level 1 returns 10%, Level 20 returns 90%
-        chanceDOA = calculate_exponential_percent(self._level)
-        if rand_percent() <= chanceDOA:
-            self._wanted_status = self.supportedStates[1]
-        else:
-            self._wanted_status = self.supportedStates[0]
+        chanceDOA = calculate_exponential_percent(level)
+        if rand_percent(engine) <= chanceDOA:
+            return cls.supportedStates[1]
+        return cls.supportedStates[0]
 
     def _rando_complications(self):
-        self._complications = pick_entries(self.complicationDatabase, 3)
+        self._complications = pick_entries(self.complicationDatabase, 3, replace=False,
+                                           engine=self.rando)
             
     def _rando_reward(self):
+        (self._reward, rewardNotes) = self._calc_reward(self._level, self._crime_type,
+                                                        self._wanted_status, self.rando)
+        for note in rewardNotes:
+            self.charAncestry._add_note(note)
+
+    @classmethod
+    def _calc_reward(cls, level, crime_type, wanted_status, engine):
+        """Return a random (reward, [note, ...]) for a bounty"""
         # LOCAL VARIABLES
-        aliveReward = self._level * 10  # Starting point
+        aliveReward = level * 10  # Starting point
         deadReward = ''
+        rewardNotes = []
         splitChance = 0
         randPercent = 0
         
         # ADJUST REWARD
         # Standard Variance
-        aliveReward = aliveReward * (1 + (self._crime_type * .1))
+        aliveReward = aliveReward * (1 + (crime_type * .1))
         # Complications
         # TO DO: DON'T DO NOW
         # Wanted Status
-        if self._wanted_status == self.supportedStates[1]:
+        if wanted_status == cls.supportedStates[1]:
             # Higher the number, less of a chance for a split
-            splitChance = 100 - calculate_exponential_percent(self._level)
+            splitChance = 100 - calculate_exponential_percent(level)
             # Randomize a percent
-            randPercent = rand_percent()
+            randPercent = rand_percent(engine)
             # Determine split
             if randPercent <= splitChance:
                 # Split
                 if (randPercent / 2) <= splitChance:
-                    deadReward = str(int(self.deadRewardPercents[0] * aliveReward))
-                    self.charAncestry._add_note('A low percent dead bounty could indicate a low level or dangerous criminal.  '
-                                                '(e.g., court wants to make a public example, already slated for execution, violent'
-                                                ', case/criminal is generating bad press)')
+                    deadReward = str(int(cls.deadRewardPercents[0] * aliveReward))
+                    rewardNotes.append('A low percent dead bounty could indicate a low level or dangerous criminal.  '
+                                       '(e.g., court wants to make a public example, already slated for execution, violent'
+                                       ', case/criminal is generating bad press)')
                 elif randPercent <= splitChance:
-                    deadReward = str(int(self.deadRewardPercents[1] * aliveReward))
-                    self.charAncestry._add_note('A mid percent dead bounty could indicate a dastardly or slippery felon.  '
-                                                '(e.g., bad crimes, mid-to-high level')
+                    deadReward = str(int(cls.deadRewardPercents[1] * aliveReward))
+                    rewardNotes.append('A mid percent dead bounty could indicate a dastardly or slippery felon.  '
+                                       '(e.g., bad crimes, mid-to-high level')
                 else:
                     # No split.  Dead bounty is the same reward as living.
-                    deadReward = str(int(self.deadRewardPercents[2] * aliveReward))
-                    self.charAncestry._add_note('Dead and Alive bounty rewards match.')
-                    self.charAncestry._add_note('Perhaps, the mark is a nefarious or slippery villain. (e.g., egregious crimes, high level')
-                    self.charAncestry._add_note('Maybe someone wants the mark permanently silenced. (e.g., innocent, knows something')
+                    deadReward = str(int(cls.deadRewardPercents[2] * aliveReward))
+                    rewardNotes.append('Dead and Alive bounty rewards match.')
+                    rewardNotes.append('Perhaps, the mark is a nefarious or slippery villain. (e.g., egregious crimes, high level')
+                    rewardNotes.append('Maybe someone wants the mark permanently silenced. (e.g., innocent, knows something')
                 deadReward = deadReward + '/'  # Truncate the "alive" reward later
         
-        self._reward = deadReward + str(int(aliveReward))
+        return (deadReward + str(int(aliveReward)), rewardNotes)
 
     def _rando_source(self):
         # {source:{probability:percent 1-100, notes:string}}
-        # LOCAL VARIABLES
-        totalPercent = 0  # Add all the probabilities here
-        randoNum = 0  # Roll
-
-        # RANDOMIZE A SOURCE
-        # 1. Add all the probabilites
-        for bsValue in self.bountySources.values():
-            totalPercent += bsValue["Probability"]
-        # 2. Randomize a value
-        if totalPercent > 1:
-            randoNum = rand_integer(1, totalPercent)
-        else:
-            raise RuntimeError("Unable to find probabilites in the bounty source dictionary")
-        # 3. Find the entry
-        for (bsKey, bsValue) in self.bountySources.items():
-            if randoNum <= bsValue["Probability"]:
-                self._bounty_source = bsKey
-                self.charAncestry._add_note("Consider... " + bsValue["Notes"])
-                return
-            else:
-                randoNum -= bsValue["Probability"]
-
-        raise RuntimeError("Failed to find a bounty source entry")
+        self._bounty_source = self.bountySourceSampler.sample(engine=self.rando)
+        self.charAncestry._add_note("Consider... "
+                                    + self.bountySources[self._bounty_source]["Notes"])
 
     def print_public_details(self):
         print_header("Public Details")
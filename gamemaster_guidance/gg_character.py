@@ -2,28 +2,65 @@
 import os
 # Third Party
 # Local
-from gamemaster_guidance.gg_ancestry import GGAncestry
-from gamemaster_guidance.gg_file_io import pick_entries
+from gamemaster_guidance.gg_ancestry import ANCESTRY_COLUMNS, GGAncestry
+from gamemaster_guidance.gg_file_io import pick_entries, pick_entry_samples
+from gamemaster_guidance.gg_rando import get_rando_engine
+from gamemaster_guidance.gg_records import GGCharacterRecord, freeze_notes
 
 
 class GGCharacter:
     """Create and print a new character"""
     entryTitleWidth = 10  # Width of each printed entry's title
     entryFormatStr = "{:"+str(entryTitleWidth)+"}"
+    __slots__ = ('rando', 'city_obj', 'charAncestry', 'traitList')
 
-    def __init__(self, race=None, sex=None, num_traits=3, city_object=None):
+    def __init__(self, race=None, sex=None, num_traits=3, city_object=None, rando_engine=None):
         """Class constructor"""
+        self.rando = rando_engine if rando_engine else get_rando_engine()
         # City Stats
         self.city_obj = city_object
-        if self.city_obj and not race:
-            self.city_obj.load()
-            race = self.city_obj.rando_city_race()
+        if self.city_obj:
+            self.city_obj.load()  # No-op once the city is loaded
+            if not race:
+                race = self.city_obj.rando_city_race(self.rando)
 
         # Ancestry
-        self.charAncestry = GGAncestry(race, sex, city_object)
+        self.charAncestry = GGAncestry(race, sex, city_object, self.rando)
         # Traits
-        dbFilename = os.path.join(os.getcwd(), "databases", "Traits.txt")
-        self.traitList = pick_entries(dbFilename, num_traits)
+        self.traitList = pick_entries(self._get_traits_filename(), num_traits, replace=False,
+                                      engine=self.rando)
+
+
+    def to_record(self):
+        """Get the character as a GGCharacterRecord"""
+        return GGCharacterRecord(*self.charAncestry.to_record(), tuple(self.traitList))
+
+
+    @classmethod
+    def generate_records(cls, num_characters, race=None, sex=None, num_traits=3,
+                         city_object=None, rando_engine=None, name_registry=None):
+        """Generate num_characters characters at once as a list of GGCharacterRecords"""
+        # LOCAL VARIABLES
+        engine = rando_engine if rando_engine else get_rando_engine()
+
+        # GENERATE
+        if city_object:
+            city_object.load()
+        columns = GGAncestry.generate_many(num_characters, race, sex, city_object, engine,
+                                           name_registry)
+        columns['notes'] = [freeze_notes(notes) for notes in columns['notes']]
+        trait_samples = pick_entry_samples(cls._get_traits_filename(), num_traits,
+                                           num_characters, replace=False, engine=engine)
+
+        # DONE
+        return [GGCharacterRecord(*record, tuple(traits)) for (record, traits)
+                in zip(zip(*[columns[column] for column in ANCESTRY_COLUMNS]), trait_samples)]
+
+
+    @staticmethod
+    def _get_traits_filename():
+        """Return the absolute filename of the traits database"""
+        return os.path.join(os.getcwd(), "databases", "Traits.txt")
 
 
     def print_character(self):
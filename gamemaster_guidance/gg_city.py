@@ -1,14 +1,19 @@
 # Standard
+from bisect import bisect_left
 from collections import OrderedDict
+from typing import Dict, Final
 # Third Party
-import inflect
 import locale
 import math
-import random
 # Local
+from gamemaster_guidance.gg_city_rules import (CITY_MAX_SPELLCASTING, CITY_RULE_FEATURES,
+                                                CITY_RULE_STATS, get_city_rules)
+from gamemaster_guidance.gg_dice import compile_dice
+from gamemaster_guidance.gg_format import number_to_words, ordinal
 from gamemaster_guidance.gg_globals import (ANCESTRY_LIST, CITY_MODIFIER_LIST, CITY_SIZE_LIMITS,
                                             HUMAN_ETHNICITY_LIST, print_header)
-from gamemaster_guidance.gg_rando import rand_float, rand_integer
+from gamemaster_guidance.gg_npc_levels import NPC_MAX_LEVEL, GGNpcLevelTable
+from gamemaster_guidance.gg_rando import GGWeightedSampler, get_rando_engine, rand_integer
 import gamemaster_guidance.gg_globals as GG_Globals  # For backwards compatibility
 
 
@@ -22,12 +27,91 @@ def get_key_value(theDict, theKey):
     return theValue
 
 
+def get_npc_level_chain(highestLevel):
+    """Returns the [(level, number), ...] of NPCs that come with one NPC of highestLevel.
+
+    Each level 2+ NPC comes with twice as many NPCs of half their level (rounded up), all the
+    way down to level 1.  A highestLevel below 1 means no NPCs at all.
+    """
+    # LOCAL VARIABLES
+    levelChain = []
+    charLevel = highestLevel  # Current level being enumerated
+    numOfThatLevel = 1  # Number of NPCs at level "charLevel"
+
+    # ENUMERATE LEVELS
+    if charLevel > 0:
+        levelChain.append((charLevel, numOfThatLevel))
+        while charLevel >= 2:
+            charLevel = math.ceil(charLevel / 2)
+            numOfThatLevel *= 2
+            levelChain.append((charLevel, numOfThatLevel))
+
+    # DONE
+    return levelChain
+
+
+# Derived city stages and the stages each one depends on.  GG_City computes a stage, and its
+# dependencies, the first time one of the stage's attributes is read.
+CITY_STAGES: Final[Dict[str, tuple]] = {
+    'demographics': (),  # race_lookup and the demographic samplers (computed by load())
+    'randomized': (),  # population, disadvantages, alignment, government
+    'type': ('randomized',),
+    'qualities': ('type',),
+    'base_value': ('qualities',),
+    'modifiers': ('qualities',),
+    'purchase_limit': ('qualities',),
+    'spellcasting': ('qualities',),
+    'npcs': ('modifiers',),
+}
+
+
+class GGCityStat:
+    """A lazily computed, cached GG_City attribute.
+
+    Reading the attribute computes its city stage (see: CITY_STAGES), parses the value out of
+    the completed cityDict with parse(city), and caches it on the instance.
+    """
+
+    def __init__(self, stage, parse):
+        """Class constructor"""
+        if stage not in CITY_STAGES:
+            raise RuntimeError(f'Unknown city stage: {stage}')
+        self.stage = stage
+        self.parse = parse
+        self.name = None  # Attribute name, set by __set_name__()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, city, owner=None):
+        if city is None:
+            return self
+        city.require_stage(self.stage)
+        value = self.parse(city)
+        city.__dict__[self.name] = value  # Shadows this descriptor from now on
+        return value
+
+
+def _city_entry(key, convert=None):
+    """Returns a GGCityStat parser that reads one cityDict entry, optionally converting it"""
+    def parse(city):
+        value = city.cityDict["city"][key]
+        return convert(value) if convert else value
+    return parse
+
+
+def _city_modifier(key):
+    """Returns a GGCityStat parser that reads one city modifier as an int"""
+    def parse(city):
+        return int(city.cityDict["city"]["modifiers"][key])
+    return parse
+
+
 class GG_City:
-    supportedDisadvantages = ["Anarchy", "Cursed", "Hunted", "Impoverished", "Plagued"]
-    supportedGovernments = ["Autocracy", "Council", "Magical", "Overlord", "Secret Syndicate"]
-    supportedQualities = ["Academic", "Holy Site", "Insular", "Magically Attuned", "Notorious",
-                          "Pious", "Prosperous", "Racially Intolerant", "Rumormongering Citizens",
-                          "Strategic Location", "Superstitious", "Tourist Attraction"]
+    # Supported features are the ones with a settlement rule (see: gg_city_rules)
+    supportedDisadvantages = CITY_RULE_FEATURES["disadvantages"]
+    supportedGovernments = CITY_RULE_FEATURES["government"]
+    supportedQualities = CITY_RULE_FEATURES["qualities"]
     supportedEthics = ["Lawful", "Neutral", "Chaotic"]
     supportedMoralities = ["Good", "Neutral", "Evil"]
     settlementStatistics = {
@@ -48,15 +132,69 @@ class GG_City:
         "Metropolis": {"Modifiers": 4, "Qualities": 6, "Danger": 10, "Base Value": 16000,
                        "Purchase Limit": 100000, "Spellcasting": 8, "Base Value": 16000}
     }
-
-    def __init__(self, cityDict):
+    # Largest population of each settlement type; anything larger is a Metropolis
+    settlementPopulations = {"Thorp": 20, "Hamlet": 60, "Village": 200, "Small Town": 2000,
+                             "Large Town": 5000, "Small City": 10000, "Large City": 25000}
+    # Name of the method that computes each of the CITY_STAGES
+    stageMethods = {'demographics': '_parse_demographics', 'randomized': '_rando_city',
+                    'type': '_complete_city_type', 'qualities': '_complete_city_qualities',
+                    'base_value': '_complete_city_base_value',
+                    'modifiers': '_calc_city_modifiers',
+                    'purchase_limit': '_calc_city_purchase_limit',
+                    'spellcasting': '_calc_city_spellcasting', 'npcs': '_complete_city_npcs'}
+    # Dice (numDice, numFaces) rolled, plus the community modifier, for each class's highest level
+    npcClassDice = {"alchemist": (1, 4), "barbarian": (1, 4), "bard": (1, 6),
+                    "champion": (1, 3), "cleric": (1, 6), "druid": (1, 6), "fighter": (1, 8),
+                    "monk": (1, 4), "ranger": (1, 3), "rogue": (1, 8), "sorcerer": (1, 4),
+                    "wizard": (1, 4)}
+    # Classes rolled with bigger dice where their ethnicities are common: (dice, method name)
+    npcCommonClassDice = {"barbarian": ((1, 8), '_are_barbarians_common'),
+                          "monk": ((1, 8), '_are_monks_common')}
+    # Number of highest-level NPCs rolled per class; other settlement types roll once
+    npcMultipliers = {"Metropolis": 4, "Large City": 3, "Small City": 2}
+    # Share of the remaining population in each NPC class; commoners make up the rest
+    npcRemainderRates = {"aristocrat": .005, "adept": .005, "expert": .03, "warrior": .05}
+
+    # DERIVED ATTRIBUTES
+    alignment = GGCityStat('randomized', _city_entry("alignment"))
+    government = GGCityStat('randomized', _city_entry("government"))
+    population = GGCityStat('randomized', _city_entry("population", int))
+    disadvantages = GGCityStat('randomized',
+                               lambda city: city.cityDict["city"].get("disadvantages"))
+    cityType = GGCityStat('type', _city_entry("type"))
+    qualities = GGCityStat('qualities', _city_entry("qualities"))
+    baseValue = GGCityStat('base_value', _city_entry("base_value", int))
+    cityCorruption = GGCityStat('modifiers', _city_modifier("corruption"))
+    cityCrime = GGCityStat('modifiers', _city_modifier("crime"))
+    cityEconomy = GGCityStat('modifiers', _city_modifier("economy"))
+    cityLaw = GGCityStat('modifiers', _city_modifier("law"))
+    cityLore = GGCityStat('modifiers', _city_modifier("lore"))
+    citySociety = GGCityStat('modifiers', _city_modifier("society"))
+    modifierLookup = GGCityStat('modifiers', lambda city: OrderedDict(
+        [("Corruption", city.cityCorruption), ("Crime", city.cityCrime),
+         ("Economy", city.cityEconomy), ("Law", city.cityLaw), ("Lore", city.cityLore),
+         ("Society", city.citySociety)]))
+    purchaseLimit = GGCityStat('purchase_limit', _city_entry("purchase_limit", int))
+    spellcasting = GGCityStat('spellcasting', _city_entry("spellcasting", int))
+    npcs = GGCityStat('npcs', _city_entry("npcs"))
+    npcLevelTable = GGCityStat('npcs', lambda city: city._npcLevelTable)  # class x level counts
+    # {class: {"Total": int, "Dict": {level: count}}}, derived from npcLevelTable
+    npcClassLevels = GGCityStat('npcs', lambda city: city._npcLevelTable.to_dict())
+    # {minLevel: ([cumulative citizen count, ...], [(class, level), ...])}
+    npcLevelIndex = GGCityStat('npcs', lambda city: city._npcLevelTable.build_level_index())
+
+    def __init__(self, cityDict, rando_engine=None):
         """Class constructor"""
+        self.rando = rando_engine if rando_engine else get_rando_engine()
         self.cityDict = cityDict
         self.baseCityModifier = None
         self.npcMultiplier = 1  # Large cities can have multiple high-level NPCs
-        self.npcClassLevels = {}  # class:totals for population
-        self.race_lookup = {}  # race:percentage dictionary defined by _parse_city()
-        self.population = 0  # Store total population here
+        self._npcLevelTable = GGNpcLevelTable()  # Citizens by class and level, filled by npcs
+        self._completedStages = set()  # CITY_STAGES computed so far
+        self.race_lookup = {}  # race:percentage dictionary defined by _parse_demographics()
+        self.raceSampler = None  # Weighted sampler of race_lookup defined by _parse_demographics()
+        self.ethnicitySampler = None  # Weighted sampler of human ethnicities, ditto
+        self.loaded = False  # Set by load(); a loaded city is only ever sampled from
 
         # Use these attributes to indicate a value should be randomized prior to parsing
         self.randoDisadvantage = False  # Randomize a disadvantage
@@ -72,59 +210,79 @@ class GG_City:
         self.calcType = False
 
     def load(self):
-        """Entry level method: validate and parse the dictionary"""
+        """Entry level method: validate the dictionary and parse the demographics.
+
+        Idempotent: later calls return immediately so consumers may call load() before every
+        use.  Everything else (type, modifiers, the NPC table, etc.) is computed the first time
+        it's read.
+        """
+        if self.loaded:
+            return
         self._validate_city()  # Verify all input
-        self._complete_city()  # Fill in the blanks
-        # Everything prior to this method call should operate on the cityDict
-        self._parse_city()     # Load the city into attributes
+        self.loaded = True
+        self.require_stage('demographics')
+
+    def complete(self):
+        """Load the city and compute every derived stage, filling in all of cityDict"""
+        for stage in CITY_STAGES:
+            self.require_stage(stage)
+
+    def snapshot(self):
+        """Complete the city and return a picklable dictionary that from_snapshot() restores"""
+        self.complete()
+        return {'cityDict': self.cityDict, 'npcLevelTable': self._npcLevelTable,
+                'baseCityModifier': self.baseCityModifier, 'npcMultiplier': self.npcMultiplier}
+
+    @classmethod
+    def from_snapshot(cls, snapshot, rando_engine=None):
+        """Restore a completed city from snapshot() without validating or completing it again"""
+        city = cls(snapshot['cityDict'], rando_engine)
+        city._npcLevelTable = snapshot['npcLevelTable']
+        city.baseCityModifier = snapshot['baseCityModifier']
+        city.npcMultiplier = snapshot['npcMultiplier']
+        city.loaded = True
+        city._parse_demographics()
+        city._completedStages.update(CITY_STAGES)
+        return city
+
+    def require_stage(self, stage):
+        """Compute one of the CITY_STAGES, and the stages it depends on, if not already done"""
+        if stage in self._completedStages:
+            return
+        if not self.loaded:
+            self.load()
+        for dependency in CITY_STAGES[stage]:
+            self.require_stage(dependency)
+        getattr(self, self.stageMethods[stage])()
+        self._completedStages.add(stage)
 
     def get_race_percent(self, raceName):
         """Return a race's percent"""
         return self.race_lookup[raceName]
 
-    def rando_city_race(self):
-        # LOCAL VARIABLES
-        totalPercent = float(0.0)
-
-        # DETERMINE RACE
-        # Add total percents
-        for percentValue in self.race_lookup.values():
-            totalPercent += percentValue
-        if totalPercent <= 0.0:
+    def rando_city_race(self, engine=None):
+        """Randomize an ancestry weighted by the city's demographics"""
+        if not self.raceSampler:
             raise RuntimeError("Race percentages not found")
-        # Rando a number
-        randoPercent = rand_float(0.0, totalPercent)
-        # Find the match
-        totalPercent = 0.0
-        for race, percent in self.race_lookup.items():
-            totalPercent += percent
-            if randoPercent <= totalPercent:
-                if race in HUMAN_ETHNICITY_LIST:
-                    return GG_Globals.GG_CITY_RACE_HUMAN
-                else:
-                    return race
+        return self.raceSampler.sample(engine=engine or self.rando)
 
-        # DONE
-        raise RuntimeError("Race not found")
+    def rando_city_races(self, numRaces, engine=None):
+        """Randomize a list of numRaces ancestries weighted by the city's demographics"""
+        if not self.raceSampler:
+            raise RuntimeError("Race percentages not found")
+        return self.raceSampler.sample(numRaces, engine or self.rando)
 
-    def rando_human_ethnicity(self):
-        # LOCAL VARIABLES
-        totalPercent = float(0.0)  # Running total of percentages
-
-        # DETERMINE ETHNICITY
-        # Add total percents
-        totalPercent = self._total_human_ethnic_percentages()
-        # Rando a number
-        randoPercent = rand_float(0.0, totalPercent)
-        # Find the match
-        totalPercent = 0.0
-        for humanEthnicity in HUMAN_ETHNICITY_LIST:
-            totalPercent += self.race_lookup[humanEthnicity]
-            if randoPercent <= totalPercent:
-                return humanEthnicity
+    def rando_human_ethnicity(self, engine=None):
+        """Randomize a human ethnicity weighted by the city's demographics"""
+        if not self.ethnicitySampler:
+            raise RuntimeError("Human ethnicity not found")
+        return self.ethnicitySampler.sample(engine=engine or self.rando)
 
-        # DONE
-        raise RuntimeError("Human ethnicity not found")
+    def rando_human_ethnicities(self, numEthnicities, engine=None):
+        """Randomize a list of numEthnicities human ethnicities weighted by the demographics"""
+        if not self.ethnicitySampler:
+            raise RuntimeError("Human ethnicity not found")
+        return self.ethnicitySampler.sample(numEthnicities, engine or self.rando)
 
     def print_city_details(self):
         # GENERAL
@@ -142,96 +300,21 @@ class GG_City:
             for npc in self.npcs:
                 print("    {}".format(npc))
 
-    def rando_npc_class_level(self, minLevel=1):
+    def rando_npc_class_level(self, minLevel=1, engine=None):
         """Randomize a class and level based on city statistics.
 
         Randomize a class and level based on city statistics: tuple(("class": str, level: int)).
         """
         # LOCAL VARIABLES
-        retRando = None  # tuple(("class", level))
+        (cumulativeCounts, citizenList) = self.npcLevelIndex.get(minLevel, ([], []))
 
         # FIND A CITIZEN
-        # 1. Find valid NPC class dictionaries
-        npcClassLevelList = self._find_valid_npc_dicts(minLevel)
-
-        # 2. Count the available population
-        if npcClassLevelList:
-            validPopCount = self._count_valid_npcs(npcClassLevelList, minLevel=minLevel)
-        else:
-            raise RuntimeError(f"Unable to find a citizen of minimum level {minLevel}")
-
-        # 3. Randomize a citizen number
-        if validPopCount > 0:
-            randoCitizen = rand_integer(1, validPopCount)  # Random citizen
-        else:
-            raise RuntimeError(f"Unable to find a citizen of minimum level {minLevel}")
-
-        # 4. Find that citizen
-        if randoCitizen > 0:
-            retRando = self._find_a_citizen(npcClassLevelList, randoCitizen, minLevel=minLevel)
-        else:
+        if not cumulativeCounts:
             raise RuntimeError(f"Unable to find a citizen of minimum level {minLevel}")
+        randoCitizen = rand_integer(1, cumulativeCounts[-1], engine or self.rando)
 
         # DONE
-        return retRando
-
-    def _find_valid_npc_dicts(self, minLevel=1):
-        """Returns a list of npcClassLevels dicts that contain at least one match for minLevel"""
-        # LOCAL VARIABLES
-        retList = []
-
-        # SEARCH DICTIONARIES
-        for (nclKey, nclValue) in self.npcClassLevels.items():
-            # Skip it if it's empty
-            if nclValue["Total"] > 0:
-                for (nclvKey, nclvValue) in nclValue["Dict"].items():
-                    if nclvKey >= minLevel and nclvValue > 0:
-                        retList.append({nclKey: nclValue})
-                        break
-
-        # DONE
-        return retList
-
-    def _count_valid_npcs(self, classDictList, minLevel=1):
-        # LOCAL VARIABLES
-        retCount = 0
-
-        # VALIDATION
-        # If minimum level is 1, return the sum of all the totals
-        if minLevel == 1:
-            for classDict in classDictList:
-                for value in classDict.values():
-                    retCount += value["Total"]
-        else:
-            for classDict in classDictList:
-                for value in classDict.values():
-                    for (level, number) in value["Dict"].items():
-                        if level >= minLevel and number > 0:
-                            retCount += number
-
-        # DONE
-        return retCount
-
-    def _find_a_citizen(self, classDictList, citizenNum, minLevel=1):
-        # LOCAL VARIABLES
-        localClass = None  # Random citizen's class
-        localLevel = None  # Random citizen's level
-        localCitNum = citizenNum  # Local copy of citizenNum to decrement
-
-        # FIND THE CITIZEN
-        for classDict in classDictList:
-            for value in classDict.values():
-                for (level, number) in value["Dict"].items():
-                    if level >= minLevel and number > 0:
-                        if localCitNum <= number:
-                            localClass = list(classDict.keys())[0]  # Class name is the only key
-                            localLevel = level
-                            return tuple((localClass, localLevel))
-                        else:
-                            localCitNum -= number
-
-        raise RuntimeError(f'Unable to find citizen number {citizenNum} of '
-                           f'minimum level {minLevel}')
+        return citizenList[bisect_left(cumulativeCounts, randoCitizen)]
 
     def _validate_city(self):
         """Validate the contents of cityDict"""
@@ -368,8 +451,7 @@ class GG_City:
                     raise TypeError("Unknown qualities entry")
                 # Parse entries
                 for quality in qualities:
-                    if quality not in self.supportedQualities \
-                      and not quality.startswith("Racially Intolerant"):
+                    if get_city_rules().match("qualities", quality) is None:
                         raise RuntimeError("Unsupported quality")
 
     def _validate_defined(self):
@@ -427,10 +509,6 @@ class GG_City:
             if localType not in self.settlementStatistics.keys():
                 raise RuntimeError("Invalid city type")
 
-    def _complete_city(self):
-        self._rando_city()  # Must come first unless population is already defined
-        self._calculate_city()
-
     def _rando_city(self):
         """Randomize elements of a city not included in the config"""
         if self.randoPopulation:
@@ -452,17 +530,17 @@ class GG_City:
     def _rando_population(self):
         """Randomizes a population into self.cityDict"""
         self.cityDict["city"]["population"] = str(rand_integer(CITY_SIZE_LIMITS[0],
-                                                               CITY_SIZE_LIMITS[1]))
+                                                               CITY_SIZE_LIMITS[1], self.rando))
 
     def _rando_disadvantage(self):
         """Randomize one disadvantage into self.cityDict"""
-        self.cityDict["city"]["disadvantages"] = [random.choice(self.supportedDisadvantages)]
+        self.cityDict["city"]["disadvantages"] = [self.rando.choice(self.supportedDisadvantages)]
 
     def _rando_alignment(self):
         """Randomize one alignment into self.cityDict"""
         # Rando
-        localAlignment = random.choice(self.supportedEthics) + " " \
-            + random.choice(self.supportedMoralities)
+        localAlignment = self.rando.choice(self.supportedEthics) + " " \
+            + self.rando.choice(self.supportedMoralities)
         # Update True Neutral
         if localAlignment == "Neutral Neutral":
             localAlignment = "Neutral"
@@ -471,20 +549,24 @@ class GG_City:
 
     def _rando_government(self):
         """Randomize a government into self.cityDict"""
-        self.cityDict["city"]["government"] = random.choice(self.supportedGovernments)
+        self.cityDict["city"]["government"] = self.rando.choice(self.supportedGovernments)
 
-    def _calculate_city(self):
-        """Calculate all the details of a city not already calculated in the config"""
-        # Calculate this first since the settlement statistics are derived from it
+    def _complete_city_type(self):
+        """Calculate the city type, if the config didn't define it"""
+        # The settlement statistics are derived from the type
         if self.calcType:
             self._calc_city_type()
             self.calcType = False
 
-        # Moved from _rando_city since the "type" should be defined before the qualities
+    def _complete_city_qualities(self):
+        """Randomize the qualities, if the config didn't define them"""
+        # The "type" must be defined before the qualities
         if self.randoQualities:
             self._rando_city_qualities()
             self.randoQualities = False
 
+    def _complete_city_base_value(self):
+        """Calculate the base value, if the config didn't define it"""
         if self.calcBaseValue:
             self._calc_city_base_value()
             self.calcBaseValue = False
@@ -496,20 +578,8 @@ class GG_City:
             # 2. Hard code some responses into a method
             self.calcMagicItems = False
 
-        # Always calculate modifiers
-        self._calc_city_modifiers()
-
-        # Always calculate purchase limit
-        self._calc_city_purchase_limit()
-
-        # Always calculate spellcasting
-        self._calc_city_spellcasting()
-
-        # Magic Items
-        # TO DO: DON'T DO NOW
-
-        # NPCs
-        # Moved randomization validation downwards
+    def _complete_city_npcs(self):
+        """Randomize the NPC class totals, and the NPC list if the config didn't define one"""
         # Some 'consumers' of the GG_City class need some randomized totals regardless of what's
         # already been calculated
         self._rando_city_npcs()
@@ -523,22 +593,11 @@ class GG_City:
             population = locale.atoi(population)
 
         # Translate Population to Type
-        if population <= 20:
-            localType = "Thorp"
-        elif population <= 60:
-            localType = "Hamlet"
-        elif population <= 200:
-            localType = "Village"
-        elif population <= 2000:
-            localType = "Small Town"
-        elif population <= 5000:
-            localType = "Large Town"
-        elif population <= 10000:
-            localType = "Small City"
-        elif population <= 25000:
-            localType = "Large City"
-        else:
-            localType = "Metropolis"
+        localType = "Metropolis"
+        for (cityType, maxPopulation) in self.settlementPopulations.items():
+            if population <= maxPopulation:
+                localType = cityType
+                break
 
         # Verify Type
         assert (localType in self.settlementStatistics.keys()), "Invalid city type"
@@ -558,7 +617,7 @@ class GG_City:
 
         # RANDO QUALITIES
         while len(localQualList) < numQuals:
-            tempQual = random.choice(self.supportedQualities)
+            tempQual = self.rando.choice(self.supportedQualities)
             if tempQual not in localQualList:
                 localQualList.append(tempQual)
 
@@ -572,31 +631,7 @@ class GG_City:
         """
         # LOCAL VARIABLES
         localBaseValue = self.settlementStatistics[self.cityDict["city"]["type"]]["Base Value"]
-        adjustPercent = 100
-
-        # CALCULATE ADJUSTMENTS
-        # Qualities
-        if "Magically Attuned" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 20
-        if "Notorious" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 30
-        if "Prosperous" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 30
-        if "Strategic Location" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 10
-        if "Tourist Attraction" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 20
-
-        # Disadvantages
-        try:
-            if "Hunted" in self.cityDict["city"]["disadvantages"]:
-                adjustPercent -= 20
-            if "Impoverished" in self.cityDict["city"]["disadvantages"]:
-                adjustPercent -= 50
-            if "Plagued" in self.cityDict["city"]["disadvantages"]:
-                adjustPercent -= 20
-        except KeyError:
-            pass  # Disadvantages are not mandatory
+        adjustPercent = 100 + self._calc_city_rule_deltas()["base_value"]
 
         # ADJUST BASE VALUE
         localBaseValue = localBaseValue * adjustPercent * .01
@@ -609,19 +644,22 @@ class GG_City:
         #   modifiers:
         self.baseCityModifier = \
             self.settlementStatistics[self.cityDict["city"]["type"]]["Modifiers"]
-        self.cityDict["city"]["modifiers"] = {}  # Reset
-        #     corruption:
-        self._calc_city_modifier_corruption()
-        #     crime:
-        self._calc_city_modifier_crime()
-        #     economy:
-        self._calc_city_modifier_economy()
-        #     law:
-        self._calc_city_modifier_law()
-        #     lore:
-        self._calc_city_modifier_lore()
-        #     society:
-        self._calc_city_modifier_society()
+        ruleDeltas = self._calc_city_rule_deltas()
+        #     corruption, crime, economy, law, lore, society:
+        self.cityDict["city"]["modifiers"] = {
+            modifier.lower(): str(self.baseCityModifier + ruleDeltas[modifier.lower()])
+            for modifier in CITY_MODIFIER_LIST}
+
+    def _calc_city_rule_deltas(self):
+        """Return the settlement rule deltas of the city's features as {stat: delta}.
+
+        See: gg_city_rules.CITY_RULES for the rules of each alignment, government, quality, and
+        disadvantage.
+        """
+        details = self.cityDict["city"]
+        return dict(zip(CITY_RULE_STATS, get_city_rules().total_deltas(
+            details["alignment"], details["government"], details["qualities"],
+            details.get("disadvantages"))))
 
     def _calc_city_purchase_limit(self):
         """Calculate and store the city's purchase limit.
@@ -632,23 +670,7 @@ class GG_City:
         # LOCAL VARIABLES
         localPurchaseLimit = \
             self.settlementStatistics[self.cityDict["city"]["type"]]["Purchase Limit"]
-        adjustPercent = 100
-
-        # CALCULATE ADJUSTMENTS
-        # Qualities
-        if "Magically Attuned" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 20
-        if "Notorious" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 50
-        if "Prosperous" in self.cityDict["city"]["qualities"]:
-            adjustPercent += 50
-
-        # Disadvantages
-        try:
-            if "Impoverished" in self.cityDict["city"]["disadvantages"]:
-                adjustPercent -= 50
-        except KeyError:
-            pass  # Disadvantages are not mandatory
+        adjustPercent = 100 + self._calc_city_rule_deltas()["purchase_limit"]
 
         # ADJUST BASE LIMIT
         localPurchaseLimit = localPurchaseLimit * adjustPercent * .01
@@ -659,32 +681,18 @@ class GG_City:
     def _calc_city_spellcasting(self):
         """Calculate and store city's spellcasting.
 
-        Calculate the city's spellcasting, adjust for qualities/disadvantages, then store it in
+        Calculate the city's spellcasting, adjust for government/qualities, then store it in
         city dict.
         """
         # LOCAL VARIABLES
         localSpellcasting = self.settlementStatistics[self.cityDict["city"]["type"]]["Spellcasting"]
 
         # CALCULATE ADJUSTMENTS
-        # Government
-        if self.cityDict["city"]["government"] == "Magical":
-            localSpellcasting += 1
-
-        # Qualities
-        if "Academic" in self.cityDict["city"]["qualities"]:
-            localSpellcasting += 1
-        if "Holy Site" in self.cityDict["city"]["qualities"]:
-            localSpellcasting += 2
-        if "Magically Attuned" in self.cityDict["city"]["qualities"]:
-            localSpellcasting += 2
-        if "Pious" in self.cityDict["city"]["qualities"]:
-            localSpellcasting += 1
-        if "Superstitious" in self.cityDict["city"]["qualities"]:
-            localSpellcasting -= 2
+        localSpellcasting += self._calc_city_rule_deltas()["spellcasting"]
 
         # Max Spell Level
-        if localSpellcasting > 10:
-            localSpellcasting = 10
+        if localSpellcasting > CITY_MAX_SPELLCASTING:
+            localSpellcasting = CITY_MAX_SPELLCASTING
 
         # DONE
         self.cityDict["city"]["spellcasting"] = str(localSpellcasting)
@@ -698,35 +706,10 @@ class GG_City:
         self._update_city_npc_multiplier()
 
         # CALCUALTE NPCs
-        # Adept 1d6 + community modifier (Task 5-6)
-        # Alchemist 1d4 + community modifier (Class)
-        self._rando_city_npc_alchemists()
-        # Aristocrat 1d4 + community modifier (Task 5-6)
-        # Barbarian* 1d4 + community modifier (Class)
-        self._rando_city_npc_barbarians()
-        # Bard 1d6 + community modifier (Class)
-        self._rando_city_npc_bards()
-        # Champion (Paladin) 1d3 + community modifier (Class)
-        self._rando_city_npc_champions()
-        # Cleric 1d6 + community modifier (Class)
-        self._rando_city_npc_clerics()
-        # Commoner 4d4 + community modifier (Task 5-6)
-        # Druid 1d6 + community modifier (Class)
-        self._rando_city_npc_druids()
-        # Expert 3d4 + community modifier (Task 5-6)
-        # Fighter 1d8 + community modifier (Class)
-        self._rando_city_npc_fighters()
-        # Monk* 1d4 + community modifier (Class)
-        self._rando_city_npc_monks()
-        # Ranger 1d3 + community modifier (Class)
-        self._rando_city_npc_rangers()
-        # Rogue 1d8 + community modifier (Class)
-        self._rando_city_npc_rogues()
-        # Sorcerer 1d4 + community modifier (Class)
-        self._rando_city_npc_sorcerers()
-        # Warrior 2d4 + community modifier (Task 5-6)
-        # Wizard 1d4 + community modifier (Class)
-        self._rando_city_npc_wizards()
+        # Adept, aristocrat, commoner, expert, and warrior NPCs make up the remaining population
+        for className in self.npcClassDice:
+            (numDice, numFaces) = self._get_npc_class_dice(className)
+            self._rando_npc_class(className, numDice, numFaces)
 
         # Remaining Population
         # Take the remaining population after all other characters are generated
@@ -742,25 +725,17 @@ class GG_City:
     def _rando_remaining_npc_population(self):
         # LOCAL VARIABLES
         currentRemainingPop = int(self.cityDict["city"]["population"])
-        remainderDict = {"aristocrat": 0, "adept": 0, "expert": 0, "warrior": 0, "commoner": 0}
+        remainderDict = {className: 0 for className in self.npcRemainderRates}
+        remainderDict["commoner"] = 0
 
         # 1. Determine remaining population
-        for valueDict in self.npcClassLevels.values():
-            currentRemainingPop -= valueDict["Total"]
+        currentRemainingPop -= self._npcLevelTable.get_population()
         # Account for underflow population
         if currentRemainingPop > 0:
             # 2. Calcualate remaining totals
-            remainderDict["aristocrat"] = int(currentRemainingPop * .005)
-            remainderDict["adept"] = int(currentRemainingPop * .005)
-            remainderDict["expert"] = int(currentRemainingPop * .03)
-            remainderDict["warrior"] = int(currentRemainingPop * .05)
-            remainderDict["commoner"] = (currentRemainingPop
-                                         - remainderDict["aristocrat"] - remainderDict["adept"]
-                                         - remainderDict["expert"] - remainderDict["warrior"])
-            assert ((remainderDict["aristocrat"] + remainderDict["adept"]
-                     + remainderDict["expert"] + remainderDict["warrior"]
-                     + remainderDict["commoner"]) == currentRemainingPop), \
-                   "Remaining population miscalculation"
+            for (className, rate) in self.npcRemainderRates.items():
+                remainderDict[className] = int(currentRemainingPop * rate)
+            remainderDict["commoner"] = currentRemainingPop - sum(remainderDict.values())
         else:
             for key in remainderDict.keys():
                 remainderDict[key] = 0
@@ -775,34 +750,20 @@ class GG_City:
         cityType = self.cityDict["city"]["type"]
 
         # UPDATE MULTIPLIER
-        if cityType == "Metropolis":
-            self.npcMultiplier = 4
-        elif cityType == "Large City":
-            self.npcMultiplier = 3
-        elif cityType == "Small City":
-            self.npcMultiplier = 2
-        elif cityType:
-            self.npcMultiplier = 1
-        else:
+        if not cityType:
             raise RuntimeError("Invalid city type found in cityDict")
+        self.npcMultiplier = self.npcMultipliers.get(cityType, 1)
 
-    def _rando_city_npc_alchemists(self):
-        # LOCAL VARIABLES
-        upperLimit = 4  # Alchemist 1d4
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("alchemist", 1, upperLimit)
-
-    def _rando_city_npc_barbarians(self):
-        # LOCAL VARIABLES
-        upperLimit = 4  # Barbarian* 1d4
-
-        # CALCULATE TOTAL
-        # Adjust limit
-        if self._are_barbarians_common():
-            upperLimit = 8
-        # Rando levels
-        self._rando_npc_class("barbarian", 1, upperLimit)
+    def _get_npc_class_dice(self, className):
+        """Return the (numDice, numFaces) rolled for className's highest levels in this city"""
+        try:
+            (commonDice, isCommon) = self.npcCommonClassDice[className]
+        except KeyError:
+            pass  # Same dice everywhere
+        else:
+            if getattr(self, isCommon)():
+                return commonDice
+        return self.npcClassDice[className]
 
     def _are_barbarians_common(self):
         return self._determine_human_barbarian_average() >= self._determine_human_ethnic_average()
@@ -852,52 +813,6 @@ class GG_City:
 
         return retAverage
 
-    def _rando_city_npc_bards(self):
-        # LOCAL VARIABLES
-        upperLimit = 6  # Bard 1d6
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("bard", 1, upperLimit)
-
-    def _rando_city_npc_champions(self):
-        # LOCAL VARIABLES
-        upperLimit = 3  # Champion (Paladin) 1d3
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("champion", 1, upperLimit)
-
-    def _rando_city_npc_clerics(self):
-        # LOCAL VARIABLES
-        upperLimit = 6  # Cleric 1d6
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("cleric", 1, upperLimit)
-
-    def _rando_city_npc_druids(self):
-        # LOCAL VARIABLES
-        upperLimit = 6  # Druid 1d6
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("druid", 1, upperLimit)
-
-    def _rando_city_npc_fighters(self):
-        # LOCAL VARIABLES
-        upperLimit = 8  # Fighter 1d8
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("fighter", 1, upperLimit)
-
-    def _rando_city_npc_monks(self):
-        # LOCAL VARIABLES
-        upperLimit = 4  # Monk* 1d4
-
-        # CALCULATE TOTAL
-        # Adjust limit
-        if self._are_monks_common():
-            upperLimit = 8
-        # Rando levels
-        self._rando_npc_class("monk", 1, upperLimit)
-
     def _are_monks_common(self):
         """Determine if monk-centric races/ethnicities/subgroups are common"""
         return self._determine_human_monk_average() >= self._determine_human_ethnic_average()
@@ -905,298 +820,50 @@ class GG_City:
     def _determine_human_monk_average(self):
         return self.cityDict["city"]["ancestry"]["Human"][GG_Globals.GG_CITY_RACE_TIAN]
 
-    def _rando_city_npc_rangers(self):
-        # LOCAL VARIABLES
-        upperLimit = 3  # Ranger 1d3
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("ranger", 1, upperLimit)
-
-    def _rando_city_npc_rogues(self):
-        # LOCAL VARIABLES
-        upperLimit = 8  # Rogue 1d8
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("rogue", 1, upperLimit)
-
-    def _rando_city_npc_sorcerers(self):
-        # LOCAL VARIABLES
-        upperLimit = 4  # Sorcerer 1d4
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("sorcerer", 1, upperLimit)
-
-    def _rando_city_npc_wizards(self):
-        # LOCAL VARIABLES
-        upperLimit = 4  # Wizard 1d4
-
-        # CALCULATE TOTAL
-        self._rando_npc_class("wizard", 1, upperLimit)
-
     def _rando_npc_class(self, className, numDice, numFaces):
         # LOCAL VARIABLES
-        levelDict = {}
-        charLevel = 1  # Current level being enumerated for this class
-        numOfThatLevel = 1  # Number of NPCs at level "charLevel"
-
-        # Initialize the dictionary
-        for level in range(1, 21):
-            levelDict[level] = 0  # Initialize each level
+        levelCounts = [0] * NPC_MAX_LEVEL  # Number of NPCs of each level, starting at 1
 
         # CALCULATE LEVELS
-        for _ in range(self.npcMultiplier):
-            numOfThatLevel = 1  # Reset temp variable
-            charLevel = self._calc_highest_level(numDice, numFaces)
-            if charLevel > 0:
-                levelDict[charLevel] += numOfThatLevel
-                while charLevel >= 2:
-                    charLevel = math.ceil(charLevel / 2)
-                    numOfThatLevel *= 2
-                    levelDict[charLevel] += numOfThatLevel
-
-        # Validation of calcualting NPCs moved down to ensure this class always...
+        for highestLevel in self._calc_highest_levels(numDice, numFaces, self.npcMultiplier):
+            for (charLevel, numOfThatLevel) in get_npc_level_chain(highestLevel):
+                levelCounts[charLevel - 1] += numOfThatLevel
+
+        # Always store the class's levels for the sake of class-based randomization...
+        self._npcLevelTable.set_levels(className, levelCounts)
+        # ...but only list them if the config didn't define the NPCs
         if self.calcNPCs:
-            self._translate_level_dict_into_npc_list(className, levelDict)
-        # ...calculates total 'population' of each class for the sake of class-based randomization
-        self._update_npc_class_totals(className, levelDict)
+            self._translate_level_counts_into_npc_list(className)
 
     def _set_npc_class(self, className, charLevel, numOfThatLevel):
-        levelDict = {charLevel: numOfThatLevel}
-
-        # Validation of calcualting NPCs moved down to ensure this class always...
+        # Always store the class's levels for the sake of class-based randomization...
+        self._npcLevelTable.set_level(className, charLevel, numOfThatLevel)
+        # ...but only list them if the config didn't define the NPCs
         if self.calcNPCs:
-            self._translate_level_dict_into_npc_list(className, levelDict)
-        # ...calculates total 'population' of each class for the sake of class-based randomization
-        self._update_npc_class_totals(className, levelDict)
-
-    def _calc_highest_level(self, numDice, numFaces):
-        """Return the highest NPC level given numDice-d-numFaces + self.baseCityModifier"""
-        # LOCAL VARIABLES
-        runningTotal = 0
-
-        # ADD IT UP
-        for _ in range(numDice):
-            runningTotal += rand_integer(1, numFaces)
-        runningTotal += self.baseCityModifier
+            self._translate_level_counts_into_npc_list(className)
 
-        # DONE
-        return runningTotal
+    def _calc_highest_levels(self, numDice, numFaces, numRolls):
+        """Return a list of numRolls highest NPC levels, rolled at once"""
+        return compile_dice(f'{numDice}d{numFaces}+mod').roll_many(numRolls, self.rando,
+                                                                    mod=self.baseCityModifier)
 
-    def _translate_level_dict_into_npc_list(self, className, levelDict):
+    def _translate_level_counts_into_npc_list(self, className):
+        """Append className's npcLevelTable entries to the NPC list, highest level first"""
         # LOCAL VARIABLES
-        sortedDictKeys = list(levelDict.keys())
-        sortedDictKeys.sort(reverse=True)
+        levelCounts = self._npcLevelTable.get_levels(className)
         npcListEntry = ""
-        numToWord = inflect.engine()
 
-        for level in sortedDictKeys:
-            if levelDict[level] > 0:
-                npcListEntry = numToWord.number_to_words(levelDict[level]).capitalize() + " " \
-                               + numToWord.ordinal(level) + " level " + className
-                if levelDict[level] > 1:
+        for level in range(NPC_MAX_LEVEL, 0, -1):
+            numOfThatLevel = levelCounts[level - 1]
+            if numOfThatLevel > 0:
+                npcListEntry = number_to_words(numOfThatLevel).capitalize() + " " \
+                               + ordinal(level) + " level " + className
+                if numOfThatLevel > 1:
                     npcListEntry = npcListEntry + "s"
                 self.cityDict["city"]["npcs"].append(npcListEntry)
 
-    def _update_npc_class_totals(self, className, levelDict):
-        # LOCAL VARIABLES
-        classTotal = 0
-
-        for value in levelDict.values():
-            classTotal += value
-
-        self.npcClassLevels[className] = {"Total": classTotal, "Dict": levelDict}
-
-    def _calc_city_modifier_corruption(self):
-        # LOCAL VARIABLES
-        localCorruption = self.baseCityModifier
-
-        # Alignment
-        if self.cityDict["city"]["alignment"].endswith("Evil"):
-            localCorruption += 1
-
-        # Government
-        if self.cityDict["city"]["government"] == "Magical":
-            localCorruption -= 2
-        elif self.cityDict["city"]["government"] == "Overlord":
-            localCorruption += 2
-        elif self.cityDict["city"]["government"] == "Secret Syndicate":
-            localCorruption += 2
-
-        # Qualities
-        if "Holy Site" in self.cityDict["city"]["qualities"]:
-            localCorruption -= 2
-
-        # Disadvantages
-        try:
-            if "Anarchy" in self.cityDict["city"]["disadvantages"]:
-                localCorruption += 4
-            if "Impoverished" in self.cityDict["city"]["disadvantages"]:
-                localCorruption += 1
-        except KeyError:
-            pass  # Disadvantages are not mandatory
-
-        # DONE
-        self.cityDict["city"]["modifiers"].update({"corruption": str(localCorruption)})
-
-    def _calc_city_modifier_crime(self):
-        # LOCAL VARIABLES
-        localCrime = self.baseCityModifier
-
-        # Alignment
-        if self.cityDict["city"]["alignment"].startswith("Chaotic"):
-            localCrime += 1
-
-        # Government
-        if self.cityDict["city"]["government"] == "Overlord":
-            localCrime -= 2
-        elif self.cityDict["city"]["government"] == "Secret Syndicate":
-            localCrime += 2
-
-        # Qualities
-        if "Insular" in self.cityDict["city"]["qualities"]:
-            localCrime -= 1
-        if "Notorious" in self.cityDict["city"]["qualities"]:
-            localCrime += 1
-        if "Superstitious" in self.cityDict["city"]["qualities"]:
-            localCrime -= 4
-
-        # Disadvantages
-        try:
-            if "Anarchy" in self.cityDict["city"]["disadvantages"]:
-                localCrime += 4
-            if "Impoverished" in self.cityDict["city"]["disadvantages"]:
-                localCrime += 1
-        except KeyError:
-            pass  # Disadvantages are not mandatory
-
-        # DONE
-        self.cityDict["city"]["modifiers"].update({"crime": str(localCrime)})
-
-    def _calc_city_modifier_economy(self):
-        # LOCAL VARIABLES
-        localEconomy = self.baseCityModifier
-
-        # Government
-        if self.cityDict["city"]["government"] == "Secret Syndicate":
-            localEconomy += 2
-
-        # Qualities
-        if "Prosperous" in self.cityDict["city"]["qualities"]:
-            localEconomy += 1
-        if "Strategic Location" in self.cityDict["city"]["qualities"]:
-            localEconomy += 1
-        if "Tourist Attraction" in self.cityDict["city"]["qualities"]:
-            localEconomy += 1
-
-        # Disadvantages
-        try:
-            if "Anarchy" in self.cityDict["city"]["disadvantages"]:
-                localEconomy -= 4
-            if "Hunted" in self.cityDict["city"]["disadvantages"]:
-                localEconomy -= 4
-        except KeyError:
-            pass  # Disadvantages are not mandatory
-
-        # DONE
-        self.cityDict["city"]["modifiers"].update({"economy": str(localEconomy)})
-
-    def _calc_city_modifier_law(self):
-        # LOCAL VARIABLES
-        localLaw = self.baseCityModifier
-
-        # Alignment
-        if self.cityDict["city"]["alignment"].startswith("Lawful"):
-            localLaw += 1
-
-        # Government
-        if self.cityDict["city"]["government"] == "Council":
-            localLaw -= 2
-        elif self.cityDict["city"]["government"] == "Overlord":
-            localLaw += 2
-        elif self.cityDict["city"]["government"] == "Secret Syndicate":
-            localLaw -= 6
-
-        # Qualities
-        if "Insular" in self.cityDict["city"]["qualities"]:
-            localLaw += 1
-        if "Notorious" in self.cityDict["city"]["qualities"]:
-            localLaw -= 1
-        if "Superstitious" in self.cityDict["city"]["qualities"]:
-            localLaw += 2
-
-        # Disadvantages
-        try:
-            if "Anarchy" in self.cityDict["city"]["disadvantages"]:
-                localLaw -= 6
-            if "Hunted" in self.cityDict["city"]["disadvantages"]:
-                localLaw -= 4
-        except KeyError:
-            pass  # Disadvantages are not mandatory
-
-        # DONE
-        self.cityDict["city"]["modifiers"].update({"law": str(localLaw)})
-
-    def _calc_city_modifier_lore(self):
-        # LOCAL VARIABLES
-        localLore = self.baseCityModifier
-
-        # Alignment
-        if self.cityDict["city"]["alignment"] == "Neutral":
-            localLore += 2
-        elif self.cityDict["city"]["alignment"].endswith("Neutral"):
-            localLore += 1
-
-        # Government
-        if self.cityDict["city"]["government"] == "Council":
-            localLore -= 2
-        elif self.cityDict["city"]["government"] == "Magical":
-            localLore += 2
-
-        # Qualities
-        if "Academic" in self.cityDict["city"]["qualities"]:
-            localLore += 1
-        if "Rumormongering Citizens" in self.cityDict["city"]["qualities"]:
-            localLore += 1
-
-        # DONE
-        self.cityDict["city"]["modifiers"].update({"lore": str(localLore)})
-
-    def _calc_city_modifier_society(self):
-        # LOCAL VARIABLES
-        localSociety = self.baseCityModifier
-
-        # Alignment
-        if self.cityDict["city"]["alignment"].endswith("Good"):
-            localSociety += 1
-
-        # Government
-        if self.cityDict["city"]["government"] == "Council":
-            localSociety += 4
-        elif self.cityDict["city"]["government"] == "Magical":
-            localSociety -= 2
-        elif self.cityDict["city"]["government"] == "Overlord":
-            localSociety -= 2
-
-        # Qualities
-        if "Rumormongering Citizens" in self.cityDict["city"]["qualities"]:
-            localSociety -= 1
-        if "Superstitious" in self.cityDict["city"]["qualities"]:
-            localSociety += 2
-
-        # Disadvantages
-        try:
-            if "Anarchy" in self.cityDict["city"]["disadvantages"]:
-                localSociety -= 4
-            if "Hunted" in self.cityDict["city"]["disadvantages"]:
-                localSociety -= 4
-        except KeyError:
-            pass  # Disadvantages are not mandatory
-
-        # DONE
-        self.cityDict["city"]["modifiers"].update({"society": str(localSociety)})
-
-    def _parse_city(self):
-        """Parse the cityDict contents into attributes"""
+    def _parse_demographics(self):
+        """Parse the cityDict's name, region, and ancestry percentages into attributes"""
         details_dict = self.cityDict[GG_Globals.GG_CITY_KEY]
         city_ethnicity = details_dict[GG_Globals.GG_CITY_RACE_KEY]
 
@@ -1213,39 +880,24 @@ class GG_City:
                         self.race_lookup[human_ethnicity] = 0
             else:
                 self.race_lookup[ancestry] = get_key_value(city_ethnicity, ancestry)
+        self._build_demographic_samplers()
 
-        # GENERAL
-        self.name = self.cityDict["city"]["name"]
-        self.region = self.cityDict["city"]["region"]
-        self.alignment = self.cityDict["city"]["alignment"]
-        self.cityType = self.cityDict["city"]["type"]
-        self.baseValue = int(self.cityDict["city"]["base_value"])
-        self.purchaseLimit = int(self.cityDict["city"]["purchase_limit"])
-        self.spellcasting = int(self.cityDict["city"]["spellcasting"])
-        self.government = self.cityDict["city"]["government"]
-        self.population = int(self.cityDict["city"]["population"])
-        self.npcs = self.cityDict["city"]["npcs"]
-        self.qualities = self.cityDict["city"]["qualities"]
-
-        # MODIFIERS
-        self.cityCorruption = int(self.cityDict["city"]["modifiers"]["corruption"])
-        self.cityCrime = int(self.cityDict["city"]["modifiers"]["crime"])
-        self.cityEconomy = int(self.cityDict["city"]["modifiers"]["economy"])
-        self.cityLaw = int(self.cityDict["city"]["modifiers"]["law"])
-        self.cityLore = int(self.cityDict["city"]["modifiers"]["lore"])
-        self.citySociety = int(self.cityDict["city"]["modifiers"]["society"])
-        self.modifierLookup = OrderedDict([("Corruption", self.cityCorruption),
-                                           ("Crime", self.cityCrime),
-                                           ("Economy", self.cityEconomy),
-                                           ("Law", self.cityLaw),
-                                           ("Lore", self.cityLore),
-                                           ("Society", self.citySociety)])
-
-        # DISADVANTAGES
+    def _build_demographic_samplers(self):
+        """Build the race and human ethnicity alias tables from race_lookup"""
+        # Human ethnicities are drawn as Human, then rando_human_ethnicity() picks which
         try:
-            self.disadvantages = self.cityDict["city"]["disadvantages"]
-        except KeyError:
-            self.disadvantages = None  # Disadvantages are not mandatory
+            self.raceSampler = GGWeightedSampler(
+                [GG_Globals.GG_CITY_RACE_HUMAN if race in HUMAN_ETHNICITY_LIST else race
+                 for race in self.race_lookup],
+                self.race_lookup.values())
+        except RuntimeError:
+            self.raceSampler = None  # No positive percentages
+        try:
+            self.ethnicitySampler = GGWeightedSampler(
+                HUMAN_ETHNICITY_LIST,
+                [self.race_lookup[humanEthnicity] for humanEthnicity in HUMAN_ETHNICITY_LIST])
+        except RuntimeError:
+            self.ethnicitySampler = None  # No positive percentages
 
     def _print_city_general_details(self):
         """Print city's details.
@@ -1416,9 +1068,6 @@ class GG_City:
 
     def _print_city_marketplace_details(self):
         """Print city's base value, purchase limit, spellcasting, and magic items"""
-        # LOCAL VARIABLES
-        numToWord = inflect.engine()
-
         # PRINT
         # Header
         print_header("MARKETPLACE")
@@ -1426,7 +1075,7 @@ class GG_City:
         # Purchase Limit
         # Spellcasting
         print(f'Base Value {self.baseValue} gp; Purchase Limit {self.purchaseLimit} gp; '
-              f'Spellcasting {numToWord.ordinal(self.spellcasting)}')
+              f'Spellcasting {ordinal(self.spellcasting)}')
 
         # Magic Items
         # See: Task 5-7
@@ -0,0 +1,107 @@
+"""Implements an on-disk cache of completed cities."""
+
+# Standard
+from typing import Final
+import hashlib
+import os
+import pickle
+# Third Party
+import yaml
+# Local
+from gamemaster_guidance import __version__
+from gamemaster_guidance.gg_city import GG_City
+from gamemaster_guidance.gg_city_rules import get_city_rules
+
+
+CITY_CACHE_DIRNAME: Final[str] = '.gg_cache'  # Default cache directory, relative to the cwd
+CITY_CACHE_EXTENSION: Final[str] = '.ggcity'
+_CITY_CACHE_FORMAT: Final[int] = 2  # Bump whenever GG_City.snapshot() changes shape
+
+
+def get_city_cache_dir():
+    """Returns the absolute path of the default city cache directory"""
+    return os.path.join(os.getcwd(), CITY_CACHE_DIRNAME)
+
+
+def city_cache_key(yaml_content):
+    """Returns the cache key of a city config: a hash of its bytes, the version, and the rules"""
+    hasher = hashlib.sha256(f'{__version__}:{_CITY_CACHE_FORMAT}:'
+                            f'{get_city_rules().fingerprint}:'.encode('utf-8'))
+    hasher.update(yaml_content)
+    return hasher.hexdigest()
+
+
+def load_city(filename, cache_dir=None, use_cache=True, rando_engine=None):
+    """Returns a GG_City for the city config filename.
+
+    The first load parses, validates, and completes the city (randomizing anything the config
+    left out) then stores the result in cache_dir (defaults to the city cache directory).  Later
+    loads of the same config, with the same package version and settlement rules, restore that
+    city without parsing or validating anything, so a city's details stay the same from session
+    to session.  Pass use_cache=False to always build a fresh city: it's loaded (validated) but
+    its other stages are only computed when first read.
+    """
+    # LOCAL VARIABLES
+    with open(filename, 'rb') as in_file:
+        yaml_content = in_file.read()
+    local_dir = cache_dir if cache_dir else get_city_cache_dir()
+    cache_filename = os.path.join(local_dir, city_cache_key(yaml_content) + CITY_CACHE_EXTENSION)
+
+    # CACHE HIT
+    if use_cache:
+        try:
+            with open(cache_filename, 'rb') as in_file:
+                return GG_City.from_snapshot(pickle.load(in_file), rando_engine)
+        except FileNotFoundError:
+            pass  # Cache miss
+        except (OSError, EOFError, KeyError, pickle.UnpicklingError) as err:
+            print(f'Ignoring unreadable city cache {cache_filename}: {repr(err)}')
+
+    # CACHE MISS
+    city_obj = GG_City(yaml.load(yaml_content, Loader=yaml.FullLoader), rando_engine)
+    if use_cache:
+        _write_city_cache(cache_filename, city_obj.snapshot())
+    else:
+        city_obj.load()  # Still report an invalid config now rather than mid-session
+
+    # DONE
+    return city_obj
+
+
+def clear_city_cache(cache_dir=None):
+    """Delete every cached city in cache_dir (defaults to the city cache directory).
+
+    Returns the number of cached cities deleted.
+    """
+    # LOCAL VARIABLES
+    num_deleted = 0
+    local_dir = cache_dir if cache_dir else get_city_cache_dir()
+
+    # DELETE
+    try:
+        with os.scandir(local_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_file() and dir_entry.name.endswith(CITY_CACHE_EXTENSION):
+                    os.remove(dir_entry.path)
+                    num_deleted += 1
+    except FileNotFoundError:
+        pass  # Nothing cached yet
+
+    # DONE
+    return num_deleted
+
+
+def _write_city_cache(cache_filename, snapshot):
+    """Atomically write one city snapshot; a failed write only costs the next load some time"""
+    temp_filename = f'{cache_filename}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
+        with open(temp_filename, 'wb') as out_file:
+            pickle.dump(snapshot, out_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_filename, cache_filename)
+    except OSError as err:
+        print(f'Unable to cache city in {cache_filename}: {repr(err)}')
+        try:
+            os.remove(temp_filename)
+        except OSError:
+            pass
@@ -0,0 +1,209 @@
+"""Defines the settlement rules: how a city's features adjust its statistics.
+
+CITY_RULES is the rule table.  Each alignment, government, quality, and disadvantage maps to
+its deltas for the CITY_RULE_STATS: modifier points, base value and purchase limit percentage
+points, and spellcasting levels.  The table is compiled into integer-coded lookup vectors so a
+city's statistics are the sum of one vector per feature.  House rules (e.g., new qualities) are
+added with load_city_rules() instead of code changes.
+"""
+
+# Standard
+from typing import Dict, Final, List
+import copy
+import hashlib
+# Third Party
+import yaml
+# Local
+
+
+# Statistics adjusted by the rules, in delta vector order
+CITY_RULE_STATS: Final[List[str]] = ['corruption', 'crime', 'economy', 'law', 'lore', 'society',
+                                     'base_value', 'purchase_limit', 'spellcasting']
+CITY_MAX_SPELLCASTING: Final[int] = 10  # Highest spellcasting level a city can have
+# {feature kind: {feature: {stat: delta}}}; stats left out of an entry aren't adjusted
+CITY_RULES: Final[Dict[str, Dict[str, Dict[str, int]]]] = {
+    'alignment': {
+        'Lawful Good': {'law': 1, 'society': 1},
+        'Lawful Neutral': {'law': 1, 'lore': 1},
+        'Lawful Evil': {'corruption': 1, 'law': 1},
+        'Neutral Good': {'society': 1},
+        'Neutral': {'lore': 2},
+        'Neutral Evil': {'corruption': 1},
+        'Chaotic Good': {'crime': 1, 'society': 1},
+        'Chaotic Neutral': {'crime': 1, 'lore': 1},
+        'Chaotic Evil': {'corruption': 1, 'crime': 1},
+    },
+    'government': {
+        'Autocracy': {},
+        'Council': {'law': -2, 'lore': -2, 'society': 4},
+        'Magical': {'corruption': -2, 'lore': 2, 'society': -2, 'spellcasting': 1},
+        'Overlord': {'corruption': 2, 'crime': -2, 'law': 2, 'society': -2},
+        'Secret Syndicate': {'corruption': 2, 'crime': 2, 'economy': 2, 'law': -6},
+    },
+    'qualities': {
+        'Academic': {'lore': 1, 'spellcasting': 1},
+        'Holy Site': {'corruption': -2, 'spellcasting': 2},
+        'Insular': {'crime': -1, 'law': 1},
+        'Magically Attuned': {'base_value': 20, 'purchase_limit': 20, 'spellcasting': 2},
+        'Notorious': {'crime': 1, 'law': -1, 'base_value': 30, 'purchase_limit': 50},
+        'Pious': {'spellcasting': 1},
+        'Prosperous': {'economy': 1, 'base_value': 30, 'purchase_limit': 50},
+        'Racially Intolerant': {},
+        'Rumormongering Citizens': {'lore': 1, 'society': -1},
+        'Strategic Location': {'economy': 1, 'base_value': 10},
+        'Superstitious': {'crime': -4, 'law': 2, 'society': 2, 'spellcasting': -2},
+        'Tourist Attraction': {'economy': 1, 'base_value': 20},
+    },
+    'disadvantages': {
+        'Anarchy': {'corruption': 4, 'crime': 4, 'economy': -4, 'law': -6, 'society': -4},
+        'Cursed': {},
+        'Hunted': {'economy': -4, 'law': -4, 'society': -4, 'base_value': -20},
+        'Impoverished': {'corruption': 1, 'crime': 1, 'base_value': -50, 'purchase_limit': -50},
+        'Plagued': {'base_value': -20},
+    },
+}
+# Features of each kind, in code order.  GG_City validates and randomizes from these lists,
+# which are updated in place when new rules are installed.
+CITY_RULE_FEATURES: Final[Dict[str, List[str]]] = {kind: list(feature_dict)
+                                                   for (kind, feature_dict) in CITY_RULES.items()}
+
+
+class GGCityRules:
+    """A rule table compiled into integer-coded lookup vectors.
+
+    Every feature of a kind gets an integer code (its index in CITY_RULE_FEATURES) and a delta
+    vector, ordered like CITY_RULE_STATS, at that index of deltas[kind].
+    """
+
+    def __init__(self, ruleTable):
+        """Class constructor: validate and compile ruleTable"""
+        # LOCAL VARIABLES
+        self.ruleTable = copy.deepcopy(ruleTable)
+        self.codes = {}  # {kind: {feature: code}}
+        self.deltas = {}  # {kind: [delta vector, ...]} indexed by code
+        self.prefixes = {}  # {kind: [feature, ...]} longest first, for features with details
+        self.fingerprint = hashlib.sha256(repr(sorted(
+            (kind, sorted((feature, sorted(delta_dict.items()))
+                          for (feature, delta_dict) in feature_dict.items()))
+            for (kind, feature_dict) in self.ruleTable.items())).encode('utf-8')).hexdigest()
+
+        # INPUT VALIDATION
+        if set(self.ruleTable) != set(CITY_RULES):
+            raise RuntimeError(f'City rules need exactly these kinds: {", ".join(CITY_RULES)}')
+
+        # COMPILE
+        for (kind, feature_dict) in self.ruleTable.items():
+            self.codes[kind] = {}
+            self.deltas[kind] = []
+            for (feature, delta_dict) in feature_dict.items():
+                for (stat, delta) in delta_dict.items():
+                    if stat not in CITY_RULE_STATS:
+                        raise RuntimeError(f'Unknown city statistic in the {feature} rule: {stat}')
+                    if not isinstance(delta, int):
+                        raise RuntimeError(f'The {feature} rule adjusts {stat} by a non-integer')
+                self.codes[kind][feature] = len(self.deltas[kind])
+                self.deltas[kind].append(tuple(delta_dict.get(stat, 0)
+                                               for stat in CITY_RULE_STATS))
+            self.prefixes[kind] = sorted(feature_dict, key=len, reverse=True)
+
+    def match(self, kind, feature):
+        """Return the name of the rule a feature of one kind uses, or None if there isn't one.
+
+        Features with details (e.g., "Racially Intolerant (Elves)", "Racially Intolerant -
+        Elves") use the rule of the longest feature name they start with, up to a word break.
+        """
+        # EXACT MATCH
+        if feature in self.codes[kind]:
+            return feature
+
+        # PREFIX MATCH
+        for rule_name in self.prefixes[kind]:
+            if feature.startswith(rule_name) and not feature[len(rule_name)].isalnum():
+                return rule_name
+
+        # DONE
+        return None
+
+    def encode(self, kind, features):
+        """Return the codes of a feature, or a list of features, of one kind.
+
+        Features with details (e.g., "Racially Intolerant (Elves)") use their base feature's
+        rule.  See: match().
+        """
+        # LOCAL VARIABLES
+        kind_codes = self.codes[kind]
+        feature_list = [features] if isinstance(features, str) else features or []
+        code_list = []
+
+        # ENCODE
+        for feature in feature_list:
+            rule_name = self.match(kind, feature)
+            if rule_name is None:
+                raise RuntimeError(f'No city rule for the {kind} {feature}')
+            code_list.append(kind_codes[rule_name])
+
+        # DONE
+        return code_list
+
+    def total_deltas(self, alignment, government, qualities, disadvantages):
+        """Return the sum of the features' delta vectors, ordered like CITY_RULE_STATS"""
+        # LOCAL VARIABLES
+        vector_list = [self.deltas[kind][code] for (kind, features)
+                       in (('alignment', alignment), ('government', government),
+                           ('qualities', qualities), ('disadvantages', disadvantages))
+                       for code in self.encode(kind, features)]
+
+        # DONE
+        return [sum(stat_deltas) for stat_deltas in zip(*vector_list)]
+
+
+_CITY_RULES: Final[Dict[str, GGCityRules]] = {'rules': GGCityRules(CITY_RULES)}
+
+
+def get_city_rules():
+    """Return the installed GGCityRules"""
+    return _CITY_RULES['rules']
+
+
+def install_city_rules(ruleTable):
+    """Compile ruleTable and use it for every city from now on.  Returns the GGCityRules."""
+    # LOCAL VARIABLES
+    city_rules = GGCityRules(ruleTable)
+
+    # INPUT VALIDATION
+    if set(ruleTable['alignment']) != set(CITY_RULES['alignment']):
+        raise RuntimeError('House rules may adjust alignments but not add or remove them')
+
+    # INSTALL
+    for (kind, feature_list) in CITY_RULE_FEATURES.items():
+        feature_list[:] = list(city_rules.ruleTable[kind])
+    _CITY_RULES['rules'] = city_rules
+
+    # DONE
+    return city_rules
+
+
+def load_city_rules(filename):
+    """Add the house rules in a YAML file to the installed rules.  Returns the GGCityRules.
+
+    The file is shaped like CITY_RULES: {kind: {feature: {stat: delta}}}.  New features are
+    added and existing features have their rule replaced.
+    """
+    # LOCAL VARIABLES
+    rule_table = copy.deepcopy(get_city_rules().ruleTable)
+    with open(filename, 'r') as in_file:
+        house_rules = yaml.load(in_file, Loader=yaml.FullLoader)
+
+    # INPUT VALIDATION
+    if not isinstance(house_rules, dict):
+        raise RuntimeError(f'Unable to find any city rules in {filename}')
+
+    # MERGE
+    for (kind, feature_dict) in house_rules.items():
+        if kind not in rule_table:
+            raise RuntimeError(f'Unknown kind of city rule in {filename}: {kind}')
+        for (feature, delta_dict) in (feature_dict or {}).items():
+            rule_table[kind][feature] = dict(delta_dict or {})
+
+    # DONE
+    return install_city_rules(rule_table)
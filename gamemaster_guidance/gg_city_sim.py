@@ -0,0 +1,340 @@
+"""Implements a Monte Carlo simulator of randomized cities.
+
+GGCitySimulation randomizes thousands of cities from one city template at once, as NumPy arrays
+instead of one GG_City per city, so house rules can be tuned by looking at the spread of city
+modifiers, NPC counts, and top-level NPCs.  Anything the template leaves out is randomized the
+way GG_City randomizes it, and the statistics come from the same settlement rules (see:
+gg_city_rules).  Requires NumPy.
+"""
+
+# Standard
+from collections import OrderedDict
+from typing import Final, List
+import copy
+import locale
+# Third Party
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Optional: only the simulator needs it
+# Local
+from gamemaster_guidance.gg_city import GG_City, get_npc_level_chain
+from gamemaster_guidance.gg_city_rules import (CITY_MAX_SPELLCASTING, CITY_RULE_STATS,
+                                                get_city_rules)
+from gamemaster_guidance.gg_globals import CITY_MODIFIER_LIST, CITY_SIZE_LIMITS, print_header
+from gamemaster_guidance.gg_npc_levels import NPC_MAX_LEVEL
+from gamemaster_guidance.gg_rando import get_rando_engine
+
+
+SIM_CITY_TYPES: Final[List[str]] = list(GG_City.settlementStatistics)  # Type codes
+SIM_ALIGNMENTS: Final[List[str]] = [
+    'Neutral' if ethic == moral == 'Neutral' else f'{ethic} {moral}'
+    for ethic in GG_City.supportedEthics for moral in GG_City.supportedMoralities]
+SIM_NPC_CLASSES: Final[List[str]] = (list(GG_City.npcClassDice) + list(GG_City.npcRemainderRates)
+                                     + ['commoner'])
+SIM_NPC_LEVELS: Final[int] = NPC_MAX_LEVEL  # NPC levels 1 through 20
+# Statistics reported for every simulated city
+SIM_STAT_LIST: Final[List[str]] = (['Population'] + CITY_MODIFIER_LIST
+                                   + ['Base Value', 'Purchase Limit', 'Spellcasting',
+                                      'Class NPCs', 'Top NPC Level'])
+# Categorical features reported as the share of cities having each value
+SIM_FEATURE_LIST: Final[List[str]] = ['Type', 'Alignment', 'Government', 'Qualities',
+                                      'Disadvantages']
+SIM_HISTOGRAM_STATS: Final[List[str]] = CITY_MODIFIER_LIST + ['Spellcasting', 'Top NPC Level']
+SIM_HISTOGRAM_WIDTH: Final[int] = 50  # Length of the longest histogram bar
+SIM_MAX_UNIT_BINS: Final[int] = 40  # Integer statistics spanning more values than this are binned
+
+
+class GGCitySimulation:
+    """numCities cities randomized from one city template, stored as one array row per city.
+
+    The template is a city config dictionary, exactly as GG_City takes it, minus whatever
+    should vary from city to city.
+    """
+
+    def __init__(self, cityTemplate, numCities, rando_engine=None):
+        """Class constructor: simulates every city"""
+        # INPUT VALIDATION
+        if numpy is None:
+            raise RuntimeError("City simulation requires NumPy")
+        if not isinstance(numCities, int):
+            raise TypeError("numCities is not an integer")
+        if numCities < 1:
+            raise RuntimeError(f"Invalid number of cities: {numCities}")
+
+        # LOCAL VARIABLES
+        self.numCities = numCities
+        # Validate the template, and learn what to randomize, the same way GG_City does
+        self.template = GG_City(copy.deepcopy(cityTemplate))
+        self.template.load()
+        # An independent stream so a simulation doesn't disturb the engine's other draws
+        self.rng = (rando_engine or get_rando_engine()).spawn()[0].get_numpy_rng()
+        self.population = None  # Population per city
+        self.cityType = None  # Index into SIM_CITY_TYPES per city
+        self.alignment = None  # Index into SIM_ALIGNMENTS per city
+        self.government = None  # Index into GG_City.supportedGovernments per city
+        self.qualities = None  # numCities x supported qualities: True if the city has it
+        self.disadvantages = None  # numCities x supported disadvantages: True if the city has it
+        self.baseModifier = None  # Settlement type's base modifier per city
+        self.modifiers = None  # numCities x CITY_MODIFIER_LIST
+        self.baseValue = None
+        self.purchaseLimit = None
+        self.spellcasting = None
+        self.npcLevels = None  # numCities x SIM_NPC_CLASSES x SIM_NPC_LEVELS citizen counts
+
+        # SIMULATE
+        self._simulate_features()
+        self._calc_stats()
+        self._simulate_npcs()
+
+    def get_stat(self, stat):
+        """Return an array of one of the SIM_STAT_LIST statistics, one entry per city"""
+        if stat == 'Population':
+            return self.population
+        if stat in CITY_MODIFIER_LIST:
+            return self.modifiers[:, CITY_MODIFIER_LIST.index(stat)]
+        if stat == 'Base Value':
+            return self.baseValue
+        if stat == 'Purchase Limit':
+            return self.purchaseLimit
+        if stat == 'Spellcasting':
+            return self.spellcasting
+        if stat == 'Class NPCs':
+            return self.npcLevels[:, :len(GG_City.npcClassDice), :].sum(axis=(1, 2))
+        if stat == 'Top NPC Level':
+            return self.get_top_levels().max(axis=1)
+        raise RuntimeError(f'Unknown city statistic: {stat}')
+
+    def get_top_levels(self):
+        """Return a numCities x SIM_NPC_CLASSES array of each class's highest level (0 if none)"""
+        levels = numpy.arange(1, SIM_NPC_LEVELS + 1)
+        return numpy.where(self.npcLevels > 0, levels, 0).max(axis=2)
+
+    def get_class_totals(self):
+        """Return a numCities x SIM_NPC_CLASSES array of each class's citizen count"""
+        return self.npcLevels.sum(axis=2)
+
+    def summary(self):
+        """Return {stat: {'Mean': ..., 'Std': ..., 'Min': ..., '5%': ..., ...}} for SIM_STAT_LIST"""
+        ret_dict = OrderedDict()
+        for stat in SIM_STAT_LIST:
+            values = self.get_stat(stat)
+            (low, median, high) = numpy.percentile(values, [5, 50, 95]).tolist()
+            ret_dict[stat] = OrderedDict([('Mean', float(values.mean())),
+                                          ('Std', float(values.std())),
+                                          ('Min', int(values.min())), ('5%', low),
+                                          ('Median', median), ('95%', high),
+                                          ('Max', int(values.max()))])
+        return ret_dict
+
+    def frequencies(self, feature):
+        """Return {value: share of cities} for one of the SIM_FEATURE_LIST features"""
+        if feature == 'Type':
+            (names, counts) = (SIM_CITY_TYPES, self._count_codes(self.cityType, SIM_CITY_TYPES))
+        elif feature == 'Alignment':
+            (names, counts) = (SIM_ALIGNMENTS, self._count_codes(self.alignment, SIM_ALIGNMENTS))
+        elif feature == 'Government':
+            names = GG_City.supportedGovernments
+            counts = self._count_codes(self.government, names)
+        elif feature == 'Qualities':
+            (names, counts) = (GG_City.supportedQualities, self.qualities.sum(axis=0))
+        elif feature == 'Disadvantages':
+            (names, counts) = (GG_City.supportedDisadvantages, self.disadvantages.sum(axis=0))
+        else:
+            raise RuntimeError(f'Unknown city feature: {feature}')
+        return OrderedDict(zip(names, (counts / self.numCities).tolist()))
+
+    def histogram(self, stat, numBins=10):
+        """Return (counts, bin edges) arrays for one of the SIM_STAT_LIST statistics.
+
+        Integer statistics spanning no more than SIM_MAX_UNIT_BINS values get one bin per value.
+        """
+        values = self.get_stat(stat)
+        (low, high) = (int(values.min()), int(values.max()))
+        if high - low < SIM_MAX_UNIT_BINS:
+            return (numpy.bincount(values - low, minlength=high - low + 1),
+                    numpy.arange(low, high + 2))
+        return numpy.histogram(values, bins=numBins)
+
+    def print_report(self):
+        """Print the summary statistics, feature frequencies, and histograms"""
+        # SUMMARY
+        print_header(f'{self.numCities} SIMULATED CITIES')
+        print(f'{"":16}' + ''.join(f'{column:>11}' for column in
+                                    ('Mean', 'Std', 'Min', '5%', 'Median', '95%', 'Max')))
+        for (stat, stat_dict) in self.summary().items():
+            print(f'{stat:16}' + ''.join(f'{value:>11.2f}' if isinstance(value, float)
+                                         else f'{value:>11}' for value in stat_dict.values()))
+        print("")
+
+        # FREQUENCIES
+        for feature in SIM_FEATURE_LIST:
+            print_header(feature.upper())
+            for (name, share) in self.frequencies(feature).items():
+                print(f'{name:24} {share:7.1%}')
+            print("")
+
+        # HISTOGRAMS
+        for stat in SIM_HISTOGRAM_STATS:
+            print_header(f'{stat.upper()} HISTOGRAM')
+            (counts, edges) = self.histogram(stat)
+            scale = SIM_HISTOGRAM_WIDTH / max(int(counts.max()), 1)
+            for (count, edge) in zip(counts.tolist(), edges.tolist()):
+                print(f'{edge:>10.6g} {"#" * round(count * scale):{SIM_HISTOGRAM_WIDTH}} {count}')
+            print("")
+
+    def _simulate_features(self):
+        """Randomize (or copy from the template) everything GG_City._rando_city() would"""
+        # LOCAL VARIABLES
+        template = self.template
+        details = template.cityDict["city"]
+        numCities = self.numCities
+        rng = self.rng
+        rules = get_city_rules()
+        numEthics = len(GG_City.supportedMoralities)
+
+        # POPULATION
+        if template.randoPopulation:
+            self.population = rng.integers(CITY_SIZE_LIMITS[0], CITY_SIZE_LIMITS[1] + 1,
+                                           numCities)
+        else:
+            self.population = numpy.full(numCities, _parse_int(details["population"]))
+
+        # TYPE
+        if template.calcType:
+            self.cityType = numpy.searchsorted(list(GG_City.settlementPopulations.values()),
+                                               self.population)
+        else:
+            self.cityType = numpy.full(numCities, SIM_CITY_TYPES.index(details["type"]))
+
+        # DISADVANTAGES
+        self.disadvantages = numpy.zeros((numCities, len(GG_City.supportedDisadvantages)),
+                                         dtype=bool)
+        if template.randoDisadvantage:
+            self.disadvantages[numpy.arange(numCities),
+                               rng.integers(0, len(GG_City.supportedDisadvantages),
+                                            numCities)] = True
+        else:
+            self.disadvantages[:, rules.encode('disadvantages',
+                                               details.get("disadvantages"))] = True
+
+        # ALIGNMENT
+        if template.randoAlignment:
+            self.alignment = (rng.integers(0, len(GG_City.supportedEthics), numCities)
+                              * numEthics + rng.integers(0, numEthics, numCities))
+        else:
+            self.alignment = numpy.full(numCities, SIM_ALIGNMENTS.index(details["alignment"]))
+
+        # GOVERNMENT
+        if template.randoGovernment:
+            self.government = rng.integers(0, len(GG_City.supportedGovernments), numCities)
+        else:
+            self.government = numpy.full(numCities,
+                                         GG_City.supportedGovernments.index(details["government"]))
+
+        # QUALITIES
+        if template.randoQualities:
+            # The first n columns of a random permutation are n distinct qualities
+            numQualities = numpy.array([stat_dict["Qualities"] for stat_dict
+                                        in GG_City.settlementStatistics.values()])[self.cityType]
+            ranks = rng.random((numCities, len(GG_City.supportedQualities))).argsort(axis=1)
+            self.qualities = ranks.argsort(axis=1) < numQualities[:, None]
+        else:
+            self.qualities = numpy.zeros((numCities, len(GG_City.supportedQualities)),
+                                         dtype=bool)
+            self.qualities[:, rules.encode('qualities', details["qualities"])] = True
+
+    def _calc_stats(self):
+        """Calculate the modifiers, base value, purchase limit, and spellcasting of every city"""
+        # LOCAL VARIABLES
+        rules = get_city_rules()
+        deltaMatrices = {kind: numpy.array(deltaList, dtype=numpy.int64).reshape(
+            -1, len(CITY_RULE_STATS)) for (kind, deltaList) in rules.deltas.items()}
+        statistics = list(GG_City.settlementStatistics.values())
+
+        # TOTAL THE RULES
+        # Alignment and government are one code per city (alignment codes are SIM_ALIGNMENTS
+        # indices, so translate them); qualities and disadvantages are multi-hot rows
+        cityDeltas = (deltaMatrices['alignment'][rules.encode('alignment', SIM_ALIGNMENTS)]
+                      [self.alignment]
+                      + deltaMatrices['government'][self.government]
+                      + self.qualities.astype(numpy.int64) @ deltaMatrices['qualities']
+                      + self.disadvantages.astype(numpy.int64) @ deltaMatrices['disadvantages'])
+
+        # MODIFIERS
+        self.baseModifier = numpy.array([stat_dict["Modifiers"]
+                                         for stat_dict in statistics])[self.cityType]
+        self.modifiers = self.baseModifier[:, None] + cityDeltas[
+            :, [CITY_RULE_STATS.index(modifier.lower()) for modifier in CITY_MODIFIER_LIST]]
+
+        # BASE VALUE
+        if self.template.calcBaseValue:
+            self.baseValue = _adjust_by_percent(
+                numpy.array([stat_dict["Base Value"] for stat_dict in statistics]),
+                self.cityType, cityDeltas[:, CITY_RULE_STATS.index('base_value')])
+        else:
+            self.baseValue = numpy.full(self.numCities,
+                                        _parse_int(self.template.cityDict["city"]["base_value"]))
+
+        # PURCHASE LIMIT
+        self.purchaseLimit = _adjust_by_percent(
+            numpy.array([stat_dict["Purchase Limit"] for stat_dict in statistics]),
+            self.cityType, cityDeltas[:, CITY_RULE_STATS.index('purchase_limit')])
+
+        # SPELLCASTING
+        self.spellcasting = numpy.minimum(
+            numpy.array([stat_dict["Spellcasting"] for stat_dict in statistics])[self.cityType]
+            + cityDeltas[:, CITY_RULE_STATS.index('spellcasting')], CITY_MAX_SPELLCASTING)
+
+    def _simulate_npcs(self):
+        """Randomize every city's NPC class level table, as GG_City._rando_city_npcs() would"""
+        # LOCAL VARIABLES
+        numCities = self.numCities
+        multipliers = numpy.array([GG_City.npcMultipliers.get(cityType, 1)
+                                   for cityType in SIM_CITY_TYPES])[self.cityType]
+        maxRolls = int(multipliers.max())
+        unrolled = numpy.arange(maxRolls)[None, :] >= multipliers[:, None]  # Extra roll slots
+        self.npcLevels = numpy.zeros((numCities, len(SIM_NPC_CLASSES), SIM_NPC_LEVELS),
+                                     dtype=numpy.int64)
+
+        # CLASSES
+        for (classIndex, className) in enumerate(GG_City.npcClassDice):
+            (numDice, numFaces) = self.template._get_npc_class_dice(className)
+            highestLevels = (self.rng.integers(1, numFaces + 1, (numCities, maxRolls, numDice))
+                             .sum(axis=2) + self.baseModifier[:, None])
+            highestLevels[unrolled] = 0  # No NPCs
+            chainTable = _build_level_chain_table(int(highestLevels.max()))
+            self.npcLevels[:, classIndex, :] = chainTable[highestLevels.clip(0)].sum(axis=1)
+
+        # REMAINING POPULATION
+        remainingPop = (self.population - self.npcLevels.sum(axis=(1, 2))).clip(0)
+        commoners = remainingPop.copy()
+        for (className, rate) in GG_City.npcRemainderRates.items():
+            classCount = (remainingPop * rate).astype(numpy.int64)
+            self.npcLevels[:, SIM_NPC_CLASSES.index(className), 0] = classCount
+            commoners -= classCount
+        self.npcLevels[:, SIM_NPC_CLASSES.index('commoner'), 0] = commoners
+
+    @staticmethod
+    def _count_codes(codes, names):
+        """Count the cities with each integer code"""
+        return numpy.bincount(codes, minlength=len(names))
+
+
+def _build_level_chain_table(maxLevel):
+    """Return a (maxLevel + 1) x SIM_NPC_LEVELS array of the NPCs each highest level comes with"""
+    chainTable = numpy.zeros((max(maxLevel, 0) + 1, SIM_NPC_LEVELS), dtype=numpy.int64)
+    for highestLevel in range(1, maxLevel + 1):
+        for (charLevel, numOfThatLevel) in get_npc_level_chain(highestLevel):
+            chainTable[highestLevel, charLevel - 1] += numOfThatLevel
+    return chainTable
+
+
+def _adjust_by_percent(typeValues, cityType, percentDeltas):
+    """Return int(value * percent * .01) per city, rounding exactly as GG_City does"""
+    return (typeValues[cityType] * (100 + percentDeltas) * .01).astype(numpy.int64)
+
+
+def _parse_int(value):
+    """Return a city config number, which may be a string with thousands separators, as an int"""
+    return value if isinstance(value, int) else locale.atoi(value)
@@ -0,0 +1,99 @@
+"""Implements a compiled dice expression engine."""
+
+# Standard
+from functools import lru_cache
+from typing import Final
+import re
+# Third Party
+# Local
+from gamemaster_guidance.gg_rando import get_rando_engine
+
+
+# One signed term of a dice expression: NdF, a constant, or a named modifier
+_DICE_TERM_REGEX: Final = re.compile(r'\s*([+-])?\s*(?:(\d*)[dD](\d+)|(\d+)|([A-Za-z_]\w*))\s*')
+
+
+class GGDice:
+    """A dice expression (e.g., '1d8+mod', '4d4 - 2', '2d6+1d4+3') compiled for fast rolling.
+
+    The expression is parsed once into dice terms, a constant, and named modifiers.  Named
+    modifiers are supplied as keyword arguments when rolling.
+    """
+
+    def __init__(self, expression):
+        """Class constructor"""
+        self.expression = expression
+        self.dice_terms = []  # [(sign, number of dice, number of faces)]
+        self.constant = 0  # Sum of the constant terms
+        self.modifier_terms = []  # [(sign, modifier name)]
+        self._compile()
+
+    def __repr__(self):
+        return f'GGDice({self.expression!r})'
+
+    def roll(self, engine=None, **modifiers):
+        """Roll the expression once"""
+        return self.roll_many(1, engine, **modifiers)[0]
+
+    def roll_many(self, num_rolls, engine=None, **modifiers):
+        """Return a list of num_rolls independent rolls of the expression.
+
+        Every dice term is rolled for all num_rolls at once (vectorized when NumPy is installed).
+        """
+        # LOCAL VARIABLES
+        local_engine = engine or get_rando_engine()
+        base_total = self.constant
+
+        # MODIFIERS
+        for (sign, name) in self.modifier_terms:
+            try:
+                base_total += sign * modifiers[name]
+            except KeyError as err:
+                raise RuntimeError(f'{self.expression} needs a value for {name}') from err
+        totals = [base_total] * num_rolls
+
+        # DICE
+        for (sign, num_dice, num_faces) in self.dice_terms:
+            totals = [total + (sign * dice_sum) for (total, dice_sum)
+                      in zip(totals, local_engine.dice_sums(num_dice, num_faces, num_rolls))]
+
+        # DONE
+        return totals
+
+    def _compile(self):
+        """Parse the expression into terms"""
+        # LOCAL VARIABLES
+        position = 0
+        expression = self.expression
+
+        # PARSE TERMS
+        while position < len(expression):
+            match = _DICE_TERM_REGEX.match(expression, position)
+            if not match or match.end() == position or (position and not match.group(1)):
+                raise RuntimeError(f'Invalid dice expression: {expression}')
+            sign = -1 if match.group(1) == '-' else 1
+            if match.group(3):
+                num_dice = int(match.group(2)) if match.group(2) else 1
+                num_faces = int(match.group(3))
+                if num_faces < 1:
+                    raise RuntimeError(f'Invalid number of faces in {expression}')
+                if num_dice:
+                    self.dice_terms.append((sign, num_dice, num_faces))
+            elif match.group(4):
+                self.constant += sign * int(match.group(4))
+            else:
+                self.modifier_terms.append((sign, match.group(5)))
+            position = match.end()
+        if not (self.dice_terms or self.modifier_terms or position):
+            raise RuntimeError(f'Invalid dice expression: {expression}')
+
+
+@lru_cache(maxsize=None)
+def compile_dice(expression):
+    """Return the GGDice for expression, compiling it the first time it's seen"""
+    return GGDice(expression)
+
+
+def roll_dice(expression, engine=None, **modifiers):
+    """Roll a dice expression once"""
+    return compile_dice(expression).roll(engine, **modifiers)
@@ -1,23 +1,793 @@
 """Implements simplified database wrapper functions."""
 
 # Standard
-import random
+from array import array
+from typing import Dict, Final, List, Optional, Sequence, Tuple
+import heapq
+import math
+import mmap
+import os
+import struct
 import sys
+import time
 # Third Party
 # Local
+from gamemaster_guidance.gg_rando import get_rando_engine, rand_index_samples, rand_indices
 
 
-def pick_entry(filename):
-    """Returns a single entry from a newline-delimited file"""
-    return pick_entries(filename, 1)[0]
+DATABASE_DIRNAME: Final[str] = 'databases'  # Default database directory, relative to the cwd
+DATABASE_EXTENSION: Final[str] = '.txt'  # Only files with this extension are databases
+# Database modes
+DB_MODE_MEMORY: Final[str] = 'memory'  # Parse the entire file into a list
+DB_MODE_INDEXED: Final[str] = 'indexed'  # mmap the file and index the entry offsets
+DB_MODE_STREAM: Final[str] = 'stream'  # Reservoir sample the file in one pass on every pick
+DB_MODES: Final[tuple] = (DB_MODE_MEMORY, DB_MODE_INDEXED, DB_MODE_STREAM)
+STREAM_CHUNK_SIZE: Final[int] = 1 << 20  # Bytes read at a time by streamed databases
+# Line-offset index files
+INDEX_EXTENSION: Final[str] = '.idx'  # Index of non-comment entries
+INDEX_ALL_EXTENSION: Final[str] = '.all.idx'  # Index of all entries, comments included
+_INDEX_MAGIC: Final[bytes] = b'GGIX'
+_INDEX_VERSION: Final[int] = 2  # 2: CR-only lines of CRLF files are not entries
+_INDEX_BYTE_ORDER: Final[int] = 0x01020304  # Indexes are native byte order; detects a mismatch
+# Magic, version, byte order, database size, database mtime (ns), number of offsets
+_INDEX_HEADER: Final[struct.Struct] = struct.Struct('=4sIIQqQ')
+_INDEX_MAX_OFFSET: Final[int] = 0xFFFFFFFF  # Offsets are stored as uint32
+# Compiled database packs
+DATABASE_PACK_FILENAME: Final[str] = 'databases.ggpack'  # Default pack, relative to the cwd
+_PACK_MAGIC: Final[bytes] = b'GGPK'
+_PACK_VERSION: Final[int] = 1
+# Magic, version, byte order, number of lists, string table offset
+_PACK_HEADER: Final[struct.Struct] = struct.Struct('=4sIIQQ')
+# Name offset, name length, offset table offset, number of entries
+_PACK_DIRECTORY_ENTRY: Final[struct.Struct] = struct.Struct('=QQQQ')
+# Parsed database entries: {(absolute filename, skip_comments): sequence of entries}
+_DATABASE_REGISTRY: Dict[Tuple[str, bool], Sequence[str]] = {}
+# Non-default database modes: {absolute filename: DB_MODE_*}
+_DATABASE_MODES: Dict[str, str] = {}
+# Change detection: databases are re-parsed when their (mtime, size, inode) signature changes.
+# The interval only throttles parsed (memory mode) databases: mapped ones are checked per pick.
+DATABASE_RELOAD_INTERVAL: Final[float] = 2.0  # Default minimum seconds between change checks
+_DATABASE_SIGNATURES: Dict[str, Tuple[int, int, int]] = {}  # {absolute filename: signature}
+# The reload interval is None when change checks are disabled
+_RELOAD_STATE: Dict[str, Optional[float]] = {'interval': DATABASE_RELOAD_INTERVAL,
+                                             'last_check': 0.0}
+# Database packs currently mapped by load_database_pack()
+_DATABASE_PACKS: List['GGDatabasePack'] = []
 
 
-def pick_entries(filename, num_tuples, skip_comments=True):
-    """Returns a list of strings from a newline-delimited file, skipping comments"""
+class GGIndexedDatabase:
+    """Read-only sequence of database entries fetched by mmap slicing at indexed offsets.
+
+    The offset of every entry is stored as a uint32 in a persisted index file alongside the
+    database.  The index is rebuilt whenever the database's size or mtime no longer match.
+    Reading a mapping past the end of its file crashes the process (SIGBUS), so every read
+    first checks the file is still the size that was mapped and remaps it if not.
+    """
+
+    def __init__(self, filename, skip_comments=True):
+        """Class constructor"""
+        self.filename = os.path.abspath(filename)
+        self.skip_comments = skip_comments
+        if skip_comments:
+            self.index_filename = self.filename + INDEX_EXTENSION
+        else:
+            self.index_filename = self.filename + INDEX_ALL_EXTENSION
+        self._db_file = None  # The open database file, kept to check its size
+        self._db_map = None  # mmap of the database
+        self._index_map = None  # mmap of the index file, if it was persisted
+        self._offsets = None  # uint32 offsets, either a memoryview or an array
+        self._mapped_signature = None  # (size, mtime) of the database as mapped
+        self._load()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if self._db_file and os.fstat(self._db_file.fileno()).st_size != len(self._db_map):
+            self.close()  # Changed in place (e.g., truncated) since it was mapped
+            self._load()
+        start = self._offsets[index]
+        end = self._db_map.find(b'\n', start)
+        if end < 0:
+            end = len(self._db_map)
+        if self._db_map[end - 1:end] == b'\r':
+            end -= 1  # CRLF line ending, which memory mode's text reads translate away
+        return self._db_map[start:end].decode(sys.getdefaultencoding())
+
+    def is_stale(self):
+        """Returns True if the database file changed since it was mapped"""
+        try:
+            db_stat = os.fstat(self._db_file.fileno()) if self._db_file \
+                else os.stat(self.filename)
+        except OSError:
+            return True  # E.g., removed
+        return (db_stat.st_size, db_stat.st_mtime_ns) != self._mapped_signature
+
+    def close(self):
+        """Release the database and index mappings"""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._offsets = array('I')
+        for one_map in (self._db_map, self._index_map):
+            if one_map:
+                one_map.close()
+        if self._db_file:
+            self._db_file.close()
+        self._db_file = None
+        self._db_map = None
+        self._index_map = None
+
+    def _load(self):
+        """Map the database and its index, rebuilding the index if it is missing or stale"""
+        # LOCAL VARIABLES
+        db_stat = os.stat(self.filename)
+
+        # MAP THE DATABASE
+        if not db_stat.st_size:
+            self._offsets = array('I')  # mmap refuses empty files and there's nothing to index
+            self._mapped_signature = (db_stat.st_size, db_stat.st_mtime_ns)
+            return
+        self._db_file = open(self.filename, 'rb')
+        self._db_map = _map_file(self._db_file)
+        # Index the file as mapped, even if it changed since the stat
+        db_stat = os.fstat(self._db_file.fileno())
+        self._mapped_signature = (db_stat.st_size, db_stat.st_mtime_ns)
+
+        # MAP THE INDEX
+        if not self._map_index(db_stat):
+            self._build_index(db_stat)
+
+    def _map_index(self, db_stat):
+        """Map a persisted index if it matches the database.  Returns True on success."""
+        # LOCAL VARIABLES
+        index_map = None
+
+        # READ HEADER
+        try:
+            with open(self.index_filename, 'rb') as in_file:
+                index_map = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        try:
+            (magic, version, byte_order, db_size, db_mtime, num_offsets) = \
+                _INDEX_HEADER.unpack_from(index_map)
+        except struct.error:
+            index_map.close()
+            return False
+
+        # VALIDATE
+        expected_header = (_INDEX_MAGIC, _INDEX_VERSION, _INDEX_BYTE_ORDER,
+                           db_stat.st_size, db_stat.st_mtime_ns)
+        if (magic, version, byte_order, db_size, db_mtime) != expected_header \
+           or len(index_map) != _INDEX_HEADER.size + (num_offsets * 4):
+            index_map.close()
+            return False
+
+        # DONE
+        self._index_map = index_map
+        with memoryview(index_map) as index_view:
+            self._offsets = index_view[_INDEX_HEADER.size:].cast('I')
+        return True
+
+    def _build_index(self, db_stat):
+        """Scan the database for entry offsets then try to persist them as the index"""
+        # LOCAL VARIABLES
+        offsets = array('I')
+        curr_offset = 0
+        db_map = self._db_map
+        db_size = len(db_map)
+
+        # SCAN DATABASE
+        while curr_offset < db_size:
+            end = db_map.find(b'\n', curr_offset)
+            if end < 0:
+                end = db_size
+            line_end = end - 1 if db_map[end - 1:end] == b'\r' else end  # Ignore a CRLF's CR
+            if line_end > curr_offset:
+                if not self.skip_comments or db_map[curr_offset] != ord('#'):
+                    if curr_offset > _INDEX_MAX_OFFSET:
+                        raise RuntimeError(f'{self.filename} is too large to index')
+                    offsets.append(curr_offset)
+            curr_offset = end + 1
+        self._offsets = offsets
+
+        # PERSIST INDEX
+        # Not being able to write the index (e.g., read-only directory) only costs a rescan later.
+        # Replace it rather than rewrite it so other mappings of the old index stay readable.
+        temp_filename = f'{self.index_filename}.{os.getpid()}.tmp'
+        try:
+            with open(temp_filename, 'wb') as out_file:
+                out_file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, _INDEX_BYTE_ORDER,
+                                                  db_stat.st_size, db_stat.st_mtime_ns,
+                                                  len(offsets)))
+                offsets.tofile(out_file)
+            os.replace(temp_filename, self.index_filename)
+        except OSError:
+            try:
+                os.remove(temp_filename)
+            except OSError:
+                pass
+
+
+class GGDatabasePack:
+    """A compiled database pack mapped into memory.
+
+    Pack layout (native byte order):
+        header | directory | list names | per-list uint32 offset tables | string table
+    Each list's offset table holds one more offset than it has entries so that entry N spans
+    string table offsets N through N + 1.  Only comment-free entries are packed.  A pack that
+    changes size while mapped can't be read safely so its lists raise RuntimeError instead.
+    """
+
+    def __init__(self, pack_filename):
+        """Class constructor"""
+        self.filename = os.path.abspath(pack_filename)
+        self.directory = {}  # {database name: GGPackedDatabase}
+        self._pack_map = None
+        # mmap refuses empty files so check the pack holds a header before mapping it
+        if os.path.getsize(self.filename) < _PACK_HEADER.size:
+            raise RuntimeError(f'Invalid database pack {self.filename}: Truncated header')
+        self._pack_file = open(self.filename, 'rb')  # Kept open to check the pack's size
+        self._pack_map = _map_file(self._pack_file)
+        pack_stat = os.fstat(self._pack_file.fileno())
+        self._mapped_signature = (pack_stat.st_size, pack_stat.st_mtime_ns)
+        try:
+            self._read_directory()
+        except (RuntimeError, struct.error) as err:
+            self.close()
+            raise RuntimeError(f'Invalid database pack {self.filename}: {err}') from err
+
+    def close(self):
+        """Release every list in the pack then the pack mapping itself"""
+        for packed_db in self.directory.values():
+            packed_db.close()
+        self.directory = {}
+        if self._pack_map:
+            self._pack_map.close()
+            self._pack_map = None
+        self._pack_file.close()
+
+    def is_stale(self):
+        """Returns True if the pack file changed since it was mapped"""
+        if self._pack_map is None:
+            return True
+        pack_stat = os.fstat(self._pack_file.fileno())
+        return (pack_stat.st_size, pack_stat.st_mtime_ns) != self._mapped_signature
+
+    def check_size(self):
+        """Raise RuntimeError if the pack file no longer matches the size that was mapped"""
+        if self._pack_map is None \
+           or os.fstat(self._pack_file.fileno()).st_size != len(self._pack_map):
+            raise RuntimeError(f'Database pack {self.filename} changed while it was loaded')
+
+    def _read_directory(self):
+        """Parse the pack header and directory into GGPackedDatabase objects"""
+        # LOCAL VARIABLES
+        pack_map = self._pack_map
+
+        # HEADER
+        (magic, version, byte_order, num_lists, string_table_offset) = \
+            _PACK_HEADER.unpack_from(pack_map)
+        if (magic, version, byte_order) != (_PACK_MAGIC, _PACK_VERSION, _INDEX_BYTE_ORDER):
+            raise RuntimeError('Unsupported header')
+        if string_table_offset > len(pack_map):
+            raise RuntimeError('Truncated string table')
+
+        # DIRECTORY
+        for list_num in range(num_lists):
+            (name_offset, name_length, table_offset, num_entries) = \
+                _PACK_DIRECTORY_ENTRY.unpack_from(pack_map, _PACK_HEADER.size
+                                                  + (list_num * _PACK_DIRECTORY_ENTRY.size))
+            db_name = pack_map[name_offset:name_offset + name_length].decode('utf-8')
+            self.directory[db_name] = GGPackedDatabase(self, table_offset, num_entries,
+                                                       string_table_offset)
+
+
+class GGPackedDatabase:
+    """Read-only sequence of one database's entries within a GGDatabasePack"""
+
+    def __init__(self, db_pack, table_offset, num_entries, string_table_offset):
+        """Class constructor"""
+        pack_map = db_pack._pack_map
+        self._db_pack = db_pack
+        self._pack_map = pack_map
+        self._num_entries = num_entries
+        self._string_table_offset = string_table_offset
+        table_end = table_offset + ((num_entries + 1) * 4)
+        if table_end > len(pack_map):
+            raise RuntimeError('Truncated offset table')
+        with memoryview(pack_map) as pack_view:
+            self._offsets = pack_view[table_offset:table_end].cast('I')
+        if string_table_offset + self._offsets[num_entries] > len(pack_map):
+            self._offsets.release()
+            raise RuntimeError('Truncated string table')
+
+    def __len__(self):
+        return self._num_entries
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._num_entries
+        if not 0 <= index < self._num_entries:
+            raise IndexError('packed database index out of range')
+        self._db_pack.check_size()
+        start = self._string_table_offset + self._offsets[index]
+        end = self._string_table_offset + self._offsets[index + 1]
+        return self._pack_map[start:end].decode(sys.getdefaultencoding())
+
+    def is_stale(self):
+        """Returns True if the pack file changed since it was mapped"""
+        return self._db_pack.is_stale()
+
+    def close(self):
+        """Release this list's view of the pack"""
+        self._offsets.release()
+        self._num_entries = 0
+
+
+class GGReservoir:
+    """Uniformly samples size items from a stream of unknown length (Vitter's Algorithm L).
+
+    Offer every item, in order, while offer_index says the next item is wanted; items before
+    next_index are never examined so long streams cost only O(size * log(n / size)) draws.
+    """
+
+    def __init__(self, size, engine=None):
+        """Class constructor"""
+        self.size = size
+        self.items = []
+        self.next_index = 0  # Index of the next stream item that belongs in the reservoir
+        self._engine = engine or get_rando_engine()
+        self._weight = 0.0
+        if size > 0:
+            self._weight = math.exp(math.log(1.0 - self._engine.random()) / size)
+
+    def offer(self, index, item):
+        """Consider stream item number index, which must equal self.next_index"""
+        if len(self.items) < self.size:
+            self.items.append(item)
+            if len(self.items) == self.size:
+                self._skip_ahead(index)
+            else:
+                self.next_index = index + 1
+        else:
+            self.items[self._engine.randrange(self.size)] = item
+            self._weight *= math.exp(math.log(1.0 - self._engine.random()) / self.size)
+            self._skip_ahead(index)
+
+    def _skip_ahead(self, index):
+        """Determine the index of the next stream item that replaces a reservoir item"""
+        if self._weight >= 1.0:
+            self.next_index = math.inf  # Floating point underflow; nothing else gets chosen
+        else:
+            self.next_index = index + 1 + math.floor(math.log(1.0 - self._engine.random())
+                                                     / math.log1p(-self._weight))
+
+
+def compile_database_pack(pack_filename=None, db_dir=None):
+    """Compile every database in db_dir (defaults to the database directory) into one pack file.
+
+    Returns the number of databases packed.
+    """
+    # LOCAL VARIABLES
+    local_pack = pack_filename if pack_filename else DATABASE_PACK_FILENAME
+    local_dir = db_dir if db_dir else get_database_dir()
+    db_names = []  # Database filenames, sorted for a reproducible pack
+    names_blob = bytearray()  # List names
+    tables_blob = array('I')  # Every list's offset table, back to back
+    string_table = bytearray()  # Every entry, back to back
+    directory = []  # (name offset, name length, table index, number of entries)
+
+    # READ DATABASES
+    with os.scandir(local_dir) as dir_entries:
+        for dir_entry in dir_entries:
+            if dir_entry.is_file() and dir_entry.name.endswith(DATABASE_EXTENSION):
+                db_names.append(dir_entry.name)
+    db_names.sort()
+    for db_name in db_names:
+        entries = _read_database(os.path.join(local_dir, db_name), skip_comments=True)
+        encoded_name = db_name.encode('utf-8')
+        directory.append((len(names_blob), len(encoded_name), len(tables_blob), len(entries)))
+        names_blob += encoded_name
+        for entry in entries:
+            tables_blob.append(len(string_table))
+            string_table += entry.encode(sys.getdefaultencoding())
+        if len(string_table) > _INDEX_MAX_OFFSET:
+            raise RuntimeError(f'{local_dir} is too large to pack')
+        tables_blob.append(len(string_table))  # End of the last entry
+
+    # LAYOUT
+    names_offset = _PACK_HEADER.size + (len(directory) * _PACK_DIRECTORY_ENTRY.size)
+    tables_offset = names_offset + len(names_blob)
+    tables_offset += -tables_offset % 4  # Align the uint32 offset tables
+    string_table_offset = tables_offset + (len(tables_blob) * 4)
+
+    # WRITE PACK
+    with open(local_pack, 'wb') as out_file:
+        out_file.write(_PACK_HEADER.pack(_PACK_MAGIC, _PACK_VERSION, _INDEX_BYTE_ORDER,
+                                         len(directory), string_table_offset))
+        for (name_offset, name_length, table_index, num_entries) in directory:
+            out_file.write(_PACK_DIRECTORY_ENTRY.pack(names_offset + name_offset, name_length,
+                                                      tables_offset + (table_index * 4),
+                                                      num_entries))
+        out_file.write(names_blob)
+        out_file.write(bytes(tables_offset - names_offset - len(names_blob)))
+        tables_blob.tofile(out_file)
+        out_file.write(string_table)
+
+    # DONE
+    return len(directory)
+
+
+def load_database_pack(pack_filename=None, db_dir=None):
+    """Map a compiled pack and serve its lists as the databases in db_dir.
+
+    The pack is mapped once and every packed list is registered as if it were the matching
+    database file in db_dir (defaults to the database directory).  Comment-inclusive lookups
+    (skip_comments=False) still fall back to the database file.  Returns the number of
+    databases registered.
+    """
+    # LOCAL VARIABLES
+    local_pack = pack_filename if pack_filename else DATABASE_PACK_FILENAME
+    local_dir = db_dir if db_dir else get_database_dir()
+    db_pack = GGDatabasePack(local_pack)
+
+    # REGISTER LISTS
+    _DATABASE_PACKS.append(db_pack)
+    for (db_name, packed_db) in db_pack.directory.items():
+        _DATABASE_REGISTRY[(os.path.abspath(os.path.join(local_dir, db_name)), True)] = packed_db
+
+    # DONE
+    return len(db_pack.directory)
+
+
+def get_database_dir():
+    """Returns the absolute path of the default database directory"""
+    return os.path.join(os.getcwd(), DATABASE_DIRNAME)
+
+
+def load_databases(db_dir=None):
+    """Parse every file in db_dir (defaults to the database directory) into the registry.
+
+    Returns the number of database files loaded.
+    """
+    # LOCAL VARIABLES
+    num_loaded = 0
+    local_dir = db_dir if db_dir else get_database_dir()
+
+    # LOAD DATABASES
+    with os.scandir(local_dir) as dir_entries:
+        for dir_entry in dir_entries:
+            if dir_entry.is_file() and dir_entry.name.endswith(DATABASE_EXTENSION):
+                _load_database(dir_entry.path)
+                num_loaded += 1
+
+    # DONE
+    return num_loaded
+
+
+def clear_databases():
+    """Discard all parsed database entries held by the registry and unmap any packs"""
+    for entries in _DATABASE_REGISTRY.values():
+        _release_entries(entries)
+    _DATABASE_REGISTRY.clear()
+    _DATABASE_SIGNATURES.clear()
+    for db_pack in _DATABASE_PACKS:
+        db_pack.close()
+    _DATABASE_PACKS.clear()
+
+
+def set_database_mode(filename, mode):
+    """Choose how a database is loaded: DB_MODE_MEMORY (default), _INDEXED, or _STREAM.
+
+    Streamed databases are never held in memory: every pick reservoir samples the file.
+    """
     # LOCAL VARIABLES
-    entry_list = []
+    abs_filename = os.path.abspath(filename)
+
+    # INPUT VALIDATION
+    if mode not in DB_MODES:
+        raise RuntimeError(f'Unsupported database mode: {mode}')
+
+    # SET MODE
+    if mode == DB_MODE_MEMORY:
+        _DATABASE_MODES.pop(abs_filename, None)
+    else:
+        _DATABASE_MODES[abs_filename] = mode
+    # Drop anything loaded under the old mode
+    _forget_database(abs_filename)
+
+
+def set_database_reload_interval(seconds):
+    """Set the minimum number of seconds between database change checks (None disables them)"""
+    if seconds is not None and seconds < 0:
+        raise RuntimeError(f'Invalid reload interval: {seconds}')
+    _RELOAD_STATE['interval'] = seconds
+
+
+def refresh_databases(force=False):
+    """Re-parse every loaded database whose file changed since it was loaded.
+
+    Files are checked with one directory scan per database directory, and no more often than
+    the reload interval unless force is True.  Lists served from a pack are not tracked, only
+    their comment-inclusive fallbacks are reloaded.
+    Returns a list of the absolute filenames that changed.
+    """
+    # LOCAL VARIABLES
+    changed_list = []  # Changed (or deleted) databases
+    current_sigs = {}  # {absolute filename: signature} for tracked files that still exist
+    curr_time = time.monotonic()
+    interval = _RELOAD_STATE['interval']
+
+    # THROTTLE
+    if not force and (interval is None or curr_time - _RELOAD_STATE['last_check'] < interval):
+        return changed_list
+    _RELOAD_STATE['last_check'] = curr_time
+
+    # SCAN DIRECTORIES
+    for db_dir in {os.path.dirname(filename) for filename in _DATABASE_SIGNATURES}:
+        try:
+            with os.scandir(db_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    if dir_entry.path in _DATABASE_SIGNATURES:
+                        current_sigs[dir_entry.path] = _get_signature(dir_entry.stat())
+        except OSError:
+            pass  # Directory is gone so all of its databases changed
+
+    # RELOAD CHANGES
+    for (filename, signature) in list(_DATABASE_SIGNATURES.items()):
+        if current_sigs.get(filename) != signature:
+            changed_list.append(filename)
+            _forget_database(filename, keep_packed=True)
+            if filename in current_sigs:
+                try:
+                    _load_database(filename)
+                except OSError:
+                    pass  # Mid-edit or just removed; the next lookup will try again
+
+    # DONE
+    return changed_list
+
+
+def pick_entry(filename, engine=None, excluded=None):
+    """Returns a single entry from a newline-delimited file that isn't in excluded"""
+    return pick_entries(filename, 1, engine=engine, excluded=excluded)[0]
+
+
+def pick_entries(filename, num_tuples, skip_comments=True, replace=True, engine=None,
+                 excluded=None):
+    """Returns a list of strings from a newline-delimited file, skipping comments.
+
+    Use replace=False to guarantee the strings are distinct entries.  Entries in the excluded
+    collection are never picked.
+    """
+    # STREAMED DATABASE
+    if _is_streamed(filename):
+        return _stream_samples(filename, num_tuples, 1, skip_comments, replace, engine,
+                               excluded)[0]
+
+    # LOCAL VARIABLES
+    file_list = get_entries(filename, skip_comments)
+    index_list = rand_indices(len(file_list), num_tuples, replace, engine)
+
+    # Choose List Entries
+    if excluded:
+        _resample_excluded(file_list, index_list, replace, engine, set(excluded))
+    return [file_list[index] for index in index_list]
+
+
+def pick_entry_samples(filename, num_tuples, num_samples, skip_comments=True, replace=True,
+                       engine=None, excluded=None):
+    """Returns num_samples independent lists of num_tuples strings from a newline-delimited file.
+
+    Intended for bulk generation: the database is looked up once for every sample.  The
+    replace argument applies within each sample.  Entries in the excluded collection are never
+    picked.
+    """
+    # STREAMED DATABASE
+    if _is_streamed(filename):
+        return _stream_samples(filename, num_tuples, num_samples, skip_comments, replace,
+                               engine, excluded)
+
+    # LOCAL VARIABLES
+    file_list = get_entries(filename, skip_comments)
+    sample_list = rand_index_samples(len(file_list), num_tuples, num_samples, replace, engine)
+
+    # Choose List Entries
+    if excluded:
+        excluded_set = set(excluded)
+        for index_list in sample_list:
+            _resample_excluded(file_list, index_list, replace, engine, excluded_set)
+    return [[file_list[index] for index in index_list] for index_list in sample_list]
+
+
+def get_entries(filename, skip_comments=True):
+    """Returns the parsed list of entries for a newline-delimited file, loading it if necessary.
+
+    Mapped (indexed or packed) databases are checked for changes on every call, whatever the
+    reload interval, since a mapping of a changed file can't be read safely.  A list from a
+    changed pack falls back to its database file.
+    """
+    # LOCAL VARIABLES
+    abs_filename = os.path.abspath(filename)
+
+    # INPUT VALIDATION
+    if _is_streamed(abs_filename):
+        raise RuntimeError(f'{abs_filename} is a streamed database and is never held in memory')
+
+    # CHECK THE REGISTRY
+    refresh_databases()  # Cheap unless the reload interval has elapsed
+    try:
+        file_list = _DATABASE_REGISTRY[(abs_filename, skip_comments)]
+    except KeyError:
+        _load_database(abs_filename)
+        file_list = _DATABASE_REGISTRY[(abs_filename, skip_comments)]
+    if isinstance(file_list, (GGIndexedDatabase, GGPackedDatabase)) and file_list.is_stale():
+        _forget_database(abs_filename)
+        _load_database(abs_filename)
+        file_list = _DATABASE_REGISTRY[(abs_filename, skip_comments)]
+
+    # DONE
+    return file_list
+
+
+def _resample_excluded(file_list, index_list, replace, engine, excluded):
+    """Redraw, in place, every index in index_list whose entry is in the excluded set.
+
+    Only picked entries are read, so exclusions never decode or index the whole database.
+    Rejected indices are barred from every redraw, which ends once every pick is accepted or
+    raises RuntimeError once too few indices remain.
+    """
+    # LOCAL VARIABLES
+    rejected_set = set()  # Indices known to hold an excluded entry
+    slot_list = range(len(index_list))  # Positions in index_list still to be checked
+
+    # REJECT AND RESAMPLE
+    while slot_list:
+        slot_list = [slot for slot in slot_list if file_list[index_list[slot]] in excluded]
+        if not slot_list:
+            break
+        rejected_set.update(index_list[slot] for slot in slot_list)
+        # Without replacement, the redraws must also avoid every index already picked
+        barred_set = rejected_set if replace else rejected_set.union(index_list)
+        for (slot, index) in zip(slot_list, rand_indices(len(file_list), len(slot_list),
+                                                         replace, engine, barred_set)):
+            index_list[slot] = index
+
+
+def _load_database(filename):
+    """Read and parse one newline-delimited file into the registry.
+
+    Lists served from a pack are left in place: only the comment-inclusive entries are parsed.
+    """
+    # LOCAL VARIABLES
+    abs_filename = os.path.abspath(filename)
+    # Take the signature first so an edit made while parsing is caught by the next check
+    signature = _get_signature(os.stat(abs_filename))
+    packed = isinstance(_DATABASE_REGISTRY.get((abs_filename, True)), GGPackedDatabase)
+
+    # INDEXED MODE
+    if _DATABASE_MODES.get(abs_filename) == DB_MODE_INDEXED:
+        for skip_comments in ((False,) if packed else (True, False)):
+            _DATABASE_REGISTRY[(abs_filename, skip_comments)] = \
+                GGIndexedDatabase(abs_filename, skip_comments)
+        _DATABASE_SIGNATURES[abs_filename] = signature
+        return
 
     # BUILD LIST
+    all_entries = _read_database(abs_filename, skip_comments=False)
+    # Store both variants so comment handling never requires another read
+    _DATABASE_REGISTRY[(abs_filename, False)] = all_entries
+    if not packed:
+        _DATABASE_REGISTRY[(abs_filename, True)] = [entry for entry in all_entries
+                                                    if not entry.startswith("#")]
+    _DATABASE_SIGNATURES[abs_filename] = signature
+
+
+def _forget_database(abs_filename, keep_packed=False):
+    """Drop one database's entries and signature from the registry.
+
+    Use keep_packed=True to keep a list served from a pack, dropping only its fallback entries.
+    """
+    for skip_comments in (True, False):
+        if keep_packed and isinstance(_DATABASE_REGISTRY.get((abs_filename, skip_comments)),
+                                      GGPackedDatabase):
+            continue
+        _release_entries(_DATABASE_REGISTRY.pop((abs_filename, skip_comments), None))
+    _DATABASE_SIGNATURES.pop(abs_filename, None)
+
+
+def _is_streamed(filename):
+    """Returns True if filename was set to DB_MODE_STREAM"""
+    return bool(_DATABASE_MODES) \
+        and _DATABASE_MODES.get(os.path.abspath(filename)) == DB_MODE_STREAM
+
+
+def _stream_samples(filename, num_tuples, num_samples, skip_comments=True, replace=True,
+                    engine=None, excluded=None):
+    """Reservoir sample num_samples lists of num_tuples entries in one pass over filename.
+
+    The file is read STREAM_CHUNK_SIZE bytes at a time so memory use is bounded by the chunk
+    size and the samples, regardless of the file's size.  Entries in excluded are skipped.
+    Reservoirs wait in a heap keyed by the next entry they want, so each entry only touches the
+    reservoirs due to take it: one pass costs O(N + takes * log(reservoirs)).
+    """
+    # LOCAL VARIABLES
+    local_engine = engine or get_rando_engine()
+    excluded_lines = {entry.encode(sys.getdefaultencoding()) for entry in excluded} \
+        if excluded else ()
+    entry_index = 0  # Number of entries streamed so far
+    leftover = b''  # Incomplete line carried over from the previous chunk
+    # Without replacement, one reservoir per sample.  With it, one single-entry reservoir per pick.
+    if replace:
+        reservoirs = [GGReservoir(1, local_engine) for _ in range(num_tuples * num_samples)]
+    else:
+        reservoirs = [GGReservoir(num_tuples, local_engine) for _ in range(num_samples)]
+    # (next wanted entry index, reservoir number, reservoir); empty reservoirs never want one
+    waiting = [(reservoir.next_index, reservoir_num, reservoir)
+               for (reservoir_num, reservoir) in enumerate(reservoirs) if reservoir.size]
+    heapq.heapify(waiting)
+
+    # STREAM ENTRIES
+    with open(filename, 'rb') as in_file:
+        while True:
+            chunk = in_file.read(STREAM_CHUNK_SIZE)
+            lines = (leftover + chunk).split(b'\n')
+            leftover = lines.pop() if chunk else b''
+            for line in lines:
+                if line.endswith(b'\r'):
+                    line = line[:-1]  # CRLF line ending, which memory mode's text reads drop
+                if not line or (skip_comments and line.startswith(b'#')) \
+                        or line in excluded_lines:
+                    continue
+                # Every reservoir due now wants a later entry after its offer
+                while waiting and waiting[0][0] == entry_index:
+                    (_, reservoir_num, reservoir) = waiting[0]
+                    reservoir.offer(entry_index, line)
+                    heapq.heapreplace(waiting, (reservoir.next_index, reservoir_num, reservoir))
+                entry_index += 1
+            if not chunk:
+                break
+
+    # VALIDATE
+    if num_tuples and not entry_index:
+        raise RuntimeError("Unable to sample from an empty population")
+    if not replace and num_tuples > entry_index:
+        raise RuntimeError(f"Unable to draw {num_tuples} distinct indices from a population "
+                           f"of {entry_index}")
+
+    # DECODE SAMPLES
+    if replace:
+        flat_list = [reservoir.items[0].decode(sys.getdefaultencoding())
+                     for reservoir in reservoirs]
+        ret_list = [flat_list[sample_num * num_tuples:(sample_num + 1) * num_tuples]
+                    for sample_num in range(num_samples)]
+    else:
+        ret_list = []
+        for reservoir in reservoirs:
+            local_engine.shuffle(reservoir.items)  # Reservoir order is biased towards file order
+            ret_list.append([item.decode(sys.getdefaultencoding()) for item in reservoir.items])
+
+    # DONE
+    return ret_list
+
+
+def _map_file(in_file):
+    """Returns a read-only mmap of an open file, raising RuntimeError if it can't be mapped"""
+    try:
+        return mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError as err:  # E.g., the file is empty or was truncated to empty
+        in_file.close()
+        raise RuntimeError(f'Unable to map {in_file.name}: {err}') from err
+
+
+def _get_signature(stat_result):
+    """Returns the (mtime, size, inode) change signature of an os.stat() result"""
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
+def _read_database(filename, skip_comments=True):
+    """Returns a list of the entries in one newline-delimited file"""
     # Open File
     with open(filename, 'r', encoding=sys.getdefaultencoding()) as in_file:
         # Read raw content
@@ -31,9 +801,11 @@ def pick_entries(filename, num_tuples, skip_comments=True):
     else:
         file_list = [entry for entry in file_content.split("\n") if entry]
 
-    # Choose List Entries
-    for _ in range(1, num_tuples + 1):
-        entry_list.append(random.choice(file_list))
-
     # DONE
-    return entry_list
+    return file_list
+
+
+def _release_entries(entries):
+    """Release any mappings held by a registry entry"""
+    if isinstance(entries, (GGIndexedDatabase, GGPackedDatabase)):
+        entries.close()
@@ -0,0 +1,65 @@
+"""Implements cached number formatting (e.g., "twelve", "3rd") shared by the whole package.
+
+inflect is slow to import and slow to call, so one engine is created the first time a number
+is formatted, and every result is memoized.  Creating the engine also precomputes the tables
+of levels and common counts that NPC lists are built from.
+"""
+
+# Standard
+from functools import lru_cache
+from typing import Dict, Final
+# Third Party
+# Local
+
+
+FORMAT_LEVELS: Final[range] = range(1, 21)  # Character and spell levels
+# NPC counts: small numbers and the powers of two that NPC level chains are made of
+FORMAT_COMMON_COUNTS: Final[tuple] = tuple(range(0, 101)) + tuple(2 ** power
+                                                                  for power in range(7, 13))
+FORMAT_CACHE_SIZE: Final[int] = 4096  # Memoized results for numbers outside the tables
+_INFLECT: Final[Dict[str, object]] = {}  # The shared inflect engine, created on first use
+_NUMBER_WORDS: Final[Dict[int, str]] = {}  # Precomputed number_to_words() table
+_ORDINALS: Final[Dict[int, str]] = {}  # Precomputed ordinal() table
+
+
+def number_to_words(number):
+    """Return number spelled out in words (e.g., 12 returns "twelve")"""
+    try:
+        return _NUMBER_WORDS[number]
+    except KeyError:
+        return _cached_number_to_words(number)
+
+
+def ordinal(number):
+    """Return number as an ordinal (e.g., 3 returns "3rd")"""
+    try:
+        return _ORDINALS[number]
+    except KeyError:
+        return _cached_ordinal(number)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _cached_number_to_words(number):
+    """Memoized number_to_words() for numbers outside the precomputed table"""
+    return _get_inflect_engine().number_to_words(number)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _cached_ordinal(number):
+    """Memoized ordinal() for numbers outside the precomputed table"""
+    return _get_inflect_engine().ordinal(number)
+
+
+def _get_inflect_engine():
+    """Return the shared inflect engine, importing inflect and filling the tables on first use"""
+    try:
+        return _INFLECT['engine']
+    except KeyError:
+        pass  # First use
+    import inflect  # Deferred: importing inflect takes seconds
+    engine = inflect.engine()
+    _NUMBER_WORDS.update((count, engine.number_to_words(count))
+                         for count in FORMAT_COMMON_COUNTS)
+    _ORDINALS.update((level, engine.ordinal(level)) for level in FORMAT_LEVELS)
+    _INFLECT['engine'] = engine
+    return engine
@@ -22,6 +22,8 @@ try:
     _MENU_CHOICE_START: Final[int] = _RACE_DICT_BEGIN[-1][0] + 1
 except IndexError:
     _MENU_CHOICE_START: Final[int] = 1
+# Menu choices that always mean Main Menu and Exit, so numbered lists skip them
+_MENU_RESERVED_CHOICES: Final[tuple] = (42, 999)
 # Lookup of race menu selection to actual race
 RACE_DICT: Final[dict] = \
     OrderedDict(_RACE_DICT_BEGIN + [(count + _MENU_CHOICE_START, value) for (count, value)
@@ -73,13 +75,15 @@ def clear_screen():
     subprocess.call([command], shell=True)
 
 
-def menu(city_dict=None):
-    """Top level menu."""
+def menu(city_dict=None, city_obj=None, atlas=None):
+    """Top level menu.  Pass either a city config dictionary or an already loaded GG_City.
+
+    Given a GGAtlas, the menu also offers a choice of the current city.
+    """
     clear_screen()
     user_input = 0
-    city_obj = None
 
-    if city_dict:
+    if city_dict and not city_obj:
         city_obj = GG_City(city_dict)
         city_obj.load()
 
@@ -92,6 +96,8 @@ def menu(city_dict=None):
         print('  3. Randomize a bounty')
         print('  4. City menu')
         print('  5. Clear screen')
+        if atlas:
+            print(f'  6. Choose a city (current: {_describe_city(city_obj)})')
         print('999. Exit')
         print('Choose an option [999]:')
         user_input = read_user_input()
@@ -105,10 +111,51 @@ def menu(city_dict=None):
             user_input = city_menu(city_obj)
         elif user_input == 5:
             clear_screen()
+        elif user_input == 6 and atlas:
+            city_obj = choose_a_city(atlas, city_obj)
         else:
             raise SystemExit('Exiting Gamemaster Guidance')
 
 
+def choose_a_city(atlas, city_obj=None):
+    """Choose the current city from an atlas, region by region.  Returns city_obj by default."""
+    region_choices = _number_choices(atlas.get_regions(), 2)
+    print('\n')
+    print('  1. No city')
+    for (count, region) in region_choices.items():
+        print(f'{count:3}. {region} ({len(atlas.get_region(region))} cities)')
+    print(' 42. Main Menu')
+    print('Choose an option [42]:')
+    user_input = read_user_input()
+
+    if user_input == 1:
+        city_obj = None
+    elif user_input in region_choices:
+        city_obj = _choose_a_region_city(atlas.get_region(region_choices[user_input]), city_obj)
+
+    return city_obj
+
+
+def _choose_a_region_city(city_list, city_obj):
+    """Choose one city of a region's city_list.  Returns city_obj if nothing was chosen."""
+    city_choices = _number_choices(city_list, 1)
+    print('\n')
+    for (count, region_city) in city_choices.items():
+        print(f'{count:3}. {_describe_city(region_city)}')
+    print(' 42. Main Menu')
+    print('Choose an option [42]:')
+    user_input = read_user_input()
+
+    return city_choices.get(user_input, city_obj)
+
+
+def _describe_city(city_obj):
+    """Return a short description of a city for the menus"""
+    if not city_obj:
+        return 'No city'
+    return f'{city_obj.name} ({city_obj.region})'
+
+
 def print_bounty_menu():
     """Print the bounty menu."""
     print('\n')
@@ -264,3 +311,15 @@ def read_user_input():
         user_choice = int(-1)
 
     return user_choice
+
+
+def _number_choices(options, start):
+    """Return {choice: option}, numbering options from start and skipping reserved choices"""
+    choice_dict = OrderedDict()
+    choice = start
+    for option in options:
+        while choice in _MENU_RESERVED_CHOICES:
+            choice += 1
+        choice_dict[choice] = option
+        choice += 1
+    return choice_dict
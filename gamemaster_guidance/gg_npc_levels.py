@@ -0,0 +1,119 @@
+"""Defines GGNpcLevelTable: a city's NPC citizen counts by class and level."""
+
+# Standard
+from array import array
+from itertools import accumulate
+from typing import Final
+# Third Party
+# Local
+
+
+NPC_MAX_LEVEL: Final[int] = 20  # NPC levels run from 1 to NPC_MAX_LEVEL
+_NPC_COUNT_TYPECODE: Final[str] = 'i'  # Signed 32-bit counts: plenty for any population
+
+
+class GGNpcLevelTable:
+    """NPC citizen counts stored as a compact classes x NPC_MAX_LEVEL integer matrix.
+
+    The matrix is one flat array, row by row: row classIndex[className] holds that class's
+    count at each level (column 0 is level 1).  Row totals are kept alongside.  to_dict()
+    derives the {className: {"Total": int, "Dict": {level: count}}} view on demand.
+    """
+
+    __slots__ = ('classIndex', 'counts', 'totals')
+
+    def __init__(self):
+        """Class constructor"""
+        self.classIndex = {}  # {className: row}
+        self.counts = array(_NPC_COUNT_TYPECODE)  # Flattened rows of NPC_MAX_LEVEL counts
+        self.totals = array(_NPC_COUNT_TYPECODE)  # Each row's total
+
+    def __len__(self):
+        """Number of classes (rows)"""
+        return len(self.classIndex)
+
+    def __contains__(self, className):
+        """True if the table has a row for className"""
+        return className in self.classIndex
+
+    def set_levels(self, className, levelCounts):
+        """Store className's counts, a sequence of NPC_MAX_LEVEL counts starting at level 1"""
+        # INPUT VALIDATION
+        if len(levelCounts) != NPC_MAX_LEVEL:
+            raise RuntimeError(f'Expected {NPC_MAX_LEVEL} level counts for {className}')
+
+        # STORE ROW
+        row = self._get_row(className)
+        self.counts[row * NPC_MAX_LEVEL:(row + 1) * NPC_MAX_LEVEL] = array(_NPC_COUNT_TYPECODE,
+                                                                          levelCounts)
+        self.totals[row] = sum(levelCounts)
+
+    def set_level(self, className, level, count):
+        """Store className's count of one level, leaving the class's other levels alone"""
+        # INPUT VALIDATION
+        if not 1 <= level <= NPC_MAX_LEVEL:
+            raise RuntimeError(f'Invalid NPC level: {level}')
+
+        # STORE COUNT
+        row = self._get_row(className)
+        position = row * NPC_MAX_LEVEL + level - 1
+        self.totals[row] += count - self.counts[position]
+        self.counts[position] = count
+
+    def get_levels(self, className):
+        """Return className's NPC_MAX_LEVEL counts, starting at level 1"""
+        row = self.classIndex[className]
+        return self.counts[row * NPC_MAX_LEVEL:(row + 1) * NPC_MAX_LEVEL]
+
+    def get_total(self, className):
+        """Return the number of className citizens"""
+        return self.totals[self.classIndex[className]]
+
+    def get_population(self):
+        """Return the number of citizens of every class"""
+        return sum(self.totals)
+
+    def to_dict(self):
+        """Return the {className: {"Total": int, "Dict": {level: count}}} view of the table"""
+        return {className: {"Total": self.totals[row],
+                            "Dict": dict(zip(range(1, NPC_MAX_LEVEL + 1),
+                                             self.get_levels(className)))}
+                for (className, row) in self.classIndex.items()}
+
+    def build_level_index(self):
+        """Index the table by minimum level for random citizen picks.
+
+        Returns {minLevel: ([cumulative count, ...], [(className, level), ...])} listing every
+        (class, level) with at least one citizen of minLevel or higher, so a random citizen
+        number maps to its class and level with one binary search.
+        """
+        # LOCAL VARIABLES
+        levelIndex = {}
+        counts = self.counts
+
+        # BUILD INDEX
+        for minLevel in range(1, NPC_MAX_LEVEL + 1):
+            citizenList = []
+            countList = []
+            for (className, row) in self.classIndex.items():
+                rowStart = row * NPC_MAX_LEVEL
+                for level in range(minLevel, NPC_MAX_LEVEL + 1):
+                    number = counts[rowStart + level - 1]
+                    if number > 0:
+                        citizenList.append((className, level))
+                        countList.append(number)
+            levelIndex[minLevel] = (list(accumulate(countList)), citizenList)
+
+        # DONE
+        return levelIndex
+
+    def _get_row(self, className):
+        """Return className's row, appending an empty one for a new class"""
+        try:
+            return self.classIndex[className]
+        except KeyError:
+            row = len(self.classIndex)
+            self.classIndex[className] = row
+            self.counts.extend([0] * NPC_MAX_LEVEL)
+            self.totals.append(0)
+            return row
@@ -1,14 +1,231 @@
 """Implement some randomization functions for the package."""
 
+# Standard
+from bisect import bisect_right
+from contextvars import ContextVar
+from typing import Final
+import hashlib
+import os
 import random
+# Third Party
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Optional: buffered blocks fall back on the standard library
+# Local
 
 
-def rand_percent():
+_SEED_BITS: Final[int] = 128  # Size of generated and derived seeds
+RANDO_BLOCK_SIZE: Final[int] = 4096  # Number of uniform values generated per buffered block
+_MAX_BUFFERED_RANGE: Final[int] = 1 << 32  # Wider integer ranges bypass the buffer
+
+
+class GGRandoEngine:
+    """Seedable random number generator that can spawn statistically independent child streams.
+
+    Every engine is identified by its root seed and spawn key (the path of spawn() calls that
+    created it).  An engine's stream is seeded by a hash of both, so the same seed always
+    reproduces the same engine tree and sibling streams never share state.  Engines pickle, so
+    children can be handed to other processes.
+
+    buffered_random() hands out uniform values from pre-generated blocks (NumPy when it's
+    installed) to amortize the per-call cost of the many small rolls made per entity.
+    """
+
+    def __init__(self, seed=None, spawn_key=()):
+        """Class constructor"""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(_SEED_BITS // 8), 'big')
+        if not isinstance(seed, (int, str)):
+            raise TypeError("seed is not an integer or string")
+        self.root_seed = seed
+        self.spawn_key = tuple(spawn_key)
+        self._num_children = 0  # Number of children spawned so far
+        self._rng = random.Random(self._derive_seed(seed, self.spawn_key))
+        self._block = iter(())  # Iterator over the pre-generated uniform values
+        self._numpy_rng = None  # NumPy block generator, created on first use
+
+    def spawn(self, num_children=1):
+        """Return a list of num_children new, independent child engines"""
+        child_list = []
+        for _ in range(num_children):
+            child_list.append(GGRandoEngine(self.root_seed,
+                                            self.spawn_key + (self._num_children,)))
+            self._num_children += 1
+        return child_list
+
+    def random(self):
+        """Return a float 0.0 <= n < 1.0"""
+        return self._rng.random()
+
+    def uniform(self, start, stop):
+        """Return a float between start and stop"""
+        return self._rng.uniform(start, stop)
+
+    def randint(self, min_val, max_val):
+        """Return an integer min <= n <= max"""
+        return self._rng.randint(min_val, max_val)
+
+    def randrange(self, stop):
+        """Return an integer 0 <= n < stop"""
+        return self._rng.randrange(stop)
+
+    def choice(self, seq):
+        """Return a random element of a non-empty sequence"""
+        return self._rng.choice(seq)
+
+    def choices(self, population, k=1):
+        """Return a list of k elements of population chosen with replacement"""
+        return self._rng.choices(population, k=k)
+
+    def sample(self, population, k):
+        """Return a list of k unique elements of population"""
+        return self._rng.sample(population, k)
+
+    def shuffle(self, seq):
+        """Shuffle a mutable sequence in place"""
+        self._rng.shuffle(seq)
+
+    def random_block(self, num_values):
+        """Return a list of num_values floats 0.0 <= n < 1.0 generated in one draw"""
+        if numpy is not None:
+            return self.get_numpy_rng().random(num_values).tolist()
+        rng_random = self._rng.random
+        return [rng_random() for _ in range(num_values)]
+
+    def buffered_random(self):
+        """Return a float 0.0 <= n < 1.0 from the current pre-generated block"""
+        try:
+            return next(self._block)
+        except StopIteration:
+            self._refill_block()
+            return next(self._block)
+
+    def dice_sums(self, num_dice, num_faces, num_rolls):
+        """Return a list of num_rolls totals of num_dice dice with num_faces faces each"""
+        if numpy is not None:
+            return self.get_numpy_rng().integers(1, num_faces + 1, size=(num_rolls, num_dice),
+                                                  dtype=numpy.int64).sum(axis=1).tolist()
+        buffered_random = self.buffered_random
+        return [num_dice + sum(int(buffered_random() * num_faces) for _ in range(num_dice))
+                for _ in range(num_rolls)]
+
+    def get_numpy_rng(self):
+        """Return this engine's NumPy generator, creating it on first use"""
+        if numpy is None:
+            raise RuntimeError("NumPy is not installed")
+        if self._numpy_rng is None:
+            # A separate, derived stream so NumPy draws don't depend on the other draws
+            self._numpy_rng = numpy.random.default_rng(
+                self._derive_seed(self.root_seed, self.spawn_key + ('block',)))
+        return self._numpy_rng
+
+    def _refill_block(self):
+        """Generate the next block of RANDO_BLOCK_SIZE uniform values"""
+        if numpy is not None:
+            self._block = iter(self.get_numpy_rng().random(RANDO_BLOCK_SIZE).tolist())
+        else:
+            rng_random = self._rng.random
+            self._block = iter([rng_random() for _ in range(RANDO_BLOCK_SIZE)])
+
+    @staticmethod
+    def _derive_seed(seed, spawn_key):
+        """Hash a root seed and spawn key into a stream seed"""
+        digest = hashlib.sha256(repr((seed, spawn_key)).encode('utf-8')).digest()
+        return int.from_bytes(digest[:_SEED_BITS // 8], 'big')
+
+
+class GGWeightedSampler:
+    """Draws outcomes in proportion to their weights in O(1) time using Vose's alias method.
+
+    Build the alias table once per weight table, then call sample() as often as needed.
+    """
+
+    def __init__(self, outcomes, weights):
+        """Class constructor"""
+        # LOCAL VARIABLES
+        self.outcomes = list(outcomes)
+        weight_list = [float(weight) for weight in weights]
+        num_outcomes = len(self.outcomes)
+        total_weight = sum(weight_list)
+
+        # INPUT VALIDATION
+        if num_outcomes != len(weight_list):
+            raise RuntimeError("Every outcome needs exactly one weight")
+        if any(weight < 0.0 for weight in weight_list):
+            raise RuntimeError("Weights may not be negative")
+        if total_weight <= 0.0:
+            raise RuntimeError("Unable to sample without a positive total weight")
+
+        # BUILD ALIAS TABLE
+        self._probability = [1.0] * num_outcomes  # Chance to keep column i instead of its alias
+        self._alias = list(range(num_outcomes))
+        scaled = [weight * num_outcomes / total_weight for weight in weight_list]
+        small = [index for (index, value) in enumerate(scaled) if value < 1.0]
+        large = [index for (index, value) in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            small_index = small.pop()
+            large_index = large.pop()
+            self._probability[small_index] = scaled[small_index]
+            self._alias[small_index] = large_index
+            scaled[large_index] = (scaled[large_index] + scaled[small_index]) - 1.0
+            if scaled[large_index] < 1.0:
+                small.append(large_index)
+            else:
+                large.append(large_index)
+        # Anything left over is 1.0 give or take floating point error
+
+    def sample(self, num_samples=None, engine=None):
+        """Return one weighted outcome, or a list of num_samples outcomes"""
+        # LOCAL VARIABLES
+        local_engine = engine or get_rando_engine()
+        num_columns = len(self.outcomes)
+
+        # ONE OUTCOME
+        if num_samples is None:
+            column = local_engine.randrange(num_columns)
+            if local_engine.random() < self._probability[column]:
+                return self.outcomes[column]
+            return self.outcomes[self._alias[column]]
+
+        # MANY OUTCOMES
+        columns = local_engine.choices(range(num_columns), k=num_samples)
+        return [self.outcomes[column] if local_engine.random() < self._probability[column]
+                else self.outcomes[self._alias[column]] for column in columns]
+
+
+# Process-wide default engine, replaced by seed_rando()
+_DEFAULT_ENGINE = {'engine': GGRandoEngine()}
+# Per-context engine, set by set_rando_engine() (e.g., inside a worker thread)
+_CONTEXT_ENGINE: ContextVar = ContextVar('gg_rando_engine', default=None)
+
+
+def get_rando_engine():
+    """Return the current context's engine, falling back on the process-wide default"""
+    engine = _CONTEXT_ENGINE.get()
+    if engine is None:
+        engine = _DEFAULT_ENGINE['engine']
+    return engine
+
+
+def set_rando_engine(engine):
+    """Use engine for the current context (thread or task) only"""
+    _CONTEXT_ENGINE.set(engine)
+
+
+def seed_rando(seed=None):
+    """Replace the process-wide default engine with one seeded by seed.  Returns the engine."""
+    _DEFAULT_ENGINE['engine'] = GGRandoEngine(seed)
+    return _DEFAULT_ENGINE['engine']
+
+
+def rand_percent(engine=None):
     """Return an integer between 1 and 100"""
-    return int(100 * random.uniform(0.01, 1.0))
+    # Same as int(100 * uniform(0.01, 1.0)), using a buffered value
+    return int(100 * (0.01 + (0.99 * (engine or get_rando_engine()).buffered_random())))
 
 
-def rand_integer(min_val, max_val):
+def rand_integer(min_val, max_val, engine=None):
     """Return an integer min <= n <= max"""
     # LOCAL VARIABLES
     ret_int = None
@@ -26,16 +243,126 @@ def rand_integer(min_val, max_val):
         local_max = min_val
 
     # RANDO
-    try:
-        ret_int = random.randint(local_min, local_max)
-    except Exception as err:
-        print(repr(err))
-        raise err
+    local_engine = engine or get_rando_engine()
+    if local_max - local_min < _MAX_BUFFERED_RANGE:
+        ret_int = local_min + int(local_engine.buffered_random() * (local_max - local_min + 1))
+    else:
+        try:
+            ret_int = local_engine.randint(local_min, local_max)
+        except Exception as err:
+            print(repr(err))
+            raise err
 
     # DONE
     return ret_int
 
 
-def rand_float(start, stop):
+def rand_float(start, stop, engine=None):
     """Return a random float between start and stop"""
-    return random.uniform(start, stop)
+    return (engine or get_rando_engine()).uniform(start, stop)
+
+
+def rand_choice(seq, engine=None, excluded=None):
+    """Return a random element of a non-empty sequence that isn't in the excluded collection"""
+    if not excluded:
+        return (engine or get_rando_engine()).choice(seq)
+    return seq[rand_indices(len(seq), 1, engine=engine,
+                            excluded_indices=[index for (index, item) in enumerate(seq)
+                                              if item in excluded])[0]]
+
+
+def rand_indices(population_size, num_indices, replace=True, engine=None,
+                 excluded_indices=None):
+    """Return a list of num_indices random indices, 0 <= n < population_size, in one draw.
+
+    Without replacement (replace=False) every index in the list is distinct.  Indices in
+    excluded_indices are never returned: the draw is made directly from the remaining indices,
+    so exclusions cost O(log k) per index instead of a retry loop.
+    """
+    # LOCAL VARIABLES
+    local_engine = engine or get_rando_engine()
+    shifts = []  # The j-th sorted exclusion, e_j, shifts remaining indices >= e_j - j up by one
+    if excluded_indices:
+        shifts = [index - shift for (shift, index)
+                  in enumerate(sorted({index for index in excluded_indices
+                                       if 0 <= index < population_size}))]
+
+    # INPUT VALIDATION
+    _validate_index_draw(population_size, num_indices, replace, len(shifts))
+    remaining = population_size - len(shifts)
+
+    # RANDO
+    if replace:
+        ret_list = local_engine.choices(range(remaining), k=num_indices)
+    else:
+        ret_list = local_engine.sample(range(remaining), num_indices)
+    if shifts:
+        ret_list = [index + bisect_right(shifts, index) for index in ret_list]
+
+    # DONE
+    return ret_list
+
+
+def rand_index_samples(population_size, num_indices, num_samples, replace=True, engine=None):
+    """Return num_samples independent lists of num_indices random indices.
+
+    The replace argument applies within each sample; samples are independent of each other.
+    Every index of every sample comes from one engine draw.  Without replacement, that draw is
+    a block of uniform values and each sample is a partial Fisher-Yates shuffle of its row.
+    """
+    # LOCAL VARIABLES
+    local_engine = engine or get_rando_engine()
+
+    # INPUT VALIDATION
+    _validate_index_draw(population_size, num_indices, replace)
+    if num_samples < 0:
+        raise RuntimeError(f"Invalid number of samples: {num_samples}")
+
+    # RANDO
+    if replace:
+        flat_list = local_engine.choices(range(population_size), k=num_indices * num_samples)
+        return [flat_list[sample_num * num_indices:(sample_num + 1) * num_indices]
+                for sample_num in range(num_samples)]
+    if population_size > _MAX_BUFFERED_RANGE:
+        # Too wide for float uniforms to pick every index evenly
+        return [local_engine.sample(range(population_size), num_indices)
+                for _ in range(num_samples)]
+    uniform_list = local_engine.random_block(num_indices * num_samples)
+    return [_partial_shuffle(population_size,
+                             uniform_list[sample_num * num_indices:(sample_num + 1) * num_indices])
+            for sample_num in range(num_samples)]
+
+
+def _partial_shuffle(population_size, uniform_list):
+    """Return len(uniform_list) distinct indices: a Fisher-Yates shuffle stopped early.
+
+    Only the swapped positions are stored, so it costs O(k) regardless of population_size.
+    """
+    # LOCAL VARIABLES
+    swapped = {}  # {position: index now at that position}, for positions touched so far
+    ret_list = []
+
+    # SHUFFLE
+    for (position, uniform) in enumerate(uniform_list):
+        chosen = position + int(uniform * (population_size - position))
+        ret_list.append(swapped.get(chosen, chosen))
+        swapped[chosen] = swapped.get(position, position)
+
+    # DONE
+    return ret_list
+
+
+def _validate_index_draw(population_size, num_indices, replace, num_excluded=0):
+    """Raise if num_indices can't be drawn from population_size less num_excluded indices"""
+    if not isinstance(population_size, int):
+        raise TypeError("population_size is not an integer")
+    if not isinstance(num_indices, int):
+        raise TypeError("num_indices is not an integer")
+    if num_indices < 0:
+        raise RuntimeError(f"Invalid number of indices: {num_indices}")
+    remaining = population_size - num_excluded
+    if num_indices and remaining < 1:
+        raise RuntimeError("Unable to sample from an empty population")
+    if not replace and num_indices > remaining:
+        raise RuntimeError(f"Unable to draw {num_indices} distinct indices from a population "
+                           f"of {remaining}")
@@ -0,0 +1,66 @@
+"""Defines lightweight, immutable records of generated characters.
+
+Records are tuples: no per-instance __dict__ and no references back to the city object, so
+holding tens of thousands of generated NPCs stays cheap.  GGAncestry, GGCharacter, and GGBounty
+produce them with to_record() and generate_records().
+"""
+
+# Standard
+from typing import NamedTuple, Optional, Tuple
+# Third Party
+# Local
+
+
+class GGAncestryRecord(NamedTuple):
+    """A generated name and ancestry"""
+    full_name: str
+    given_name: str
+    surname: str
+    ancestry: str
+    ethnicity: Optional[str]
+    subgroup: Optional[str]
+    gender: str
+    notes: Tuple[str, ...]
+
+
+class GGCharacterRecord(NamedTuple):
+    """A generated character: GGAncestryRecord fields plus traits"""
+    full_name: str
+    given_name: str
+    surname: str
+    ancestry: str
+    ethnicity: Optional[str]
+    subgroup: Optional[str]
+    gender: str
+    notes: Tuple[str, ...]
+    traits: Tuple[str, ...]
+
+
+class GGBountyRecord(NamedTuple):
+    """A generated bounty: GGCharacterRecord fields plus the bounty details"""
+    full_name: str
+    given_name: str
+    surname: str
+    ancestry: str
+    ethnicity: Optional[str]
+    subgroup: Optional[str]
+    gender: str
+    notes: Tuple[str, ...]
+    traits: Tuple[str, ...]
+    reward: str
+    wanted_status: str
+    char_class: str
+    level: int
+    crimes: Tuple[str, ...]
+    crime_type: int
+    complications: Tuple[str, ...]
+    bounty_source: str
+
+
+def freeze_notes(notes):
+    """Convert a None, str, or list notes attribute into a tuple of notes"""
+    if notes is None:
+        return ()
+    if isinstance(notes, str):
+        return (notes,)
+    return tuple(notes)
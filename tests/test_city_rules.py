@@ -0,0 +1,195 @@
+"""Regression checks: the settlement rules table matches the original if-chain calculations."""
+
+# Standard
+import unittest
+# Third Party
+# Local
+from gamemaster_guidance.gg_city import GG_City
+from gamemaster_guidance.gg_city_rules import CITY_MAX_SPELLCASTING
+from gamemaster_guidance.gg_globals import (ANCESTRY_LIST, GG_CITY_RACE_HUMAN,
+                                            HUMAN_ETHNICITY_LIST)
+from gamemaster_guidance.gg_rando import GGRandoEngine
+
+
+NUM_RANDOM_CITIES = 200  # Randomized cities checked against the reference calculations
+RACIALLY_INTOLERANT_QUALITIES = ['Racially Intolerant', 'Racially Intolerant (Elves)',
+                                 'Racially Intolerant - Elves', 'Racially Intolerant Elves']
+
+
+
+def _make_city_dict(**details):
+    """Return a test cityDict with an even ancestry mix and any other city details"""
+    ancestry = {ancestry: 10 for ancestry in ANCESTRY_LIST}
+    ancestry[GG_CITY_RACE_HUMAN] = {ethnicity: 1 for ethnicity in HUMAN_ETHNICITY_LIST}
+    return {"city": {"name": "Test City", "region": "Test Region", "ancestry": ancestry,
+                     **details}}
+
+
+def _reference_modifiers(alignment, government, qualities, disadvantages, base):
+    """The original if-chains: return {modifier: value}"""
+    corruption = crime = economy = law = lore = society = base
+    # Alignment
+    if alignment.endswith("Evil"):
+        corruption += 1
+    if alignment.startswith("Chaotic"):
+        crime += 1
+    if alignment.startswith("Lawful"):
+        law += 1
+    if alignment == "Neutral":
+        lore += 2
+    elif alignment.endswith("Neutral"):
+        lore += 1
+    if alignment.endswith("Good"):
+        society += 1
+    # Government
+    if government == "Council":
+        law -= 2
+        lore -= 2
+        society += 4
+    elif government == "Magical":
+        corruption -= 2
+        lore += 2
+        society -= 2
+    elif government == "Overlord":
+        corruption += 2
+        crime -= 2
+        law += 2
+        society -= 2
+    elif government == "Secret Syndicate":
+        corruption += 2
+        crime += 2
+        economy += 2
+        law -= 6
+    # Qualities
+    if "Holy Site" in qualities:
+        corruption -= 2
+    if "Insular" in qualities:
+        crime -= 1
+        law += 1
+    if "Notorious" in qualities:
+        crime += 1
+        law -= 1
+    if "Superstitious" in qualities:
+        crime -= 4
+        law += 2
+        society += 2
+    if "Prosperous" in qualities:
+        economy += 1
+    if "Strategic Location" in qualities:
+        economy += 1
+    if "Tourist Attraction" in qualities:
+        economy += 1
+    if "Academic" in qualities:
+        lore += 1
+    if "Rumormongering Citizens" in qualities:
+        lore += 1
+        society -= 1
+    # Disadvantages
+    if "Anarchy" in disadvantages:
+        corruption += 4
+        crime += 4
+        economy -= 4
+        law -= 6
+        society -= 4
+    if "Impoverished" in disadvantages:
+        corruption += 1
+        crime += 1
+    if "Hunted" in disadvantages:
+        economy -= 4
+        law -= 4
+        society -= 4
+
+    # DONE
+    return {"corruption": str(corruption), "crime": str(crime), "economy": str(economy),
+            "law": str(law), "lore": str(lore), "society": str(society)}
+
+
+def _reference_base_value(qualities, disadvantages, base_value):
+    """The original if-chains: return the adjusted base value"""
+    adjustPercent = 100
+    for (quality, percent) in (("Magically Attuned", 20), ("Notorious", 30),
+                               ("Prosperous", 30), ("Strategic Location", 10),
+                               ("Tourist Attraction", 20)):
+        if quality in qualities:
+            adjustPercent += percent
+    for (disadvantage, percent) in (("Hunted", 20), ("Impoverished", 50), ("Plagued", 20)):
+        if disadvantage in disadvantages:
+            adjustPercent -= percent
+    return str(int(base_value * adjustPercent * .01))
+
+
+def _reference_purchase_limit(qualities, disadvantages, purchase_limit):
+    """The original if-chains: return the adjusted purchase limit"""
+    adjustPercent = 100
+    for (quality, percent) in (("Magically Attuned", 20), ("Notorious", 50),
+                               ("Prosperous", 50)):
+        if quality in qualities:
+            adjustPercent += percent
+    if "Impoverished" in disadvantages:
+        adjustPercent -= 50
+    return str(int(purchase_limit * adjustPercent * .01))
+
+
+def _reference_spellcasting(government, qualities, spellcasting):
+    """The original if-chains: return the adjusted spellcasting"""
+    if government == "Magical":
+        spellcasting += 1
+    for (quality, levels) in (("Academic", 1), ("Holy Site", 2), ("Magically Attuned", 2),
+                              ("Pious", 1), ("Superstitious", -2)):
+        if quality in qualities:
+            spellcasting += levels
+    return str(min(spellcasting, CITY_MAX_SPELLCASTING))
+
+
+class TestCityRules(unittest.TestCase):
+    """Compare GG_City's rule table results with the reference if-chains"""
+
+    def setUp(self):
+        """Use the settlement statistics the rules adjust"""
+        self.statistics = GG_City.settlementStatistics
+
+    def check_city(self, city):
+        """Assert city's calculated statistics match the reference calculations"""
+        details = city.cityDict["city"]
+        qualities = details["qualities"]
+        disadvantages = details.get("disadvantages") or []
+        statistics = self.statistics[details["type"]]
+
+        self.assertEqual(details["modifiers"],
+                         _reference_modifiers(details["alignment"], details["government"],
+                                              qualities, disadvantages,
+                                              statistics["Modifiers"]))
+        self.assertEqual(details["base_value"],
+                         _reference_base_value(qualities, disadvantages,
+                                               statistics["Base Value"]))
+        self.assertEqual(details["purchase_limit"],
+                         _reference_purchase_limit(qualities, disadvantages,
+                                                   statistics["Purchase Limit"]))
+        self.assertEqual(details["spellcasting"],
+                         _reference_spellcasting(details["government"], qualities,
+                                                 statistics["Spellcasting"]))
+
+    def test_random_cities(self):
+        """Randomized alignments, governments, qualities, and disadvantages"""
+        for seed in range(NUM_RANDOM_CITIES):
+            city = GG_City(_make_city_dict(), GGRandoEngine(seed))
+            city.complete()
+            self.check_city(city)
+
+    def test_racially_intolerant_details(self):
+        """Every Racially Intolerant spelling the original validation accepted still loads"""
+        for (seed, quality) in enumerate(RACIALLY_INTOLERANT_QUALITIES):
+            city = GG_City(_make_city_dict(qualities=[quality, "Prosperous"]),
+                           GGRandoEngine(seed))
+            city.complete()
+            self.check_city(city)
+
+    def test_unsupported_quality(self):
+        """Qualities without a rule are still rejected"""
+        for quality in ("Academically Gifted", "Intolerant"):
+            with self.assertRaises(RuntimeError):
+                GG_City(_make_city_dict(qualities=[quality]), GGRandoEngine(0)).load()
+
+
+if __name__ == '__main__':
+    unittest.main()